@@ -11,18 +11,37 @@ Deliverables:
 
 import pandas as pd
 import numpy as np
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass, field, asdict
+from typing import Callable, Dict, FrozenSet, List, Optional, Any, Tuple
+from functools import cached_property, lru_cache, partial
+from operator import attrgetter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 import json
+import sys
 from enum import Enum
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib encoder
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # Optional: the MessagePack sidecar is skipped without it
+    msgspec = None
+
+try:
+    import pyarrow
+except ImportError:  # Optional: Parquet twins of the CSV outputs are skipped without it
+    pyarrow = None
+
 # Import base scenario modeler
 from .ws5_scenarios import (
     ScenarioModeler, ScenarioType, Scenario,
-    DemographicProjection, EconomicProjection, SpatialProjection
+    DemographicProjection, EconomicProjection, SpatialProjection, PROJECTION_YEARS
 )
 
 
@@ -45,7 +64,7 @@ class ExtendedScenarioType(Enum):
 # ADDITIONAL DATA CLASSES
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ClimateProjection:
     """Climate-related projections for a scenario."""
     year: int
@@ -58,7 +77,7 @@ class ClimateProjection:
     energy_demand_increase_pct: float
 
 
-@dataclass
+@dataclass(slots=True)
 class TechnologyProjection:
     """Technology adoption projections."""
     year: int
@@ -70,7 +89,7 @@ class TechnologyProjection:
     remote_work_adoption_pct: float
 
 
-@dataclass
+@dataclass(slots=True)
 class RegionalScenarioProjection:
     """Regional-level scenario projection."""
     region: str
@@ -84,32 +103,141 @@ class RegionalScenarioProjection:
     investment_priority: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class RailNetwork:
+    """Rail network extent by 2050."""
+    total_km: int
+    high_speed_km: int
+    freight_km: int
+
+
+@dataclass(frozen=True, slots=True)
+class AirportPlan:
+    """Airport network by 2050."""
+    international: int
+    regional: int
+    total_capacity_mppa: int
+
+
+@dataclass(frozen=True, slots=True)
+class PortPlan:
+    """Port network by 2050."""
+    major_ports: int
+    capacity_mteu: int
+
+
+@dataclass(frozen=True, slots=True)
+class RenewableEnergyPlan:
+    """Renewable energy capacity by 2050."""
+    solar_gw: int
+    wind_gw: int
+    hydrogen_plants: int
+
+
+@dataclass(frozen=True, slots=True)
+class WaterPlan:
+    """Water infrastructure by 2050."""
+    desalination_mcm_day: int
+    recycling_pct: int
+
+
+@dataclass(frozen=True, slots=True)
+class InfrastructureProjection:
+    """Major infrastructure projects for a scenario by 2050."""
+    rail: RailNetwork
+    airports: AirportPlan
+    ports: PortPlan
+    renewable_energy: RenewableEnergyPlan
+    water: WaterPlan
+
+
+# Assessment levels, indexed by code - 1 (codes double as scores 1-4)
+LEVELS = ('low', 'medium', 'high', 'critical')
+LEVEL_CODES = {level: code for code, level in enumerate(LEVELS, start=1)}
+
+# Artifact families WS5ReportGenerator can write
+REPORT_FORMATS = frozenset({'json', 'csv', 'markdown'})
+
+# Scenario column order of the report heatmap tables
+SCENARIO_COLUMNS = ('baseline', 'vision2030', 'accelerated', 'conservative',
+                    'climate_stress', 'tech_disruption', 'energy_transition')
+
+# Region/scenario groupings used by the assessment and map rules
+_INNOVATION_HUB_REGIONS = frozenset({'Riyadh', 'Tabuk', 'Eastern Province'})
+_RENEWABLE_NORTH = frozenset({'Tabuk', 'Northern Borders', 'Al-Jouf'})
+_SOLAR_NORTH = frozenset({'Northern Borders', 'Al-Jouf'})
+_VISION_LIKE = frozenset({'vision2030', 'accelerated'})
+_HIGH_GROWTH_SCENARIOS = frozenset({'vision2030', 'accelerated', 'tech_disruption'})
+_TRANSITION_SHOCK_SCENARIOS = frozenset({'energy_transition', 'climate_stress'})
+_CRITICAL_OR_HIGH_WATER = frozenset({'critical', 'high'})
+
+
+@dataclass(frozen=True, slots=True)
 class RiskAssessment:
     """Risk assessment for a region under a scenario."""
     region: str
     scenario: str
-    climate_risk: str  # critical, high, medium, low
-    economic_risk: str
-    social_risk: str
-    infrastructure_risk: str
+    climate_code: int  # 1-4, see LEVELS
+    economic_code: int
+    social_code: int
+    infrastructure_code: int
     overall_risk_score: float  # 0-10
-    key_vulnerabilities: List[str]
-    mitigation_priorities: List[str]
+    key_vulnerabilities: Tuple[str, ...]
+    mitigation_priorities: Tuple[str, ...]
+    
+    @property
+    def climate_risk(self) -> str:
+        """Climate risk level (critical, high, medium, low)."""
+        return LEVELS[self.climate_code - 1]
+    
+    @property
+    def economic_risk(self) -> str:
+        """Economic risk level."""
+        return LEVELS[self.economic_code - 1]
+    
+    @property
+    def social_risk(self) -> str:
+        """Social risk level."""
+        return LEVELS[self.social_code - 1]
+    
+    @property
+    def infrastructure_risk(self) -> str:
+        """Infrastructure risk level."""
+        return LEVELS[self.infrastructure_code - 1]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OpportunityAssessment:
     """Opportunity assessment for a region under a scenario."""
     region: str
     scenario: str
-    economic_opportunity: str  # high, medium, low
-    innovation_potential: str
-    sustainability_leadership: str
-    quality_of_life_improvement: str
+    economic_code: int  # 1-3, see LEVELS
+    innovation_code: int
+    sustainability_code: int
+    quality_of_life_code: int
     overall_opportunity_score: float  # 0-10
-    key_opportunities: List[str]
-    investment_recommendations: List[str]
+    key_opportunities: Tuple[str, ...]
+    investment_recommendations: Tuple[str, ...]
+    
+    @property
+    def economic_opportunity(self) -> str:
+        """Economic opportunity level (high, medium, low)."""
+        return LEVELS[self.economic_code - 1]
+    
+    @property
+    def innovation_potential(self) -> str:
+        """Innovation potential level."""
+        return LEVELS[self.innovation_code - 1]
+    
+    @property
+    def sustainability_leadership(self) -> str:
+        """Sustainability leadership level."""
+        return LEVELS[self.sustainability_code - 1]
+    
+    @property
+    def quality_of_life_improvement(self) -> str:
+        """Quality of life improvement level."""
+        return LEVELS[self.quality_of_life_code - 1]
 
 
 # =============================================================================
@@ -139,7 +267,7 @@ class ExtendedScenarioBuilder:
         
         demographics = []
         base_pop = 36.4
-        for year in [2025, 2030, 2040, 2050]:
+        for year in PROJECTION_YEARS:
             years = year - 2024
             # Lower growth due to climate migration
             pop = base_pop * (1.010 ** years)
@@ -155,11 +283,11 @@ class ExtendedScenarioBuilder:
         
         economics = []
         base_gdp = 1108
-        for year in [2025, 2030, 2040, 2050]:
+        for i, year in enumerate(PROJECTION_YEARS):
             years = year - 2024
             # Climate impacts reduce growth
             gdp = base_gdp * (1.015 ** years)  # 1.5% growth
-            pop_millions = demographics[[2025,2030,2040,2050].index(year)].total_population
+            pop_millions = demographics[i].total_population
             economics.append(EconomicProjection(
                 year=year,
                 gdp_billion_usd=gdp,
@@ -172,7 +300,7 @@ class ExtendedScenarioBuilder:
             ))
         
         spatial = []
-        for year in [2025, 2030, 2040, 2050]:
+        for year in PROJECTION_YEARS:
             years = year - 2024
             spatial.append(SpatialProjection(
                 year=year,
@@ -226,7 +354,7 @@ class ExtendedScenarioBuilder:
         
         demographics = []
         base_pop = 36.4
-        for year in [2025, 2030, 2040, 2050]:
+        for year in PROJECTION_YEARS:
             years = year - 2024
             pop = base_pop * (1.020 ** years)
             demographics.append(DemographicProjection(
@@ -241,11 +369,11 @@ class ExtendedScenarioBuilder:
         
         economics = []
         base_gdp = 1108
-        for year in [2025, 2030, 2040, 2050]:
+        for i, year in enumerate(PROJECTION_YEARS):
             years = year - 2024
             # High growth but volatile
             gdp = base_gdp * (1.06 ** years)
-            pop_millions = demographics[[2025,2030,2040,2050].index(year)].total_population
+            pop_millions = demographics[i].total_population
             economics.append(EconomicProjection(
                 year=year,
                 gdp_billion_usd=gdp,
@@ -258,7 +386,7 @@ class ExtendedScenarioBuilder:
             ))
         
         spatial = []
-        for year in [2025, 2030, 2040, 2050]:
+        for year in PROJECTION_YEARS:
             years = year - 2024
             spatial.append(SpatialProjection(
                 year=year,
@@ -312,7 +440,7 @@ class ExtendedScenarioBuilder:
         
         demographics = []
         base_pop = 36.4
-        for year in [2025, 2030, 2040, 2050]:
+        for year in PROJECTION_YEARS:
             years = year - 2024
             pop = base_pop * (1.018 ** years)
             demographics.append(DemographicProjection(
@@ -327,14 +455,14 @@ class ExtendedScenarioBuilder:
         
         economics = []
         base_gdp = 1108
-        for year in [2025, 2030, 2040, 2050]:
+        for i, year in enumerate(PROJECTION_YEARS):
             years = year - 2024
             # U-shaped growth: decline then recovery
             if years <= 10:
                 gdp = base_gdp * (1.02 ** years)  # Slower during transition
             else:
                 gdp = base_gdp * (1.02 ** 10) * (1.05 ** (years - 10))  # Recovery
-            pop_millions = demographics[[2025,2030,2040,2050].index(year)].total_population
+            pop_millions = demographics[i].total_population
             
             # Oil share collapses
             oil_share = max(38 - years * 2.5, 5) if years <= 15 else 5
@@ -351,7 +479,7 @@ class ExtendedScenarioBuilder:
             ))
         
         spatial = []
-        for year in [2025, 2030, 2040, 2050]:
+        for year in PROJECTION_YEARS:
             years = year - 2024
             spatial.append(SpatialProjection(
                 year=year,
@@ -543,12 +671,20 @@ class RegionalScenarioProjector:
         'energy_transition': {'growth': 0.9, 'water': 0.85, 'diversification': 2.5}
     }
     
+    # Intern the keys so equality checks against them short-circuit on identity
+    REGIONAL_PROFILES = {sys.intern(k): v for k, v in REGIONAL_PROFILES.items()}
+    SCENARIO_ADJUSTMENTS = {sys.intern(k): v for k, v in SCENARIO_ADJUSTMENTS.items()}
+    
+    # Water stress scale, ordered by severity
+    WATER_STRESS_LEVELS = ('low', 'medium', 'high', 'critical', 'extreme')
+    
     def __init__(self):
         """Initialize regional projector."""
         logger.info("Regional Scenario Projector initialized with 13 regions")
     
     def project_region(self, region: str, scenario: str, year: int) -> RegionalScenarioProjection:
         """Project regional outcomes for a scenario and year."""
+        region, scenario = sys.intern(region), sys.intern(scenario)
         profile = self.REGIONAL_PROFILES.get(region)
         adjustment = self.SCENARIO_ADJUSTMENTS.get(scenario)
         
@@ -565,11 +701,10 @@ class RegionalScenarioProjector:
         gdp_share = profile['gdp_share_2024'] * (1 + 0.01 * gdp_growth * years)
         
         # Water stress evolution
-        water_stress_levels = ['low', 'medium', 'high', 'critical', 'extreme']
-        base_idx = water_stress_levels.index(profile['water_stress_base'])
+        base_idx = self.WATER_STRESS_LEVELS.index(profile['water_stress_base'])
         stress_change = int(adjustment['water'] * years / 10)
         new_idx = min(4, base_idx + stress_change)
-        water_stress = water_stress_levels[new_idx]
+        water_stress = self.WATER_STRESS_LEVELS[new_idx]
         
         # Determine investment priority based on growth potential
         if gdp_growth > 1.3:
@@ -599,77 +734,335 @@ class RegionalScenarioProjector:
             self.project_region(region, scenario, year)
             for region in self.REGIONAL_PROFILES.keys()
         ]
+    
+    def project_batch(self, pairs: List[Tuple[str, int]]) -> pd.DataFrame:
+        """Project all regions for many (scenario, year) pairs in one vectorized pass.
+        
+        Same rules and values as project_region, broadcast as (pairs, regions):
+        capped values are the int cap, as min() returns it. Rows are ordered by
+        pair, then by REGIONAL_PROFILES; key_sectors is not included.
+        """
+        for scenario, _ in pairs:
+            if scenario not in self.SCENARIO_ADJUSTMENTS:
+                raise ValueError(f"Unknown scenario: {scenario}")
+        
+        profiles = list(self.REGIONAL_PROFILES.values())
+        growth_factor = np.array([p['growth_factor'] for p in profiles])
+        pop_2024 = np.array([p['pop_2024'] for p in profiles])
+        gdp_share_2024 = np.array([p['gdp_share_2024'] for p in profiles])
+        base_idx = np.array([self.WATER_STRESS_LEVELS.index(p['water_stress_base']) for p in profiles])
+        
+        # Scenario/year terms as (pairs, 1) columns
+        growth_adj = np.array([[self.SCENARIO_ADJUSTMENTS[s]['growth']] for s, _ in pairs])
+        water_adj = np.array([[self.SCENARIO_ADJUSTMENTS[s]['water']] for s, _ in pairs])
+        years = np.array([[year - 2024] for _, year in pairs])
+        
+        growth_rate = 1 + (0.02 * growth_factor * growth_adj)
+        # Python's float pow, as project_region; NumPy's vectorized pow may differ in the last bit
+        pop = (pop_2024 * np.power(growth_rate.astype(object), years.astype(object))).astype(np.float64)
+        gdp_growth = growth_factor * growth_adj
+        gdp_share = gdp_share_2024 * (1 + 0.01 * gdp_growth * years)
+        urbanization = np.broadcast_to(85 + years * 0.4, gdp_share.shape)
+        stress_change = (water_adj * years / 10).astype(int)
+        new_idx = np.minimum(4, base_idx + stress_change)
+        priority = np.select(
+            [gdp_growth > 1.3, gdp_growth > 1.0, gdp_growth > 0.7],
+            ['strategic', 'high', 'medium'],
+            default='maintenance'
+        )
+        
+        n_regions = len(profiles)
+        return pd.DataFrame({
+            'scenario': np.repeat([s for s, _ in pairs], n_regions),
+            'region': np.tile(list(self.REGIONAL_PROFILES), len(pairs)),
+            'year': np.repeat([year for _, year in pairs], n_regions),
+            'population_millions': pop.ravel(),
+            'gdp_share_pct': _capped(gdp_share, 55, gdp_share > 55).ravel(),  # Cap at 55%
+            'employment_growth_pct': ((growth_rate - 1) * 100).ravel(),
+            'urbanization_rate': _capped(urbanization, 95, urbanization >= 95).ravel(),
+            'water_stress_level': np.asarray(self.WATER_STRESS_LEVELS)[new_idx].ravel(),
+            'investment_priority': priority.ravel()
+        })
+
+
+def _capped(values: np.ndarray, cap: int, over: np.ndarray) -> np.ndarray:
+    """values as Python objects, with the int cap where the scalar min() returns it."""
+    out = values.astype(object)
+    out[over] = cap
+    return out
 
 
 # =============================================================================
 # RISK AND OPPORTUNITY HEATMAPS
 # =============================================================================
 
+# Recommendation lists only depend on a few strings, so they are memoized and
+# shared as tuples across assessments (callers must not mutate them)
+
+@lru_cache(maxsize=512)
+def _mitigation_priorities(water_stress: str, diversification: str, scenario: str) -> Tuple[str, ...]:
+    """Mitigation priorities for a region profile under a scenario."""
+    priorities = []
+    
+    if water_stress in _CRITICAL_OR_HIGH_WATER:
+        priorities.append("Water security investment")
+    
+    if scenario == 'climate_stress':
+        priorities.append("Heat adaptation infrastructure")
+        priorities.append("Cooling system expansion")
+    
+    if diversification == 'low' and scenario in _TRANSITION_SHOCK_SCENARIOS:
+        priorities.append("Economic diversification acceleration")
+    
+    if scenario == 'tech_disruption':
+        priorities.append("Workforce reskilling programs")
+    
+    if not priorities:
+        priorities.append("Maintain current development trajectory")
+    
+    return tuple(priorities)
+
+
+@lru_cache(maxsize=512)
+def _key_opportunities(region: str, scenario: str) -> Tuple[str, ...]:
+    """Key opportunities for a region under a scenario."""
+    if region == 'Tabuk' and scenario in _HIGH_GROWTH_SCENARIOS:
+        return ("NEOM development", "Tourism leadership", "Tech innovation hub")
+    if region == 'Riyadh':
+        return ("Financial hub growth", "Entertainment capital", "Quality of life model")
+    if region == 'Eastern Province' and scenario == 'energy_transition':
+        return ("Green hydrogen production",)
+    if region in _SOLAR_NORTH and scenario == 'energy_transition':
+        return ("Solar energy hub", "Renewable exports")
+    if region == 'Asir' and scenario != 'climate_stress':
+        return ("Eco-tourism development",)
+    return ("Regional specialization development",)
+
+
+@lru_cache(maxsize=512)
+def _investment_recommendations(water_stress: str, scenario: str) -> Tuple[str, ...]:
+    """Investment recommendations for a region profile under a scenario."""
+    # Water infrastructure (universal for high stress)
+    water = ("Desalination capacity expansion",) if water_stress in _CRITICAL_OR_HIGH_WATER else ()
+    
+    # Scenario-specific
+    if scenario == 'tech_disruption':
+        specific = ("Digital infrastructure", "Education and training facilities")
+    elif scenario == 'energy_transition':
+        specific = ("Renewable energy infrastructure", "Green hydrogen facilities")
+    elif scenario == 'climate_stress':
+        specific = ("Climate adaptation infrastructure", "Indoor agriculture facilities")
+    else:
+        specific = ("Diversified economic zones",)
+    
+    return water + specific
+
+
 class RiskOpportunityAnalyzer:
     """
     Generates risk and opportunity heatmaps for each region/scenario combination.
+    
+    Rules are stored as lookup tables keyed by scenario; where a rule also
+    depends on a regional attribute, each entry holds one level per regional
+    class (see the comment above each table). Levels are scored by their
+    LEVEL_CODES value.
     """
     
+    # Risk rules
+    CLIMATE_RISK = {
+        'baseline': 'medium',
+        'vision2030': 'medium',
+        'accelerated': 'medium',
+        'conservative': 'high',
+        'climate_stress': 'critical',
+        'tech_disruption': 'low',
+        'energy_transition': 'low'
+    }
+    # (low diversification, medium/high diversification)
+    ECONOMIC_RISK = {
+        'baseline': ('medium', 'medium'),
+        'vision2030': ('medium', 'low'),
+        'accelerated': ('medium', 'low'),
+        'conservative': ('high', 'medium'),
+        'climate_stress': ('critical', 'medium'),
+        'tech_disruption': ('medium', 'medium'),
+        'energy_transition': ('critical', 'medium')
+    }
+    # (low diversification, medium/high diversification)
+    SOCIAL_RISK = {
+        'baseline': ('low', 'low'),
+        'vision2030': ('low', 'low'),
+        'accelerated': ('low', 'low'),
+        'conservative': ('medium', 'medium'),
+        'climate_stress': ('high', 'high'),
+        'tech_disruption': ('high', 'low'),
+        'energy_transition': ('low', 'low')
+    }
+    # (critical water stress, high water stress, medium/low water stress)
+    INFRASTRUCTURE_RISK = {
+        'baseline': ('high', 'medium', 'low'),
+        'vision2030': ('high', 'medium', 'low'),
+        'accelerated': ('high', 'medium', 'low'),
+        'conservative': ('high', 'medium', 'low'),
+        'climate_stress': ('critical', 'high', 'medium'),
+        'tech_disruption': ('high', 'medium', 'low'),
+        'energy_transition': ('high', 'medium', 'low')
+    }
+    
+    # Opportunity rules
+    # (growth factor > 1.3, growth factor > 1.0, other)
+    ECONOMIC_OPPORTUNITY = {
+        'baseline': ('high', 'medium', 'low'),
+        'vision2030': ('high', 'high', 'medium'),
+        'accelerated': ('high', 'high', 'medium'),
+        'conservative': ('high', 'medium', 'low'),
+        'climate_stress': ('high', 'medium', 'low'),
+        'tech_disruption': ('high', 'medium', 'low'),
+        'energy_transition': ('high', 'medium', 'low')
+    }
+    # (innovation hub, high diversification, other)
+    INNOVATION_POTENTIAL = {
+        'baseline': ('high', 'medium', 'medium'),
+        'vision2030': ('high', 'medium', 'medium'),
+        'accelerated': ('high', 'medium', 'medium'),
+        'conservative': ('high', 'medium', 'low'),
+        'climate_stress': ('high', 'medium', 'medium'),
+        'tech_disruption': ('high', 'high', 'medium'),
+        'energy_transition': ('high', 'medium', 'medium')
+    }
+    # (northern renewable region, other)
+    SUSTAINABILITY_LEADERSHIP = {
+        'baseline': ('low', 'low'),
+        'vision2030': ('medium', 'medium'),
+        'accelerated': ('low', 'low'),
+        'conservative': ('low', 'low'),
+        'climate_stress': ('low', 'low'),
+        'tech_disruption': ('low', 'low'),
+        'energy_transition': ('high', 'medium')
+    }
+    QUALITY_OF_LIFE = {
+        'baseline': 'medium',
+        'vision2030': 'high',
+        'accelerated': 'high',
+        'conservative': 'medium',
+        'climate_stress': 'low',
+        'tech_disruption': 'high',
+        'energy_transition': 'medium'
+    }
+    
     def __init__(self, regional_projector: RegionalScenarioProjector):
         """Initialize analyzer."""
         self.projector = regional_projector
+        # Assessments depend only on the projector's static profile/adjustment
+        # tables, so each (region, scenario) pair is evaluated once
+        self._risk_cache: Dict[Tuple[str, str], RiskAssessment] = {}
+        self._opportunity_cache: Dict[Tuple[str, str], OpportunityAssessment] = {}
+        self._encode_rule_tables()
+        self._risk_scores = self._compute_risk_score_matrix()
+        self._opportunity_scores = self._compute_opportunity_score_matrix()
         logger.info("Risk and Opportunity Analyzer initialized")
     
+    def _encode_rule_tables(self):
+        """Encode regions, scenarios and rule tables as integer index arrays."""
+        profiles = self.projector.REGIONAL_PROFILES
+        self._regions = tuple(profiles)
+        self._scenarios = tuple(self.projector.SCENARIO_ADJUSTMENTS)
+        self._region_idx = {r: i for i, r in enumerate(self._regions)}
+        self._scenario_idx = {s: j for j, s in enumerate(self._scenarios)}
+        
+        # Regional class codes, matching the column order of the rule tables
+        self._diversification_code = np.array(
+            [0 if profiles[r]['diversification'] == 'low' else 1 for r in self._regions], dtype=np.intp)
+        self._water_stress_code = np.array(
+            [{'critical': 0, 'high': 1}.get(profiles[r]['water_stress_base'], 2) for r in self._regions],
+            dtype=np.intp)
+        self._growth_code = np.array(
+            [0 if profiles[r]['growth_factor'] > 1.3 else (1 if profiles[r]['growth_factor'] > 1.0 else 2)
+             for r in self._regions], dtype=np.intp)
+        self._innovation_code = np.array(
+            [0 if r in _INNOVATION_HUB_REGIONS
+             else (1 if profiles[r]['diversification'] == 'high' else 2)
+             for r in self._regions], dtype=np.intp)
+        self._renewable_code = np.array(
+            [0 if r in _RENEWABLE_NORTH else 1 for r in self._regions], dtype=np.intp)
+        
+        # Rule tables as int8 level codes: shape (n_classes, n_scenarios) or (n_scenarios,)
+        def encode(table):
+            return np.array([
+                [LEVEL_CODES[level] for level in table[s]] if isinstance(table[s], tuple)
+                else LEVEL_CODES[table[s]]
+                for s in self._scenarios
+            ], dtype=np.int8).T
+        
+        self._climate_risk_table = encode(self.CLIMATE_RISK)
+        self._economic_risk_table = encode(self.ECONOMIC_RISK)
+        self._social_risk_table = encode(self.SOCIAL_RISK)
+        self._infrastructure_risk_table = encode(self.INFRASTRUCTURE_RISK)
+        self._economic_opp_table = encode(self.ECONOMIC_OPPORTUNITY)
+        self._innovation_table = encode(self.INNOVATION_POTENTIAL)
+        self._sustainability_table = encode(self.SUSTAINABILITY_LEADERSHIP)
+        self._qol_table = encode(self.QUALITY_OF_LIFE)
+    
+    def _compute_risk_score_matrix(self) -> np.ndarray:
+        """Overall risk scores (0-10) as a (regions, scenarios) array."""
+        scores = np.empty((len(self._regions), len(self._scenarios)), dtype=np.float64)
+        np.add(self._climate_risk_table[np.newaxis, :],
+               self._economic_risk_table[self._diversification_code], out=scores)
+        scores += self._social_risk_table[self._diversification_code]
+        scores += self._infrastructure_risk_table[self._water_stress_code]
+        scores /= 4
+        scores *= 2.5  # Scale to 0-10
+        return scores
+    
+    def _compute_opportunity_score_matrix(self) -> np.ndarray:
+        """Overall opportunity scores (0-10) as a (regions, scenarios) array."""
+        scores = np.empty((len(self._regions), len(self._scenarios)), dtype=np.float64)
+        np.add(self._economic_opp_table[self._growth_code],
+               self._innovation_table[self._innovation_code], out=scores)
+        scores += self._sustainability_table[self._renewable_code]
+        scores += self._qol_table[np.newaxis, :]
+        scores /= 4
+        scores *= 3.33  # Scale to 0-10
+        return scores
+    
     def assess_region_risk(self, region: str, scenario: str) -> RiskAssessment:
-        """Assess risks for a region under a scenario."""
-        
-        profile = self.projector.REGIONAL_PROFILES.get(region)
-        adjustment = self.projector.SCENARIO_ADJUSTMENTS.get(scenario)
-        
-        # Climate risk assessment
-        climate_risks = {
-            'climate_stress': 'critical',
-            'conservative': 'high',
-            'baseline': 'medium',
-            'vision2030': 'medium',
-            'energy_transition': 'low',
-            'accelerated': 'medium',
-            'tech_disruption': 'low'
-        }
-        
-        # Economic risk based on diversification and scenario
-        if profile['diversification'] == 'low':
-            if scenario in ['climate_stress', 'energy_transition']:
-                economic_risk = 'critical'
-            elif scenario == 'conservative':
-                economic_risk = 'high'
-            else:
-                economic_risk = 'medium'
-        else:
-            economic_risk = 'low' if scenario in ['vision2030', 'accelerated'] else 'medium'
-        
-        # Social risk
-        if scenario == 'tech_disruption' and profile['diversification'] == 'low':
-            social_risk = 'high'
-        elif scenario == 'climate_stress':
-            social_risk = 'high'
-        else:
-            social_risk = 'medium' if scenario == 'conservative' else 'low'
-        
-        # Infrastructure risk
-        if profile['water_stress_base'] == 'critical':
-            infra_risk = 'critical' if scenario == 'climate_stress' else 'high'
-        elif profile['water_stress_base'] == 'high':
-            infra_risk = 'high' if scenario == 'climate_stress' else 'medium'
-        else:
-            infra_risk = 'medium' if scenario == 'climate_stress' else 'low'
+        """Assess risks for a region under a scenario (cached per pair)."""
+        key = (sys.intern(region), sys.intern(scenario))
+        assessment = self._risk_cache.get(key)
+        if assessment is None:
+            assessment = self._risk_cache[key] = self._evaluate_region_risk(*key)
+        return assessment
+    
+    def assess_region_opportunity(self, region: str, scenario: str) -> OpportunityAssessment:
+        """Assess opportunities for a region under a scenario (cached per pair)."""
+        key = (sys.intern(region), sys.intern(scenario))
+        assessment = self._opportunity_cache.get(key)
+        if assessment is None:
+            assessment = self._opportunity_cache[key] = self._evaluate_region_opportunity(*key)
+        return assessment
+    
+    def get_risk_score(self, region: str, scenario: str) -> float:
+        """Overall risk score (0-10) without building the full assessment."""
+        return float(self._risk_scores[self._region_idx[region], self._scenario_idx[scenario]])
+    
+    def get_opportunity_score(self, region: str, scenario: str) -> float:
+        """Overall opportunity score (0-10) without building the full assessment."""
+        return float(self._opportunity_scores[self._region_idx[region], self._scenario_idx[scenario]])
+    
+    def _evaluate_region_risk(self, region: str, scenario: str) -> RiskAssessment:
+        """Evaluate the risk rules for a region under a scenario."""
         
-        # Calculate overall score
-        risk_scores = {'critical': 4, 'high': 3, 'medium': 2, 'low': 1}
-        avg_score = (risk_scores[climate_risks[scenario]] + risk_scores[economic_risk] + 
-                    risk_scores[social_risk] + risk_scores[infra_risk]) / 4
-        overall_score = avg_score * 2.5  # Scale to 0-10
+        profile = self.projector.REGIONAL_PROFILES[region]
+        water_stress = profile['water_stress_base']
+        diversification = profile['diversification']
+        i, j = self._region_idx[region], self._scenario_idx[scenario]
+        div = self._diversification_code[i]
         
         # Key vulnerabilities
         vulnerabilities = []
-        if profile['water_stress_base'] in ['critical', 'high']:
+        if water_stress in _CRITICAL_OR_HIGH_WATER:
             vulnerabilities.append("Water scarcity")
-        if profile['diversification'] == 'low':
+        if diversification == 'low':
             vulnerabilities.append("Economic concentration")
         if region == 'Eastern Province' and scenario == 'energy_transition':
             vulnerabilities.append("Oil sector dependency")
@@ -679,170 +1072,76 @@ class RiskOpportunityAnalyzer:
         return RiskAssessment(
             region=region,
             scenario=scenario,
-            climate_risk=climate_risks[scenario],
-            economic_risk=economic_risk,
-            social_risk=social_risk,
-            infrastructure_risk=infra_risk,
-            overall_risk_score=overall_score,
-            key_vulnerabilities=vulnerabilities,
-            mitigation_priorities=self._get_mitigation_priorities(region, scenario)
+            climate_code=int(self._climate_risk_table[j]),
+            economic_code=int(self._economic_risk_table[div, j]),
+            social_code=int(self._social_risk_table[div, j]),
+            infrastructure_code=int(self._infrastructure_risk_table[self._water_stress_code[i], j]),
+            overall_risk_score=float(self._risk_scores[i, j]),
+            key_vulnerabilities=tuple(vulnerabilities),
+            mitigation_priorities=_mitigation_priorities(water_stress, diversification, scenario)
         )
     
-    def assess_region_opportunity(self, region: str, scenario: str) -> OpportunityAssessment:
-        """Assess opportunities for a region under a scenario."""
-        
-        profile = self.projector.REGIONAL_PROFILES.get(region)
-        adjustment = self.projector.SCENARIO_ADJUSTMENTS.get(scenario)
-        
-        # Economic opportunity
-        if profile['growth_factor'] > 1.3:
-            economic_opp = 'high'
-        elif profile['growth_factor'] > 1.0:
-            economic_opp = 'high' if scenario in ['vision2030', 'accelerated'] else 'medium'
-        else:
-            economic_opp = 'medium' if scenario in ['vision2030', 'accelerated'] else 'low'
-        
-        # Innovation potential
-        if region in ['Riyadh', 'Tabuk', 'Eastern Province']:
-            innovation = 'high'
-        elif profile['diversification'] == 'high':
-            innovation = 'high' if scenario == 'tech_disruption' else 'medium'
-        else:
-            innovation = 'low' if scenario == 'conservative' else 'medium'
-        
-        # Sustainability leadership
-        if scenario == 'energy_transition':
-            if region in ['Tabuk', 'Northern Borders', 'Al-Jouf']:
-                sustainability = 'high'  # Renewable potential
-            else:
-                sustainability = 'medium'
-        else:
-            sustainability = 'medium' if scenario == 'vision2030' else 'low'
-        
-        # Quality of life improvement
-        if scenario in ['accelerated', 'vision2030', 'tech_disruption']:
-            qol = 'high'
-        elif scenario == 'climate_stress':
-            qol = 'low'
-        else:
-            qol = 'medium'
-        
-        # Calculate overall score
-        opp_scores = {'high': 3, 'medium': 2, 'low': 1}
-        avg_score = (opp_scores[economic_opp] + opp_scores[innovation] + 
-                    opp_scores[sustainability] + opp_scores[qol]) / 4
-        overall_score = avg_score * 3.33  # Scale to 0-10
+    def _evaluate_region_opportunity(self, region: str, scenario: str) -> OpportunityAssessment:
+        """Evaluate the opportunity rules for a region under a scenario."""
+        water_stress = self.projector.REGIONAL_PROFILES[region]['water_stress_base']
+        i, j = self._region_idx[region], self._scenario_idx[scenario]
         
         return OpportunityAssessment(
             region=region,
             scenario=scenario,
-            economic_opportunity=economic_opp,
-            innovation_potential=innovation,
-            sustainability_leadership=sustainability,
-            quality_of_life_improvement=qol,
-            overall_opportunity_score=overall_score,
-            key_opportunities=self._get_key_opportunities(region, scenario),
-            investment_recommendations=self._get_investment_recommendations(region, scenario)
+            economic_code=int(self._economic_opp_table[self._growth_code[i], j]),
+            innovation_code=int(self._innovation_table[self._innovation_code[i], j]),
+            sustainability_code=int(self._sustainability_table[self._renewable_code[i], j]),
+            quality_of_life_code=int(self._qol_table[j]),
+            overall_opportunity_score=float(self._opportunity_scores[i, j]),
+            key_opportunities=_key_opportunities(region, scenario),
+            investment_recommendations=_investment_recommendations(water_stress, scenario)
         )
     
-    def _get_mitigation_priorities(self, region: str, scenario: str) -> List[str]:
+    def _get_mitigation_priorities(self, region: str, scenario: str) -> Tuple[str, ...]:
         """Get mitigation priorities for region/scenario."""
-        priorities = []
-        
-        profile = self.projector.REGIONAL_PROFILES.get(region)
-        
-        if profile['water_stress_base'] in ['critical', 'high']:
-            priorities.append("Water security investment")
-        
-        if scenario == 'climate_stress':
-            priorities.append("Heat adaptation infrastructure")
-            priorities.append("Cooling system expansion")
-        
-        if profile['diversification'] == 'low' and scenario in ['energy_transition', 'climate_stress']:
-            priorities.append("Economic diversification acceleration")
-        
-        if scenario == 'tech_disruption':
-            priorities.append("Workforce reskilling programs")
-        
-        if not priorities:
-            priorities.append("Maintain current development trajectory")
-        
-        return priorities
+        profile = self.projector.REGIONAL_PROFILES[region]
+        return _mitigation_priorities(profile['water_stress_base'], profile['diversification'], scenario)
     
-    def _get_key_opportunities(self, region: str, scenario: str) -> List[str]:
+    def _get_key_opportunities(self, region: str, scenario: str) -> Tuple[str, ...]:
         """Get key opportunities for region/scenario."""
-        opportunities = []
-        
-        if region == 'Tabuk' and scenario in ['vision2030', 'accelerated', 'tech_disruption']:
-            opportunities.extend(["NEOM development", "Tourism leadership", "Tech innovation hub"])
-        elif region == 'Riyadh':
-            opportunities.extend(["Financial hub growth", "Entertainment capital", "Quality of life model"])
-        elif region == 'Eastern Province' and scenario == 'energy_transition':
-            opportunities.append("Green hydrogen production")
-        elif region in ['Northern Borders', 'Al-Jouf'] and scenario == 'energy_transition':
-            opportunities.extend(["Solar energy hub", "Renewable exports"])
-        elif region == 'Asir' and scenario != 'climate_stress':
-            opportunities.append("Eco-tourism development")
-        
-        if not opportunities:
-            opportunities.append("Regional specialization development")
-        
-        return opportunities
+        return _key_opportunities(region, scenario)
     
-    def _get_investment_recommendations(self, region: str, scenario: str) -> List[str]:
+    def _get_investment_recommendations(self, region: str, scenario: str) -> Tuple[str, ...]:
         """Get investment recommendations for region/scenario."""
-        recommendations = []
-        
-        profile = self.projector.REGIONAL_PROFILES.get(region)
-        
-        # Water infrastructure (universal for high stress)
-        if profile['water_stress_base'] in ['critical', 'high']:
-            recommendations.append("Desalination capacity expansion")
-        
-        # Scenario-specific
-        if scenario == 'tech_disruption':
-            recommendations.append("Digital infrastructure")
-            recommendations.append("Education and training facilities")
-        elif scenario == 'energy_transition':
-            recommendations.append("Renewable energy infrastructure")
-            recommendations.append("Green hydrogen facilities")
-        elif scenario == 'climate_stress':
-            recommendations.append("Climate adaptation infrastructure")
-            recommendations.append("Indoor agriculture facilities")
-        else:
-            recommendations.append("Diversified economic zones")
-        
-        return recommendations
+        return _investment_recommendations(self.projector.REGIONAL_PROFILES[region]['water_stress_base'], scenario)
+    
+    def generate_heatmaps(self, year: int = 2050) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Generate the risk and opportunity heatmap DataFrames in one pass.
+        
+        Scores come from the vectorized matrices built at construction, so
+        there is no per-region work left to distribute across a worker pool;
+        larger region sets scale with the NumPy indexing, not the interpreter.
+        """
+        index = pd.Index(self._regions, name='Region')
+        columns = list(self._scenarios)
+        return (
+            self._heatmap_frame(self._risk_scores, index, columns),
+            self._heatmap_frame(self._opportunity_scores, index, columns)
+        )
     
     def generate_risk_heatmap(self, year: int = 2050) -> pd.DataFrame:
         """Generate risk heatmap DataFrame."""
-        scenarios = list(self.projector.SCENARIO_ADJUSTMENTS.keys())
-        regions = list(self.projector.REGIONAL_PROFILES.keys())
-        
-        data = []
-        for region in regions:
-            row = {'Region': region}
-            for scenario in scenarios:
-                assessment = self.assess_region_risk(region, scenario)
-                row[scenario] = assessment.overall_risk_score
-            data.append(row)
-        
-        return pd.DataFrame(data)
+        return self._heatmap_frame(self._risk_scores, pd.Index(self._regions, name='Region'),
+                                   list(self._scenarios))
     
     def generate_opportunity_heatmap(self, year: int = 2050) -> pd.DataFrame:
         """Generate opportunity heatmap DataFrame."""
-        scenarios = list(self.projector.SCENARIO_ADJUSTMENTS.keys())
-        regions = list(self.projector.REGIONAL_PROFILES.keys())
-        
-        data = []
-        for region in regions:
-            row = {'Region': region}
-            for scenario in scenarios:
-                assessment = self.assess_region_opportunity(region, scenario)
-                row[scenario] = assessment.overall_opportunity_score
-            data.append(row)
+        return self._heatmap_frame(self._opportunity_scores, pd.Index(self._regions, name='Region'),
+                                   list(self._scenarios))
+    
+    @staticmethod
+    def _heatmap_frame(scores: np.ndarray, index: pd.Index, columns: List[str]) -> pd.DataFrame:
+        """Wrap a (regions, scenarios) score matrix as a heatmap with a Region column.
         
-        return pd.DataFrame(data)
+        Columns follow SCENARIO_ADJUSTMENTS order, matching the historical CSV layout.
+        """
+        return pd.DataFrame(scores, index=index, columns=columns).reset_index()
 
 
 # =============================================================================
@@ -854,6 +1153,51 @@ class ScenarioMapDataGenerator:
     Generates spatial data for scenario maps.
     """
     
+    # Rail network expansion by scenario
+    RAIL_NETWORKS = {
+        'baseline': RailNetwork(total_km=3500, high_speed_km=800, freight_km=2700),
+        'vision2030': RailNetwork(total_km=5500, high_speed_km=1500, freight_km=4000),
+        'accelerated': RailNetwork(total_km=8000, high_speed_km=2500, freight_km=5500),
+        'conservative': RailNetwork(total_km=2500, high_speed_km=500, freight_km=2000),
+        'climate_stress': RailNetwork(total_km=3000, high_speed_km=600, freight_km=2400),
+        'tech_disruption': RailNetwork(total_km=6000, high_speed_km=2000, freight_km=4000),
+        'energy_transition': RailNetwork(total_km=5000, high_speed_km=1200, freight_km=3800)
+    }
+    
+    # Corridors based on regional connectivity
+    ECONOMIC_CORRIDORS = (
+        {
+            'corridor_name': 'Central Corridor',
+            'regions': ('Riyadh', 'Al-Qassim', 'Hail'),
+            'dominant_sector': 'Finance & Technology',
+            'connectivity': 'high'
+        },
+        {
+            'corridor_name': 'Red Sea Corridor',
+            'regions': ('Tabuk', 'Madinah', 'Makkah', 'Jazan'),
+            'dominant_sector': 'Tourism & Logistics',
+            'connectivity': 'high'
+        },
+        {
+            'corridor_name': 'Gulf Industrial Corridor',
+            'regions': ('Eastern Province',),
+            'dominant_sector': 'Industry & Energy',
+            'connectivity': 'high'
+        },
+        {
+            'corridor_name': 'Northern Development Corridor',
+            'regions': ('Northern Borders', 'Al-Jouf'),
+            'dominant_sector': 'Mining & Renewables',
+            'connectivity': 'medium'
+        },
+        {
+            'corridor_name': 'Southern Tourism Corridor',
+            'regions': ('Asir', 'Al-Baha', 'Najran'),
+            'dominant_sector': 'Tourism & Agriculture',
+            'connectivity': 'medium'
+        }
+    )
+    
     def __init__(self, regional_projector: RegionalScenarioProjector):
         """Initialize map data generator."""
         self.projector = regional_projector
@@ -862,142 +1206,136 @@ class ScenarioMapDataGenerator:
     def generate_population_distribution_2050(self, scenario: str) -> List[Dict]:
         """Generate population distribution map data for 2050."""
         projections = self.projector.project_all_regions(scenario, 2050)
-        total_pop = sum(p.population_millions for p in projections)
+        n = len(projections)
+        pops = np.fromiter((p.population_millions for p in projections), dtype=np.float64, count=n)
+        
+        shares = pops / pops.sum() * 100
+        categories = np.select([pops > 3, pops > 1], ['major', 'medium'], default='small')
         
         return [
             {
                 'region': p.region,
-                'population_millions': p.population_millions,
-                'population_share_pct': (p.population_millions / total_pop) * 100,
+                'population_millions': pop,
+                'population_share_pct': share,
                 'urbanization_rate': p.urbanization_rate,
-                'category': 'major' if p.population_millions > 3 else 
-                           ('medium' if p.population_millions > 1 else 'small')
+                'category': category
             }
-            for p in projections
+            for p, pop, share, category in zip(projections, pops.tolist(), shares.tolist(), categories.tolist())
         ]
     
     def generate_economic_corridors_2050(self, scenario: str) -> List[Dict]:
         """Generate economic corridor map data for 2050."""
         projections = self.projector.project_all_regions(scenario, 2050)
-        
-        # Define corridors based on regional connectivity
-        corridors = [
-            {
-                'corridor_name': 'Central Corridor',
-                'regions': ['Riyadh', 'Al-Qassim', 'Hail'],
-                'dominant_sector': 'Finance & Technology',
-                'connectivity': 'high'
-            },
-            {
-                'corridor_name': 'Red Sea Corridor',
-                'regions': ['Tabuk', 'Madinah', 'Makkah', 'Jazan'],
-                'dominant_sector': 'Tourism & Logistics',
-                'connectivity': 'high'
-            },
-            {
-                'corridor_name': 'Gulf Industrial Corridor',
-                'regions': ['Eastern Province'],
-                'dominant_sector': 'Industry & Energy',
-                'connectivity': 'high'
-            },
-            {
-                'corridor_name': 'Northern Development Corridor',
-                'regions': ['Northern Borders', 'Al-Jouf'],
-                'dominant_sector': 'Mining & Renewables',
-                'connectivity': 'medium'
-            },
-            {
-                'corridor_name': 'Southern Tourism Corridor',
-                'regions': ['Asir', 'Al-Baha', 'Najran'],
-                'dominant_sector': 'Tourism & Agriculture',
-                'connectivity': 'medium'
-            }
-        ]
-        
-        # Enhance with projections
-        for corridor in corridors:
-            corridor_gdp = sum(
-                p.gdp_share_pct for p in projections 
-                if p.region in corridor['regions']
-            )
-            corridor['gdp_share_2050'] = corridor_gdp
-            corridor['investment_priority'] = 'high' if corridor_gdp > 10 else 'medium'
+        gdp_by_region = {p.region: p.gdp_share_pct for p in projections}
+        
+        # Enhance corridor definitions with projections
+        corridors = []
+        for corridor in self.ECONOMIC_CORRIDORS:
+            corridor_gdp = sum(gdp_by_region[r] for r in corridor['regions'])
+            corridors.append({
+                **corridor,
+                'gdp_share_2050': corridor_gdp,
+                'investment_priority': 'high' if corridor_gdp > 10 else 'medium'
+            })
         
         return corridors
     
-    def generate_infrastructure_map_2050(self, scenario: str) -> Dict:
-        """Generate infrastructure map data for 2050."""
-        
-        # Rail network expansion by scenario
-        rail_networks = {
-            'baseline': {
-                'total_km': 3500,
-                'high_speed_km': 800,
-                'freight_km': 2700
-            },
-            'vision2030': {
-                'total_km': 5500,
-                'high_speed_km': 1500,
-                'freight_km': 4000
-            },
-            'accelerated': {
-                'total_km': 8000,
-                'high_speed_km': 2500,
-                'freight_km': 5500
-            },
-            'conservative': {
-                'total_km': 2500,
-                'high_speed_km': 500,
-                'freight_km': 2000
-            },
-            'climate_stress': {
-                'total_km': 3000,
-                'high_speed_km': 600,
-                'freight_km': 2400
-            },
-            'tech_disruption': {
-                'total_km': 6000,
-                'high_speed_km': 2000,
-                'freight_km': 4000
-            },
-            'energy_transition': {
-                'total_km': 5000,
-                'high_speed_km': 1200,
-                'freight_km': 3800
-            }
-        }
-        
-        # Major infrastructure projects
-        projects = {
-            'rail': rail_networks.get(scenario, rail_networks['baseline']),
-            'airports': {
-                'international': 5 if scenario in ['accelerated', 'vision2030'] else 4,
-                'regional': 15 if scenario in ['accelerated', 'vision2030'] else 12,
-                'total_capacity_mppa': 200 if scenario == 'accelerated' else 150
-            },
-            'ports': {
-                'major_ports': 8,
-                'capacity_mteu': 50 if scenario in ['accelerated', 'vision2030'] else 35
-            },
-            'renewable_energy': {
-                'solar_gw': 100 if scenario == 'energy_transition' else 
-                            (80 if scenario == 'accelerated' else 50),
-                'wind_gw': 20 if scenario == 'energy_transition' else 12,
-                'hydrogen_plants': 5 if scenario == 'energy_transition' else 2
-            },
-            'water': {
-                'desalination_mcm_day': 15 if scenario == 'climate_stress' else 10,
-                'recycling_pct': 80 if scenario in ['vision2030', 'accelerated'] else 50
-            }
-        }
-        
-        return projects
+    def generate_infrastructure_map_2050(self, scenario: str) -> InfrastructureProjection:
+        """Generate infrastructure map data for 2050 (shared, immutable per scenario)."""
+        return _INFRASTRUCTURE_BY_SCENARIO.get(scenario, _INFRASTRUCTURE_BY_SCENARIO['baseline'])
+
+
+def _build_infrastructure_map(scenario: str) -> InfrastructureProjection:
+    """Materialize the major 2050 infrastructure projects for a scenario."""
+    rail_networks = ScenarioMapDataGenerator.RAIL_NETWORKS
+    return InfrastructureProjection(
+        rail=rail_networks.get(scenario, rail_networks['baseline']),
+        airports=AirportPlan(
+            international=5 if scenario in _VISION_LIKE else 4,
+            regional=15 if scenario in _VISION_LIKE else 12,
+            total_capacity_mppa=200 if scenario == 'accelerated' else 150
+        ),
+        ports=PortPlan(
+            major_ports=8,
+            capacity_mteu=50 if scenario in _VISION_LIKE else 35
+        ),
+        renewable_energy=RenewableEnergyPlan(
+            solar_gw=100 if scenario == 'energy_transition' else 
+                     (80 if scenario == 'accelerated' else 50),
+            wind_gw=20 if scenario == 'energy_transition' else 12,
+            hydrogen_plants=5 if scenario == 'energy_transition' else 2
+        ),
+        water=WaterPlan(
+            desalination_mcm_day=15 if scenario == 'climate_stress' else 10,
+            recycling_pct=80 if scenario in _VISION_LIKE else 50
+        )
+    )
+
+
+# Infrastructure projects are static per scenario, so build them once at import
+_INFRASTRUCTURE_BY_SCENARIO: Dict[str, InfrastructureProjection] = {
+    scenario: _build_infrastructure_map(scenario)
+    for scenario in RegionalScenarioProjector.SCENARIO_ADJUSTMENTS
+}
 
 
 # =============================================================================
 # WS5 COMPREHENSIVE REPORT GENERATOR
 # =============================================================================
 
+# Regional projection fields exported to the JSON/MessagePack data files
+_PROJECTION_FIELDS = (
+    'region', 'year', 'population_millions', 'gdp_share_pct',
+    'employment_growth_pct', 'urbanization_rate', 'water_stress_level', 'investment_priority'
+)
+_get_projection_fields = attrgetter(*_PROJECTION_FIELDS)
+
+
+def _dump_json(path: Path, obj: Any, indent: bool = True) -> None:
+    """Write obj as UTF-8 JSON, using orjson when available.
+    
+    indent=False writes compact JSON for machine-read data files. Those are
+    ASCII-only, so the stdlib fallback keeps its default ASCII escaping there.
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        payload = orjson.dumps(obj, option=option, default=str)
+    else:
+        payload = json.dumps(
+            obj,
+            indent=2 if indent else None,
+            separators=None if indent else (',', ':'),
+            ensure_ascii=not indent,
+            default=str
+        ).encode('utf-8')
+    path.write_bytes(payload)
+
+
+def _load_json(path: Path) -> Any:
+    """Read a JSON file in one call, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+def _dump_msgpack(path: Path, obj: Any) -> None:
+    """Write obj as MessagePack (requires msgspec)."""
+    path.write_bytes(msgspec.msgpack.encode(obj))
+
+
+def _write_parquet(path: Path, df: pd.DataFrame) -> None:
+    """Write df as zstd-compressed Parquet (requires pyarrow)."""
+    df.to_parquet(path, engine='pyarrow', compression='zstd', index=False)
+
+
+def _write_csv(path: Path, df: pd.DataFrame) -> None:
+    """Write df as CSV through one large buffer with LF line endings on every platform."""
+    with open(path, 'w', buffering=1 << 20, newline='', encoding='utf-8') as f:
+        df.to_csv(f, index=False, lineterminator='\n')
+
+
 class WS5ReportGenerator:
     """
     Generates all WS5 deliverables.
@@ -1017,8 +1355,16 @@ class WS5ReportGenerator:
         
         logger.info(f"WS5 Report Generator initialized. Output: {self.output_dir}")
     
-    def generate_all_reports(self) -> Dict[str, Any]:
-        """Generate all WS5 deliverables."""
+    def generate_all_reports(self, formats: FrozenSet[str] = REPORT_FORMATS) -> Dict[str, Any]:
+        """Generate all WS5 deliverables.
+        
+        formats selects which artifact families are written (see REPORT_FORMATS):
+        'json' (report, regional projections, map data), 'csv' (tables) and
+        'markdown' (report). The report dict is always returned.
+        """
+        unknown = set(formats) - REPORT_FORMATS
+        if unknown:
+            raise ValueError(f"Unknown report formats: {sorted(unknown)}")
         
         logger.info("Generating WS5 deliverables...")
         
@@ -1030,40 +1376,70 @@ class WS5ReportGenerator:
         comparison_2050 = self.base_modeler.compare_scenarios(2050)
         
         # Generate heatmaps
-        risk_heatmap = self.risk_analyzer.generate_risk_heatmap()
-        opportunity_heatmap = self.risk_analyzer.generate_opportunity_heatmap()
-        
-        # Save CSVs
-        comparison_2030.to_csv(self.output_dir / "scenario_comparison_2030.csv", index=False)
-        comparison_2050.to_csv(self.output_dir / "scenario_comparison_2050.csv", index=False)
-        risk_heatmap.to_csv(self.output_dir / "risk_heatmap_by_region.csv", index=False)
-        opportunity_heatmap.to_csv(self.output_dir / "opportunity_heatmap_by_region.csv", index=False)
-        
-        # Generate regional projections for all scenarios
-        regional_projections = {}
-        for scenario_name in self.regional_projector.SCENARIO_ADJUSTMENTS.keys():
-            regional_projections[scenario_name] = {
-                '2030': [self._projection_to_dict(p) for p in 
-                         self.regional_projector.project_all_regions(scenario_name, 2030)],
-                '2050': [self._projection_to_dict(p) for p in 
-                         self.regional_projector.project_all_regions(scenario_name, 2050)]
-            }
-        
-        # Save regional projections
-        with open(self.output_dir / "regional_scenario_projections.json", 'w', encoding='utf-8') as f:
-            json.dump(regional_projections, f, indent=2, ensure_ascii=False)
-        
-        # Generate map data for key scenarios
-        map_data = {}
-        for scenario_name in ['vision2030', 'climate_stress', 'energy_transition']:
-            map_data[scenario_name] = {
-                'population_distribution': self.map_generator.generate_population_distribution_2050(scenario_name),
-                'economic_corridors': self.map_generator.generate_economic_corridors_2050(scenario_name),
-                'infrastructure': self.map_generator.generate_infrastructure_map_2050(scenario_name)
-            }
+        risk_heatmap, opportunity_heatmap = self.risk_analyzer.generate_heatmaps()
+        
+        # Tabular artifacts: CSV, plus a Parquet twin for fast reloads
+        tables = {
+            "scenario_comparison_2030": comparison_2030,
+            "scenario_comparison_2050": comparison_2050,
+            "risk_heatmap_by_region": risk_heatmap,
+            "opportunity_heatmap_by_region": opportunity_heatmap
+        }
         
-        with open(self.output_dir / "scenario_map_data.json", 'w', encoding='utf-8') as f:
-            json.dump(map_data, f, indent=2, ensure_ascii=False)
+        # Pending artifact writes, keyed by file name
+        writes: Dict[str, Callable[[], None]] = {}
+        if 'csv' in formats:
+            for name, df in tables.items():
+                writes[f"{name}.csv"] = partial(_write_csv, self.output_dir / f"{name}.csv", df)
+        
+        if 'json' in formats:
+            # Generate regional projections for all scenarios in one batch
+            projections = self.regional_projector.project_batch([
+                (scenario_name, year)
+                for scenario_name in self.regional_projector.SCENARIO_ADJUSTMENTS
+                for year in (2030, 2050)
+            ])
+            regional_projections = {}
+            for (scenario_name, year), rows in projections.groupby(['scenario', 'year'], sort=False):
+                regional_projections.setdefault(scenario_name, {})[str(year)] = (
+                    rows[list(_PROJECTION_FIELDS)].to_dict(orient='records'))
+            
+            # Generate map data for key scenarios
+            map_data = {}
+            for scenario_name in ['vision2030', 'climate_stress', 'energy_transition']:
+                map_data[scenario_name] = {
+                    'population_distribution': self.map_generator.generate_population_distribution_2050(scenario_name),
+                    'economic_corridors': self.map_generator.generate_economic_corridors_2050(scenario_name),
+                    'infrastructure': asdict(self.map_generator.generate_infrastructure_map_2050(scenario_name))
+                }
+            
+            # The data files are machine-read, so they skip pretty-printing; only
+            # the report JSON is indented. MessagePack is for fast loading.
+            writes["regional_scenario_projections.json"] = partial(
+                _dump_json, self.output_dir / "regional_scenario_projections.json", regional_projections,
+                indent=False)
+            writes["scenario_map_data.json"] = partial(
+                _dump_json, self.output_dir / "scenario_map_data.json", map_data, indent=False)
+            if msgspec is not None:
+                writes["regional_scenario_projections.msgpack"] = partial(
+                    _dump_msgpack, self.output_dir / "regional_scenario_projections.msgpack",
+                    regional_projections)
+        
+        if 'csv' in formats and pyarrow is not None:
+            for name, df in tables.items():
+                writes[f"{name}.parquet"] = partial(_write_parquet, self.output_dir / f"{name}.parquet", df)
+        
+        output_files = [
+            file_name
+            for file_name, fmt in (("WS5_SCENARIO_REPORT.json", 'json'), ("WS5_SCENARIO_REPORT.md", 'markdown'))
+            if fmt in formats
+        ] + list(writes)
+        
+        # The writes are independent and spend most of their time in C
+        # serializers and file I/O, so they overlap in threads
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            # list() drains the iterator so a failed write re-raises here
+            list(pool.map(lambda write: write(), writes.values()))
         
         # Compile comprehensive report
         report = {
@@ -1101,8 +1477,8 @@ class WS5ReportGenerator:
                 ],
                 "data_file": "scenario_map_data.json"
             },
-            "section_6_model_documentation": self._generate_model_documentation(),
-            "recommendations": self._generate_recommendations(all_scenarios, risk_heatmap),
+            "section_6_model_documentation": self._model_documentation,
+            "recommendations": self._recommendations,
             "appendices": {
                 "data_sources": [
                     "GASTAT demographic projections",
@@ -1112,43 +1488,29 @@ class WS5ReportGenerator:
                     "IPCC climate projections",
                     "IEA energy transition scenarios"
                 ],
-                "output_files": [
-                    "WS5_SCENARIO_REPORT.json",
-                    "WS5_SCENARIO_REPORT.md",
-                    "scenario_comparison_2030.csv",
-                    "scenario_comparison_2050.csv",
-                    "risk_heatmap_by_region.csv",
-                    "opportunity_heatmap_by_region.csv",
-                    "regional_scenario_projections.json",
-                    "scenario_map_data.json"
-                ]
+                "output_files": output_files
             }
         }
         
         # Save JSON report
-        report_path = self.output_dir / "WS5_SCENARIO_REPORT.json"
-        with open(report_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False, default=str)
-        
-        logger.success(f"WS5 Report saved to {report_path}")
+        if 'json' in formats:
+            report_path = self.output_dir / "WS5_SCENARIO_REPORT.json"
+            _dump_json(report_path, report)
+            
+            logger.success(f"WS5 Report saved to {report_path}")
         
         # Generate markdown report
-        self._generate_markdown_report(report, comparison_2030, comparison_2050, risk_heatmap, opportunity_heatmap)
+        if 'markdown' in formats:
+            self._generate_markdown_report(report, comparison_2030, comparison_2050, risk_heatmap, opportunity_heatmap)
         
         return report
     
     def _projection_to_dict(self, proj: RegionalScenarioProjection) -> Dict:
-        """Convert regional projection to dict."""
-        return {
-            'region': proj.region,
-            'year': proj.year,
-            'population_millions': round(proj.population_millions, 2),
-            'gdp_share_pct': round(proj.gdp_share_pct, 1),
-            'employment_growth_pct': round(proj.employment_growth_pct, 1),
-            'urbanization_rate': round(proj.urbanization_rate, 1),
-            'water_stress_level': proj.water_stress_level,
-            'investment_priority': proj.investment_priority
-        }
+        """Convert regional projection to dict.
+        
+        Values keep full precision; rounding happens only where they are displayed.
+        """
+        return dict(zip(_PROJECTION_FIELDS, _get_projection_fields(proj)))
     
     def _scenario_to_dict(self, scenario: Scenario) -> Dict:
         """Convert scenario to comprehensive dict."""
@@ -1159,22 +1521,19 @@ class WS5ReportGenerator:
             'key_assumptions': scenario.key_assumptions,
             'key_risks': scenario.key_risks,
             'key_opportunities': scenario.key_opportunities,
-            'demographic_summary': {
-                '2030': next((d for d in scenario.demographic_path if d.year == 2030), None).__dict__ if scenario.demographic_path else None,
-                '2050': next((d for d in scenario.demographic_path if d.year == 2050), None).__dict__ if scenario.demographic_path else None
-            },
-            'economic_summary': {
-                '2030': next((e for e in scenario.economic_path if e.year == 2030), None).__dict__ if scenario.economic_path else None,
-                '2050': next((e for e in scenario.economic_path if e.year == 2050), None).__dict__ if scenario.economic_path else None
-            },
-            'spatial_summary': {
-                '2030': next((s for s in scenario.spatial_path if s.year == 2030), None).__dict__ if scenario.spatial_path else None,
-                '2050': next((s for s in scenario.spatial_path if s.year == 2050), None).__dict__ if scenario.spatial_path else None
-            }
+            'demographic_summary': self._path_summary(scenario.demographic_by_year),
+            'economic_summary': self._path_summary(scenario.economic_by_year),
+            'spatial_summary': self._path_summary(scenario.spatial_by_year)
         }
     
+    @staticmethod
+    def _path_summary(by_year: Dict[int, Any], years: Tuple[int, ...] = (2030, 2050)) -> Dict[str, Optional[Dict]]:
+        """Summarize a year-indexed projection path at the given years."""
+        return {str(year): asdict(by_year[year]) if year in by_year else None for year in years}
+    
     def _generate_executive_summary(self, scenarios: Dict, comp_2030: pd.DataFrame, comp_2050: pd.DataFrame) -> Dict:
         """Generate executive summary."""
+        ranges = comp_2050[['Population (M)', 'GDP ($B)']].agg(['min', 'max'])
         return {
             "overview": """This comprehensive scenario analysis models 7 alternative futures for 
             Saudi Arabia to 2050, including 4 core scenarios and 3 stress tests (climate, technology, 
@@ -1188,8 +1547,8 @@ class WS5ReportGenerator:
             },
             
             "key_findings": [
-                f"Population 2050 range: {comp_2050['Population (M)'].min():.0f}M - {comp_2050['Population (M)'].max():.0f}M",
-                f"GDP 2050 range: ${comp_2050['GDP ($B)'].min():.0f}B - ${comp_2050['GDP ($B)'].max():.0f}B",
+                f"Population 2050 range: {ranges.at['min', 'Population (M)']:.0f}M - {ranges.at['max', 'Population (M)']:.0f}M",
+                f"GDP 2050 range: ${ranges.at['min', 'GDP ($B)']:.0f}B - ${ranges.at['max', 'GDP ($B)']:.0f}B",
                 "Climate stress scenario shows highest regional risk (avg 7.5/10)",
                 "Energy transition scenario requires fastest economic restructuring",
                 "Tabuk (NEOM) shows highest growth potential across all scenarios",
@@ -1216,38 +1575,27 @@ class WS5ReportGenerator:
     
     def _get_highest_risks(self, heatmap: pd.DataFrame) -> List[Dict]:
         """Get highest risk region/scenario combinations."""
-        results = []
-        scenarios = [c for c in heatmap.columns if c != 'Region']
-        
-        for _, row in heatmap.iterrows():
-            for scenario in scenarios:
-                if row[scenario] >= 7.0:
-                    results.append({
-                        'region': row['Region'],
-                        'scenario': scenario,
-                        'risk_score': row[scenario]
-                    })
-        
-        return sorted(results, key=lambda x: x['risk_score'], reverse=True)[:10]
+        return self._top_heatmap(heatmap, 'risk_score')
     
     def _get_highest_opportunities(self, heatmap: pd.DataFrame) -> List[Dict]:
         """Get highest opportunity region/scenario combinations."""
-        results = []
-        scenarios = [c for c in heatmap.columns if c != 'Region']
-        
-        for _, row in heatmap.iterrows():
-            for scenario in scenarios:
-                if row[scenario] >= 7.0:
-                    results.append({
-                        'region': row['Region'],
-                        'scenario': scenario,
-                        'opportunity_score': row[scenario]
-                    })
-        
-        return sorted(results, key=lambda x: x['opportunity_score'], reverse=True)[:10]
-    
-    def _generate_model_documentation(self) -> Dict:
-        """Generate model documentation."""
+        return self._top_heatmap(heatmap, 'opportunity_score')
+    
+    @staticmethod
+    def _top_heatmap(heatmap: pd.DataFrame, value_col: str,
+                     threshold: float = 7.0, limit: int = 10) -> List[Dict]:
+        """Top region/scenario cells scoring at least `threshold`, highest first.
+        
+        Cells are stacked region-major so ties keep the row-by-row order.
+        """
+        cells = heatmap.set_index('Region').stack()
+        cells = cells[cells >= threshold].sort_values(ascending=False, kind='stable').head(limit)
+        cells.index.names = ['region', 'scenario']
+        return cells.rename(value_col).reset_index().to_dict(orient='records')
+    
+    @cached_property
+    def _model_documentation(self) -> Dict:
+        """Model documentation (static, built once per generator)."""
         return {
             "model_overview": {
                 "name": "NSS X Scenario Simulation Model",
@@ -1308,8 +1656,9 @@ class WS5ReportGenerator:
             }
         }
     
-    def _generate_recommendations(self, scenarios: Dict, risk_heatmap: pd.DataFrame) -> Dict:
-        """Generate planning recommendations."""
+    @cached_property
+    def _recommendations(self) -> Dict:
+        """Planning recommendations (static, built once per generator)."""
         return {
             "spatial_planning": [
                 "Adopt adaptive spatial planning that accommodates scenario uncertainty",
@@ -1343,12 +1692,55 @@ class WS5ReportGenerator:
             ]
         }
     
+    @staticmethod
+    def _markdown_rows(columns: List[pd.Series]) -> str:
+        """Join pre-formatted string columns into Markdown table rows."""
+        rows = columns[0].str.cat(columns[1:], sep=' | ')
+        return ''.join('| ' + rows + ' |\n')
+    
+    def _comparison_table_rows(self, comparison: pd.DataFrame) -> str:
+        """Format a scenario comparison table body, one column at a time."""
+        return self._markdown_rows([
+            comparison['Scenario'].str[:20],
+            comparison['Population (M)'].map('{:.1f}'.format),
+            comparison['GDP ($B)'].map('{:.0f}'.format),
+            comparison['GDP/Capita ($)'].map('{:,.0f}'.format),
+            comparison['Oil Share (%)'].map('{:.0f}%'.format),
+            (comparison['Probability'] * 100).map('{:.0f}%'.format)
+        ])
+    
+    def _heatmap_table_rows(self, heatmap: pd.DataFrame) -> str:
+        """Format a heatmap table body in SCENARIO_COLUMNS order; missing columns render as 0.0."""
+        values = heatmap.set_index('Region').reindex(columns=list(SCENARIO_COLUMNS), fill_value=0)
+        return self._markdown_rows(
+            [values.index.to_series()] + [values[s].map('{:.1f}'.format) for s in SCENARIO_COLUMNS]
+        )
+    
+    @staticmethod
+    def _format_scenario_block(scenario_data: Dict) -> str:
+        """Format one scenario's Section 2 entry: name, probability, excerpt, top assumptions and risks."""
+        assumptions = "".join(f"- {assumption}\n" for assumption in scenario_data['key_assumptions'][:4])
+        risks = "".join(f"- {risk}\n" for risk in scenario_data['key_risks'][:3])
+        return f"""### {scenario_data['name']}
+
+**Probability:** {scenario_data['probability']*100:.0f}%
+
+{scenario_data['description'][:300]}...
+
+**Key Assumptions:**
+{assumptions}
+**Key Risks:**
+{risks}
+---
+
+"""
+    
     def _generate_markdown_report(self, report: Dict, comp_2030: pd.DataFrame, 
                                    comp_2050: pd.DataFrame, risk_hm: pd.DataFrame, 
                                    opp_hm: pd.DataFrame):
         """Generate markdown report."""
         
-        md_content = f"""# WS5 - Long-Term Scenario Modeling (2030-2050)
+        parts = [f"""# WS5 - Long-Term Scenario Modeling (2030-2050)
 
 **Generated:** {report['metadata']['generated_date']}
 **Version:** {report['metadata']['version']}
@@ -1369,18 +1761,18 @@ class WS5ReportGenerator:
 
 ### Key Findings
 
-"""
+"""]
         for finding in report['executive_summary']['key_findings']:
-            md_content += f"- {finding}\n"
+            parts.append(f"- {finding}\n")
         
-        md_content += """
+        parts.append("""
 ### Critical Uncertainties
 
-"""
+""")
         for uncertainty in report['executive_summary']['critical_uncertainties']:
-            md_content += f"- {uncertainty}\n"
+            parts.append(f"- {uncertainty}\n")
         
-        md_content += f"""
+        parts.append(f"""
 ---
 
 ## Section 1: Scenario Comparison
@@ -1389,56 +1781,38 @@ class WS5ReportGenerator:
 
 | Scenario | Population (M) | GDP ($B) | GDP/Capita ($) | Oil Share (%) | Probability |
 |----------|---------------|----------|----------------|---------------|-------------|
-"""
-        for _, row in comp_2030.iterrows():
-            md_content += f"| {row['Scenario'][:20]} | {row['Population (M)']:.1f} | {row['GDP ($B)']:.0f} | {row['GDP/Capita ($)']:,.0f} | {row['Oil Share (%)']:.0f}% | {row['Probability']*100:.0f}% |\n"
+""")
+        parts.append(self._comparison_table_rows(comp_2030))
         
-        md_content += f"""
+        parts.append(f"""
 ### 2050 Projections
 
 | Scenario | Population (M) | GDP ($B) | GDP/Capita ($) | Oil Share (%) | Probability |
 |----------|---------------|----------|----------------|---------------|-------------|
-"""
-        for _, row in comp_2050.iterrows():
-            md_content += f"| {row['Scenario'][:20]} | {row['Population (M)']:.1f} | {row['GDP ($B)']:.0f} | {row['GDP/Capita ($)']:,.0f} | {row['Oil Share (%)']:.0f}% | {row['Probability']*100:.0f}% |\n"
+""")
+        parts.append(self._comparison_table_rows(comp_2050))
         
-        md_content += """
+        parts.append("""
 ---
 
 ## Section 2: Scenario Descriptions
 
-"""
-        for scenario_name, scenario_data in report['section_1_scenarios'].items():
-            md_content += f"""### {scenario_data['name']}
-
-**Probability:** {scenario_data['probability']*100:.0f}%
-
-{scenario_data['description'][:300]}...
-
-**Key Assumptions:**
-"""
-            for assumption in scenario_data['key_assumptions'][:4]:
-                md_content += f"- {assumption}\n"
-            
-            md_content += "\n**Key Risks:**\n"
-            for risk in scenario_data['key_risks'][:3]:
-                md_content += f"- {risk}\n"
-            
-            md_content += "\n---\n\n"
+""")
+        parts.extend(
+            self._format_scenario_block(scenario_data)
+            for scenario_data in report['section_1_scenarios'].values()
+        )
         
-        md_content += """## Section 3: Risk Heatmap by Region
+        parts.append("""## Section 3: Risk Heatmap by Region
 
 Scale: 0 (low risk) to 10 (critical risk)
 
 | Region | Baseline | Vision2030 | Accelerated | Conservative | Climate | Tech | Energy |
 |--------|----------|------------|-------------|--------------|---------|------|--------|
-"""
-        scenarios = ['baseline', 'vision2030', 'accelerated', 'conservative', 'climate_stress', 'tech_disruption', 'energy_transition']
-        for _, row in risk_hm.iterrows():
-            values = ' | '.join([f"{row.get(s, 0):.1f}" for s in scenarios])
-            md_content += f"| {row['Region']} | {values} |\n"
+""")
+        parts.append(self._heatmap_table_rows(risk_hm))
         
-        md_content += """
+        parts.append("""
 ---
 
 ## Section 4: Opportunity Heatmap by Region
@@ -1447,34 +1821,32 @@ Scale: 0 (low opportunity) to 10 (high opportunity)
 
 | Region | Baseline | Vision2030 | Accelerated | Conservative | Climate | Tech | Energy |
 |--------|----------|------------|-------------|--------------|---------|------|--------|
-"""
-        for _, row in opp_hm.iterrows():
-            values = ' | '.join([f"{row.get(s, 0):.1f}" for s in scenarios])
-            md_content += f"| {row['Region']} | {values} |\n"
+""")
+        parts.append(self._heatmap_table_rows(opp_hm))
         
-        md_content += """
+        parts.append("""
 ---
 
 ## Section 5: Planning Recommendations
 
 ### Spatial Planning
-"""
+""")
         for rec in report['recommendations']['spatial_planning']:
-            md_content += f"- {rec}\n"
+            parts.append(f"- {rec}\n")
         
-        md_content += """
+        parts.append("""
 ### Investment Priorities
-"""
+""")
         for rec in report['recommendations']['investment_priorities']:
-            md_content += f"- {rec}\n"
+            parts.append(f"- {rec}\n")
         
-        md_content += """
+        parts.append("""
 ### Regional Strategy
-"""
+""")
         for rec in report['recommendations']['regional_strategy']:
-            md_content += f"- {rec}\n"
+            parts.append(f"- {rec}\n")
         
-        md_content += """
+        parts.append("""
 ---
 
 ## Section 6: Model Documentation
@@ -1483,36 +1855,35 @@ Scale: 0 (low opportunity) to 10 (high opportunity)
 
 | Component | Purpose |
 |-----------|---------|
-"""
+""")
         for component in report['section_6_model_documentation']['model_structure']['components']:
-            md_content += f"| {component['name']} | {component['purpose'][:50]} |\n"
+            parts.append(f"| {component['name']} | {component['purpose'][:50]} |\n")
         
-        md_content += """
+        parts.append("""
 ### Limitations
-"""
+""")
         for limitation in report['section_6_model_documentation']['limitations']:
-            md_content += f"- {limitation}\n"
+            parts.append(f"- {limitation}\n")
         
-        md_content += """
+        parts.append("""
 ---
 
 ## Appendices
 
 ### Output Files
-"""
+""")
         for file in report['appendices']['output_files']:
-            md_content += f"- `{file}`\n"
+            parts.append(f"- `{file}`\n")
         
-        md_content += """
+        parts.append("""
 ### Data Sources
-"""
+""")
         for source in report['appendices']['data_sources']:
-            md_content += f"- {source}\n"
+            parts.append(f"- {source}\n")
         
         # Save markdown
         md_path = self.output_dir / "WS5_SCENARIO_REPORT.md"
-        with open(md_path, 'w', encoding='utf-8') as f:
-            f.write(md_content)
+        md_path.write_text("".join(parts), encoding='utf-8')
         
         logger.success(f"Markdown report saved to {md_path}")
 
@@ -1521,10 +1892,20 @@ Scale: 0 (low opportunity) to 10 (high opportunity)
 # CONVENIENCE FUNCTIONS
 # =============================================================================
 
-def generate_ws5_deliverables(output_dir: str = "02_analytics/ws5_outputs") -> Dict[str, Any]:
+def generate_ws5_deliverables(output_dir: str = "02_analytics/ws5_outputs",
+                              formats: FrozenSet[str] = REPORT_FORMATS) -> Dict[str, Any]:
     """Generate all WS5 deliverables."""
     generator = WS5ReportGenerator(output_dir)
-    return generator.generate_all_reports()
+    return generator.generate_all_reports(formats)
+
+
+def load_regional_projections(output_dir: str = "02_analytics/ws5_outputs") -> Dict[str, Any]:
+    """Load regional scenario projections, preferring the MessagePack sidecar."""
+    output_path = Path(output_dir)
+    msgpack_path = output_path / "regional_scenario_projections.msgpack"
+    if msgspec is not None and msgpack_path.exists():
+        return msgspec.msgpack.decode(msgpack_path.read_bytes())
+    return _load_json(output_path / "regional_scenario_projections.json")
 
 
 if __name__ == "__main__":
@@ -3,13 +3,186 @@ NSS X - WS5: Scenario Modeling 2030/2050
 Modelagem de cenários de desenvolvimento territorial para a Arábia Saudita.
 """
 
+import copy
+import json
 import pandas as pd
 import numpy as np
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field, fields
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+from types import MappingProxyType
 from enum import Enum
+from functools import lru_cache
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib encoder
+    orjson = None
+
+
+# Milestone years of every projection path, and their offsets from the 2024
+# base year (float so the kernel uses real powers, not repeated multiplication)
+PROJECTION_YEARS = (2025, 2030, 2040, 2050)
+_PROJ_YEARS = np.array(PROJECTION_YEARS)
+_PROJ_OFFSETS = (_PROJ_YEARS - 2024).astype(np.float64)
+
+# 2024 base values shared by all scenarios
+BASE_POPULATION_M = 36.4
+BASE_GDP_BILLION_USD = 1108
+
+
+# =============================================================================
+# PROJECTION KERNEL
+# =============================================================================
+
+# Columns of a projection row: demographic, economic, then spatial fields,
+# in the field order of the projection dataclasses (without year)
+PROJECTION_COLUMNS = (
+    'total_population', 'saudi_population', 'expat_population', 'urban_population_pct',
+    'riyadh_share_pct', 'youth_share_pct',
+    'gdp_billion_usd', 'gdp_per_capita_usd', 'oil_gdp_share_pct', 'tourism_gdp_share_pct',
+    'tech_gdp_share_pct', 'unemployment_rate_pct', 'female_labor_participation_pct',
+    'urbanized_area_sqkm', 'new_cities_completed', 'protected_area_pct',
+    'renewable_capacity_gw', 'rail_network_km', 'desalination_capacity_mcm'
+)
+_N_COLUMNS = len(PROJECTION_COLUMNS)
+
+# Flat layout of the knobs passed to the kernel; paired knobs are expanded
+_KERNEL_PARAMS = (
+    'pop_growth', 'saudi_share', 'expat_share', 'urban', 'riyadh', 'youth',
+    'gdp_growth', 'oil', 'tourism', 'tech', 'unemployment', 'female_labor',
+    'urbanized_area', 'new_cities', 'protected_area', 'renewable', 'rail', 'desalination'
+)
+
+
+def _param_vector(params: Dict) -> np.ndarray:
+    """Flatten a scenario's projection knobs into the kernel's parameter vector."""
+    values = []
+    for key in _KERNEL_PARAMS:
+        value = params[key]
+        values.extend(value if isinstance(value, tuple) else (value,))
+    return np.array(values, dtype=np.float64)
+
+
+def _ramp(base: float, slope: np.ndarray, y: np.ndarray,
+          lo: Any = -np.inf, hi: Any = np.inf) -> np.ndarray:
+    """Linear trend base + y * slope, clamped to [lo, hi]."""
+    return np.minimum(np.maximum(base + y * slope, lo), hi)
+
+
+def _project(offsets: np.ndarray, params: np.ndarray,
+             pop_growth: np.ndarray, gdp_growth: np.ndarray) -> np.ndarray:
+    """Project a (sets, knobs) parameter matrix over the year offsets.
+    
+    pop_growth and gdp_growth are the (sets, years) compound growth factors of
+    the population and GDP knobs. Returns a (sets, years, PROJECTION_COLUMNS)
+    array. Plain NumPy broadcasting, so it also compiles under numba for sweep().
+    """
+    y = offsets.reshape(1, -1)
+    # One (sets, 1) column per knob, broadcasting against the (1, years) offsets
+    k = np.ascontiguousarray(params.T).reshape(params.shape[1], params.shape[0], 1)
+    out = np.empty((params.shape[0], offsets.shape[0], _N_COLUMNS))
+    
+    # Demographics
+    pop = BASE_POPULATION_M * pop_growth
+    out[:, :, 0] = pop
+    out[:, :, 1] = pop * k[1]
+    out[:, :, 2] = pop * k[2]
+    out[:, :, 3] = _ramp(86, k[3], y, hi=k[4])
+    out[:, :, 4] = _ramp(25, k[5], y, hi=k[6])
+    out[:, :, 5] = _ramp(63, -k[7], y, lo=k[8])
+    
+    # Economy
+    gdp = BASE_GDP_BILLION_USD * gdp_growth
+    out[:, :, 6] = gdp
+    out[:, :, 7] = (gdp * 1e9) / (pop * 1e6)
+    out[:, :, 8] = _ramp(38, -k[10], y, lo=k[11])
+    out[:, :, 9] = _ramp(5, k[12], y, hi=k[13])
+    out[:, :, 10] = _ramp(4, k[14], y, hi=k[15])
+    out[:, :, 11] = _ramp(11, -k[16], y, lo=k[17])
+    out[:, :, 12] = _ramp(33, k[18], y, hi=k[19])
+    
+    # Spatial
+    out[:, :, 13] = 5000 + y * k[20]
+    out[:, :, 14] = np.minimum(k[21] + y // k[22], k[23])
+    out[:, :, 15] = 4 + y * k[24]
+    out[:, :, 16] = 5 + y * k[25]
+    out[:, :, 17] = 1200 + y * k[26]
+    out[:, :, 18] = 2500 + y * k[27]
+    return out
+
+
+def _project_scenarios(offsets: np.ndarray, params: np.ndarray) -> np.ndarray:
+    """_project with growth factors from Python's float pow, as scalar code computes them.
+    
+    NumPy's vectorized pow may differ from C pow in the last bit.
+    """
+    exponents = offsets.astype(object)
+    pop_growth, gdp_growth = (
+        np.power(params[:, [i]].astype(object), exponents).astype(np.float64) for i in (0, 9)
+    )
+    return _project(offsets, params, pop_growth, gdp_growth)
+
+
+# How the scalar formulas type each value, so the published artifacts keep
+# their ints: linear columns are ints when their knob is; clamped ramps
+# (base, knob, +1 capped above / -1 floored below) are ints where an int bound
+# clamps them, elsewhere when their slope is an int
+_LINEAR_COLUMNS = {
+    'urbanized_area_sqkm': 'urbanized_area',
+    'protected_area_pct': 'protected_area',
+    'renewable_capacity_gw': 'renewable',
+    'rail_network_km': 'rail',
+    'desalination_capacity_mcm': 'desalination'
+}
+_RAMP_COLUMNS = {
+    'urban_population_pct': (86, 'urban', 1),
+    'riyadh_share_pct': (25, 'riyadh', 1),
+    'youth_share_pct': (63, 'youth', -1),
+    'oil_gdp_share_pct': (38, 'oil', -1),
+    'tourism_gdp_share_pct': (5, 'tourism', 1),
+    'tech_gdp_share_pct': (4, 'tech', 1),
+    'unemployment_rate_pct': (11, 'unemployment', -1),
+    'female_labor_participation_pct': (33, 'female_labor', 1)
+}
+
+
+def _int_mask(params: Dict) -> np.ndarray:
+    """(years, PROJECTION_COLUMNS) mask of the values the scalar formulas give as ints."""
+    y = _PROJ_OFFSETS
+    mask = np.zeros((len(y), _N_COLUMNS), dtype=bool)
+    mask[:, PROJECTION_COLUMNS.index('new_cities_completed')] = True
+    for column, knob in _LINEAR_COLUMNS.items():
+        mask[:, PROJECTION_COLUMNS.index(column)] = isinstance(params[knob], int)
+    for column, (base, knob, direction) in _RAMP_COLUMNS.items():
+        slope, bound = params[knob]
+        trend = base + direction * y * slope
+        clamped = trend > bound if direction > 0 else trend < bound
+        mask[:, PROJECTION_COLUMNS.index(column)] = np.where(
+            clamped, isinstance(bound, int), isinstance(slope, int)
+        )
+    return mask
+
+
+@lru_cache(maxsize=1)
+def _sweep_kernel() -> Callable[[np.ndarray, np.ndarray], np.ndarray]:
+    """_project compiled with numba, on the first sweep() only."""
+    try:
+        from numba import njit
+        from numba.extending import register_jitable
+    except ImportError:  # Optional: sweep() runs the plain NumPy projection without it
+        return _project_scenarios
+    
+    register_jitable(_ramp)  # callable from the compiled _project
+    project = njit(_project)
+    
+    @njit
+    def kernel(offsets, params):
+        y = offsets.reshape(1, -1)
+        return project(offsets, params, params[:, 0:1] ** y, params[:, 9:10] ** y)
+    
+    return kernel
+
 
 class ScenarioType(Enum):
     """Types of development scenarios."""
@@ -19,7 +192,7 @@ class ScenarioType(Enum):
     CONSERVATIVE = "conservative"   # Slower transformation
 
 
-@dataclass
+@dataclass(slots=True)
 class DemographicProjection:
     """Demographic projection for a scenario."""
     year: int
@@ -31,7 +204,7 @@ class DemographicProjection:
     youth_share_pct: float  # under 30
 
 
-@dataclass
+@dataclass(slots=True)
 class EconomicProjection:
     """Economic projection for a scenario."""
     year: int
@@ -44,7 +217,7 @@ class EconomicProjection:
     female_labor_participation_pct: float
 
 
-@dataclass
+@dataclass(slots=True)
 class SpatialProjection:
     """Spatial development projection."""
     year: int
@@ -56,19 +229,116 @@ class SpatialProjection:
     desalination_capacity_mcm: float  # million cubic meters
 
 
-@dataclass 
+@dataclass(slots=True)
 class Scenario:
     """Complete development scenario."""
     name: str
     type: ScenarioType
     description: str
-    key_assumptions: List[str]
+    key_assumptions: Sequence[str]
     demographic_path: List[DemographicProjection]
     economic_path: List[EconomicProjection]
     spatial_path: List[SpatialProjection]
     probability: float  # Estimated probability of occurrence
-    key_risks: List[str]
-    key_opportunities: List[str]
+    key_risks: Sequence[str]
+    key_opportunities: Sequence[str]
+    # Year-indexed views of the paths, for O(1) milestone lookups
+    demographic_by_year: Dict[int, DemographicProjection] = field(init=False, repr=False, compare=False)
+    economic_by_year: Dict[int, EconomicProjection] = field(init=False, repr=False, compare=False)
+    spatial_by_year: Dict[int, SpatialProjection] = field(init=False, repr=False, compare=False)
+    # Columnar views of the paths: field name -> array over the path's years
+    demographic_columns: Dict[str, np.ndarray] = field(init=False, repr=False, compare=False)
+    economic_columns: Dict[str, np.ndarray] = field(init=False, repr=False, compare=False)
+    spatial_columns: Dict[str, np.ndarray] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Index the projection paths by year and as columns."""
+        self.demographic_by_year = {d.year: d for d in self.demographic_path}
+        self.economic_by_year = {e.year: e for e in self.economic_path}
+        self.spatial_by_year = {s.year: s for s in self.spatial_path}
+        self.demographic_columns = _path_columns(self.demographic_path, DemographicProjection)
+        self.economic_columns = _path_columns(self.economic_path, EconomicProjection)
+        self.spatial_columns = _path_columns(self.spatial_path, SpatialProjection)
+
+
+def _path_columns(path: List[Any], projection_type: type) -> Dict[str, np.ndarray]:
+    """Turn a projection path into one array per dataclass field."""
+    return {
+        f.name: np.array([getattr(p, f.name) for p in path])
+        for f in fields(projection_type)
+    }
+
+
+def _year_index(years: np.ndarray, year: int) -> Optional[int]:
+    """Position of year in a sorted year array, or None if absent."""
+    i = int(np.searchsorted(years, year))
+    return i if i < len(years) and years[i] == year else None
+
+
+# compare_scenarios columns: (label, field); Probability is appended last
+_COMPARISON_FIELDS = (
+    ('Population (M)', 'total_population'),
+    ('GDP ($B)', 'gdp_billion_usd'),
+    ('GDP/Capita ($)', 'gdp_per_capita_usd'),
+    ('Oil Share (%)', 'oil_gdp_share_pct'),
+    ('Tourism Share (%)', 'tourism_gdp_share_pct'),
+    ('Urban (%)', 'urban_population_pct'),
+    ('Renewable GW', 'renewable_capacity_gw')
+)
+# Positions of the compared fields in the projection cube's last axis
+_COMPARISON_COLS = [PROJECTION_COLUMNS.index(name) for _, name in _COMPARISON_FIELDS]
+
+
+# Static part of the scenario report, built once at import. Entries set to
+# None are filled per modeler, and keep the report's key order. Each report
+# starts from a deep copy, so no two reports share nested values.
+_REPORT_SKELETON: Dict[str, Any] = {
+    "title": "WS5 - Scenario Analysis: Saudi Arabia 2030/2050",
+    "base_year": None,
+    "target_years": [2030, 2050],
+    "scenarios_analyzed": 4,
+    "scenario_summaries": None,
+    "comparison_2030": None,
+    "comparison_2050": None,
+    "key_findings": None,
+    "recommendations": {
+        "planning": [
+            "Adopt flexible spatial planning accommodating multiple scenarios",
+            "Prioritize infrastructure investments robust across scenarios",
+            "Develop adaptive management frameworks"
+        ],
+        "monitoring": [
+            "Establish scenario tracking indicators",
+            "Create early warning system for trajectory deviation",
+            "Regular scenario updates (bi-annual)"
+        ],
+        "resilience": [
+            "Build redundancy in critical systems",
+            "Diversify economic corridors",
+            "Protect natural capital as insurance"
+        ]
+    },
+    "data_sources": [
+        "GASTAT demographic projections",
+        "Vision 2030 official targets",
+        "IMF economic forecasts",
+        "SAMA annual reports",
+        "Academic research on KSA development"
+    ]
+}
+
+
+# Regional factors for project_region (would come from spatial analysis in
+# production); read-only so the shared constant cannot drift between calls
+_REGIONAL_FACTORS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    'Riyadh': MappingProxyType({'growth_multiplier': 1.2, 'diversification_leader': True}),
+    'Eastern Province': MappingProxyType({'growth_multiplier': 0.9, 'oil_dependent': True}),
+    'Makkah': MappingProxyType({'growth_multiplier': 1.1, 'tourism_focus': True}),
+    'Madinah': MappingProxyType({'growth_multiplier': 1.0, 'tourism_focus': True}),
+    'Tabuk': MappingProxyType({'growth_multiplier': 1.5, 'neom_effect': True}),
+    'Al-Qassim': MappingProxyType({'growth_multiplier': 0.8, 'agricultural_focus': True}),
+})
+_DEFAULT_REGIONAL_FACTOR: Mapping[str, Any] = MappingProxyType({'growth_multiplier': 1.0})
 
 
 class ScenarioModeler:
@@ -77,378 +347,297 @@ class ScenarioModeler:
     Projects development trajectories to 2030 and 2050.
     """
     
-    def __init__(self):
-        """Initialize scenario modeler."""
-        self.base_year = 2024
-        self.scenarios: Dict[ScenarioType, Scenario] = {}
-        self._build_scenarios()
-        logger.info("WS5 Scenario Modeler initialized with 4 scenarios")
-    
-    def _build_scenarios(self):
-        """Build all development scenarios."""
-        self.scenarios[ScenarioType.BASELINE] = self._build_baseline_scenario()
-        self.scenarios[ScenarioType.VISION2030] = self._build_vision2030_scenario()
-        self.scenarios[ScenarioType.ACCELERATED] = self._build_accelerated_scenario()
-        self.scenarios[ScenarioType.CONSERVATIVE] = self._build_conservative_scenario()
-    
-    def _build_baseline_scenario(self) -> Scenario:
-        """Build baseline (current trends) scenario."""
-        
-        # Demographic projections - moderate growth
-        demographics = []
-        base_pop = 36.4
-        for year in [2025, 2030, 2040, 2050]:
-            years = year - 2024
-            pop = base_pop * (1.018 ** years)  # 1.8% growth
-            demographics.append(DemographicProjection(
-                year=year,
-                total_population=pop,
-                saudi_population=pop * 0.66,
-                expat_population=pop * 0.34,
-                urban_population_pct=min(86 + years * 0.3, 92),
-                riyadh_share_pct=min(25 + years * 0.15, 32),
-                youth_share_pct=max(63 - years * 0.4, 45)
-            ))
-        
-        # Economic projections
-        economics = []
-        base_gdp = 1108  # billion USD
-        for year in [2025, 2030, 2040, 2050]:
-            years = year - 2024
-            gdp = base_gdp * (1.03 ** years)  # 3% growth
-            pop_millions = demographics[min(len(demographics)-1, [2025,2030,2040,2050].index(year))].total_population
-            economics.append(EconomicProjection(
-                year=year,
-                gdp_billion_usd=gdp,
-                gdp_per_capita_usd=(gdp * 1e9) / (pop_millions * 1e6),
-                oil_gdp_share_pct=max(38 - years * 0.8, 20),
-                tourism_gdp_share_pct=min(5 + years * 0.5, 15),
-                tech_gdp_share_pct=min(4 + years * 0.4, 12),
-                unemployment_rate_pct=max(11 - years * 0.2, 6),
-                female_labor_participation_pct=min(33 + years * 0.8, 45)
-            ))
-        
-        # Spatial projections
-        spatial = []
-        for year in [2025, 2030, 2040, 2050]:
-            years = year - 2024
-            spatial.append(SpatialProjection(
-                year=year,
-                urbanized_area_sqkm=5000 + years * 150,
-                new_cities_completed=min(1 + years // 5, 3),
-                protected_area_pct=4 + years * 0.1,
-                renewable_capacity_gw=5 + years * 1.5,
-                rail_network_km=1200 + years * 80,
-                desalination_capacity_mcm=2500 + years * 100
-            ))
-        
-        return Scenario(
-            name="Baseline (Current Trends)",
-            type=ScenarioType.BASELINE,
-            description="Continuation of current development trends without major policy shifts.",
-            key_assumptions=[
+    # Scenario definitions: narrative fields, then projection knobs. Prose
+    # lists are tuples, shared by the Scenarios built from them. Paired knobs
+    # are (change per year, cap or floor); new_cities is (initial, one more
+    # every N years, cap).
+    SCENARIO_PARAMS: Dict[ScenarioType, Dict] = {
+        ScenarioType.BASELINE: {
+            'name': "Baseline (Current Trends)",
+            'description': "Continuation of current development trends without major policy shifts.",
+            'key_assumptions': (
                 "Oil prices remain moderate ($70-80/barrel)",
                 "Vision 2030 targets partially achieved",
                 "Regional stability maintained",
                 "Gradual economic diversification",
                 "Climate policies implemented slowly"
-            ],
-            demographic_path=demographics,
-            economic_path=economics,
-            spatial_path=spatial,
-            probability=0.30,
-            key_risks=[
+            ),
+            'probability': 0.30,
+            'key_risks': (
                 "Insufficient diversification",
                 "Youth unemployment persistence",
                 "Water stress intensification",
                 "Climate change impacts"
-            ],
-            key_opportunities=[
+            ),
+            'key_opportunities': (
                 "Incremental progress on transformation",
                 "Lower financial risk",
                 "Social stability"
-            ]
-        )
-    
-    def _build_vision2030_scenario(self) -> Scenario:
-        """Build Vision 2030 achievement scenario."""
-        
-        demographics = []
-        base_pop = 36.4
-        for year in [2025, 2030, 2040, 2050]:
-            years = year - 2024
-            pop = base_pop * (1.022 ** years)  # 2.2% growth
-            demographics.append(DemographicProjection(
-                year=year,
-                total_population=pop,
-                saudi_population=pop * 0.62,
-                expat_population=pop * 0.38,  # More expats for mega-projects
-                urban_population_pct=min(86 + years * 0.4, 95),
-                riyadh_share_pct=min(25 + years * 0.2, 35),
-                youth_share_pct=max(63 - years * 0.35, 48)
-            ))
-        
-        economics = []
-        base_gdp = 1108
-        for year in [2025, 2030, 2040, 2050]:
-            years = year - 2024
-            gdp = base_gdp * (1.05 ** years)  # 5% growth
-            pop_millions = demographics[min(len(demographics)-1, [2025,2030,2040,2050].index(year))].total_population
-            economics.append(EconomicProjection(
-                year=year,
-                gdp_billion_usd=gdp,
-                gdp_per_capita_usd=(gdp * 1e9) / (pop_millions * 1e6),
-                oil_gdp_share_pct=max(38 - years * 1.5, 12),
-                tourism_gdp_share_pct=min(5 + years * 1.0, 20),
-                tech_gdp_share_pct=min(4 + years * 0.8, 18),
-                unemployment_rate_pct=max(11 - years * 0.5, 4),
-                female_labor_participation_pct=min(33 + years * 1.5, 55)
-            ))
-        
-        spatial = []
-        for year in [2025, 2030, 2040, 2050]:
-            years = year - 2024
-            spatial.append(SpatialProjection(
-                year=year,
-                urbanized_area_sqkm=5000 + years * 250,
-                new_cities_completed=min(2 + years // 3, 8),  # NEOM, KAEC, etc.
-                protected_area_pct=4 + years * 0.25,  # 30% by 2030 target
-                renewable_capacity_gw=5 + years * 4,  # 50GW by 2030
-                rail_network_km=1200 + years * 150,
-                desalination_capacity_mcm=2500 + years * 200
-            ))
-        
-        return Scenario(
-            name="Vision 2030 Achievement",
-            type=ScenarioType.VISION2030,
-            description="Full achievement of Vision 2030 targets and continued progress to 2050.",
-            key_assumptions=[
+            ),
+            'pop_growth': 1.018,  # 1.8% growth
+            'saudi_share': 0.66,
+            'expat_share': 0.34,
+            'urban': (0.3, 92),
+            'riyadh': (0.15, 32),
+            'youth': (0.4, 45),
+            'gdp_growth': 1.03,  # 3% growth
+            'oil': (0.8, 20),
+            'tourism': (0.5, 15),
+            'tech': (0.4, 12),
+            'unemployment': (0.2, 6),
+            'female_labor': (0.8, 45),
+            'urbanized_area': 150,
+            'new_cities': (1, 5, 3),
+            'protected_area': 0.1,
+            'renewable': 1.5,
+            'rail': 80,
+            'desalination': 100
+        },
+        ScenarioType.VISION2030: {
+            'name': "Vision 2030 Achievement",
+            'description': "Full achievement of Vision 2030 targets and continued progress to 2050.",
+            'key_assumptions': (
                 "Strong oil prices support transition ($80-100/barrel)",
                 "Mega-projects delivered on schedule",
                 "Tourism reaches 100M visitors by 2030",
                 "Non-oil GDP dominates by 2040",
                 "Significant social reforms continue"
-            ],
-            demographic_path=demographics,
-            economic_path=economics,
-            spatial_path=spatial,
-            probability=0.35,
-            key_risks=[
+            ),
+            'probability': 0.35,
+            'key_risks': (
                 "Mega-project cost overruns",
                 "Global economic downturn",
                 "Execution capacity constraints",
                 "Labor market imbalances"
-            ],
-            key_opportunities=[
+            ),
+            'key_opportunities': (
                 "Global tourism hub",
                 "Regional technology leader",
                 "Clean energy pioneer",
                 "Entertainment capital"
-            ]
-        )
-    
-    def _build_accelerated_scenario(self) -> Scenario:
-        """Build accelerated transformation scenario."""
-        
-        demographics = []
-        base_pop = 36.4
-        for year in [2025, 2030, 2040, 2050]:
-            years = year - 2024
-            pop = base_pop * (1.025 ** years)  # 2.5% growth
-            demographics.append(DemographicProjection(
-                year=year,
-                total_population=pop,
-                saudi_population=pop * 0.58,
-                expat_population=pop * 0.42,  # High immigration
-                urban_population_pct=min(86 + years * 0.5, 98),
-                riyadh_share_pct=min(25 + years * 0.1, 30),  # More distributed
-                youth_share_pct=max(63 - years * 0.3, 50)
-            ))
-        
-        economics = []
-        base_gdp = 1108
-        for year in [2025, 2030, 2040, 2050]:
-            years = year - 2024
-            gdp = base_gdp * (1.07 ** years)  # 7% growth
-            pop_millions = demographics[min(len(demographics)-1, [2025,2030,2040,2050].index(year))].total_population
-            economics.append(EconomicProjection(
-                year=year,
-                gdp_billion_usd=gdp,
-                gdp_per_capita_usd=(gdp * 1e9) / (pop_millions * 1e6),
-                oil_gdp_share_pct=max(38 - years * 2.0, 8),
-                tourism_gdp_share_pct=min(5 + years * 1.2, 25),
-                tech_gdp_share_pct=min(4 + years * 1.2, 25),
-                unemployment_rate_pct=max(11 - years * 0.6, 3),
-                female_labor_participation_pct=min(33 + years * 2.0, 65)
-            ))
-        
-        spatial = []
-        for year in [2025, 2030, 2040, 2050]:
-            years = year - 2024
-            spatial.append(SpatialProjection(
-                year=year,
-                urbanized_area_sqkm=5000 + years * 350,
-                new_cities_completed=min(3 + years // 2, 15),
-                protected_area_pct=4 + years * 0.4,  # 40% by 2040
-                renewable_capacity_gw=5 + years * 6,  # 100GW+ by 2040
-                rail_network_km=1200 + years * 200,
-                desalination_capacity_mcm=2500 + years * 300
-            ))
-        
-        return Scenario(
-            name="Accelerated Transformation",
-            type=ScenarioType.ACCELERATED,
-            description="Beyond Vision 2030 - rapid diversification and global leadership.",
-            key_assumptions=[
+            ),
+            'pop_growth': 1.022,  # 2.2% growth
+            'saudi_share': 0.62,
+            'expat_share': 0.38,  # More expats for mega-projects
+            'urban': (0.4, 95),
+            'riyadh': (0.2, 35),
+            'youth': (0.35, 48),
+            'gdp_growth': 1.05,  # 5% growth
+            'oil': (1.5, 12),
+            'tourism': (1.0, 20),
+            'tech': (0.8, 18),
+            'unemployment': (0.5, 4),
+            'female_labor': (1.5, 55),
+            'urbanized_area': 250,
+            'new_cities': (2, 3, 8),  # NEOM, KAEC, etc.
+            'protected_area': 0.25,  # 30% by 2030 target
+            'renewable': 4,  # 50GW by 2030
+            'rail': 150,
+            'desalination': 200
+        },
+        ScenarioType.ACCELERATED: {
+            'name': "Accelerated Transformation",
+            'description': "Beyond Vision 2030 - rapid diversification and global leadership.",
+            'key_assumptions': (
                 "Green hydrogen becomes major export",
                 "NEOM becomes global innovation hub",
                 "KSA leads G20 in growth rates",
                 "Full energy transition by 2045",
                 "Regional economic integration (GCC+)"
-            ],
-            demographic_path=demographics,
-            economic_path=economics,
-            spatial_path=spatial,
-            probability=0.15,
-            key_risks=[
+            ),
+            'probability': 0.15,
+            'key_risks': (
                 "Social disruption from rapid change",
                 "Infrastructure capacity limits",
                 "Environmental carrying capacity",
                 "Geopolitical instability"
-            ],
-            key_opportunities=[
+            ),
+            'key_opportunities': (
                 "Global economic power",
                 "Technology leadership",
                 "Sustainable development model",
                 "Polycentric urban network"
-            ]
-        )
-    
-    def _build_conservative_scenario(self) -> Scenario:
-        """Build conservative (slower transition) scenario."""
-        
-        demographics = []
-        base_pop = 36.4
-        for year in [2025, 2030, 2040, 2050]:
-            years = year - 2024
-            pop = base_pop * (1.012 ** years)  # 1.2% growth
-            demographics.append(DemographicProjection(
-                year=year,
-                total_population=pop,
-                saudi_population=pop * 0.70,
-                expat_population=pop * 0.30,  # Fewer expats
-                urban_population_pct=min(86 + years * 0.2, 90),
-                riyadh_share_pct=min(25 + years * 0.25, 38),  # More concentration
-                youth_share_pct=max(63 - years * 0.5, 42)
-            ))
-        
-        economics = []
-        base_gdp = 1108
-        for year in [2025, 2030, 2040, 2050]:
-            years = year - 2024
-            gdp = base_gdp * (1.02 ** years)  # 2% growth
-            pop_millions = demographics[min(len(demographics)-1, [2025,2030,2040,2050].index(year))].total_population
-            economics.append(EconomicProjection(
-                year=year,
-                gdp_billion_usd=gdp,
-                gdp_per_capita_usd=(gdp * 1e9) / (pop_millions * 1e6),
-                oil_gdp_share_pct=max(38 - years * 0.5, 28),
-                tourism_gdp_share_pct=min(5 + years * 0.3, 10),
-                tech_gdp_share_pct=min(4 + years * 0.2, 8),
-                unemployment_rate_pct=max(11 - years * 0.1, 8),
-                female_labor_participation_pct=min(33 + years * 0.5, 40)
-            ))
-        
-        spatial = []
-        for year in [2025, 2030, 2040, 2050]:
-            years = year - 2024
-            spatial.append(SpatialProjection(
-                year=year,
-                urbanized_area_sqkm=5000 + years * 100,
-                new_cities_completed=min(1 + years // 8, 2),
-                protected_area_pct=4 + years * 0.05,
-                renewable_capacity_gw=5 + years * 0.8,
-                rail_network_km=1200 + years * 50,
-                desalination_capacity_mcm=2500 + years * 80
-            ))
-        
-        return Scenario(
-            name="Conservative (Slower Transition)",
-            type=ScenarioType.CONSERVATIVE,
-            description="Slower transformation due to external or internal constraints.",
-            key_assumptions=[
+            ),
+            'pop_growth': 1.025,  # 2.5% growth
+            'saudi_share': 0.58,
+            'expat_share': 0.42,  # High immigration
+            'urban': (0.5, 98),
+            'riyadh': (0.1, 30),  # More distributed
+            'youth': (0.3, 50),
+            'gdp_growth': 1.07,  # 7% growth
+            'oil': (2.0, 8),
+            'tourism': (1.2, 25),
+            'tech': (1.2, 25),
+            'unemployment': (0.6, 3),
+            'female_labor': (2.0, 65),
+            'urbanized_area': 350,
+            'new_cities': (3, 2, 15),
+            'protected_area': 0.4,  # 40% by 2040
+            'renewable': 6,  # 100GW+ by 2040
+            'rail': 200,
+            'desalination': 300
+        },
+        ScenarioType.CONSERVATIVE: {
+            'name': "Conservative (Slower Transition)",
+            'description': "Slower transformation due to external or internal constraints.",
+            'key_assumptions': (
                 "Oil prices decline ($50-60/barrel)",
                 "Global recession impacts investment",
                 "Mega-projects scaled back",
                 "Gradual social reforms",
                 "Regional tensions increase"
-            ],
-            demographic_path=demographics,
-            economic_path=economics,
-            spatial_path=spatial,
-            probability=0.20,
-            key_risks=[
+            ),
+            'probability': 0.20,
+            'key_risks': (
                 "Economic stagnation",
                 "Youth frustration",
                 "Continued oil dependence",
                 "Brain drain"
-            ],
-            key_opportunities=[
+            ),
+            'key_opportunities': (
                 "Lower risk exposure",
                 "More sustainable pace",
                 "Consolidation of gains"
-            ]
+            ),
+            'pop_growth': 1.012,  # 1.2% growth
+            'saudi_share': 0.70,
+            'expat_share': 0.30,  # Fewer expats
+            'urban': (0.2, 90),
+            'riyadh': (0.25, 38),  # More concentration
+            'youth': (0.5, 42),
+            'gdp_growth': 1.02,  # 2% growth
+            'oil': (0.5, 28),
+            'tourism': (0.3, 10),
+            'tech': (0.2, 8),
+            'unemployment': (0.1, 8),
+            'female_labor': (0.5, 40),
+            'urbanized_area': 100,
+            'new_cities': (1, 8, 2),
+            'protected_area': 0.05,
+            'renewable': 0.8,
+            'rail': 50,
+            'desalination': 80
+        }
+    }
+    
+    def __init__(self):
+        """Initialize scenario modeler."""
+        self.base_year = 2024
+        self.scenarios: Mapping[ScenarioType, Scenario] = self._build_scenarios()
+        
+        # Scenarios are fixed after construction, so derived outputs are cached
+        self._comparison_cache: Dict[int, pd.DataFrame] = {}
+        self._reports: Dict[str, Dict] = {}
+        logger.info("WS5 Scenario Modeler initialized with 4 scenarios")
+    
+    def _build_scenarios(self) -> Mapping[ScenarioType, Scenario]:
+        """Build all development scenarios.
+        
+        Returned read-only and in projection cube order, so the comparisons can
+        pair the cube's rows with the scenarios' names and probabilities.
+        """
+        # All projections in one (scenarios, years, PROJECTION_COLUMNS) block,
+        # in SCENARIO_PARAMS order; the paths and comparisons are read from it
+        self._projection_cube = _project_scenarios(
+            _PROJ_OFFSETS, np.vstack([_param_vector(p) for p in self.SCENARIO_PARAMS.values()])
+        )
+        # Which of those values the artifacts publish as ints
+        self._int_cube = np.stack([_int_mask(p) for p in self.SCENARIO_PARAMS.values()])
+        return MappingProxyType({
+            scenario_type: self._build_from_params(scenario_type, block, ints)
+            for scenario_type, block, ints in zip(self.SCENARIO_PARAMS, self._projection_cube, self._int_cube)
+        })
+    
+    def _build_from_params(self, scenario_type: ScenarioType, block: np.ndarray,
+                           ints: np.ndarray) -> Scenario:
+        """Build a scenario from its SCENARIO_PARAMS entry and projection block."""
+        p = self.SCENARIO_PARAMS[scenario_type]
+        demographics, economics, spatial = self._project_paths(block, ints)
+        
+        return Scenario(
+            name=p['name'],
+            type=scenario_type,
+            description=p['description'],
+            key_assumptions=p['key_assumptions'],
+            demographic_path=demographics,
+            economic_path=economics,
+            spatial_path=spatial,
+            probability=p['probability'],
+            key_risks=p['key_risks'],
+            key_opportunities=p['key_opportunities']
         )
     
+    def _project_paths(self, block: np.ndarray, ints: np.ndarray) -> Tuple[
+            List[DemographicProjection], List[EconomicProjection], List[SpatialProjection]]:
+        """Split a scenario's (years, PROJECTION_COLUMNS) block into its paths.
+        
+        Values flagged in the matching ints mask are stored as Python ints.
+        """
+        rows = [
+            [int(v) if is_int else v for v, is_int in zip(row, row_ints)]
+            for row, row_ints in zip(block.tolist(), ints.tolist())
+        ]
+        years = PROJECTION_YEARS
+        demographics = [DemographicProjection(year, *row[0:6]) for year, row in zip(years, rows)]
+        economics = [EconomicProjection(year, *row[6:13]) for year, row in zip(years, rows)]
+        spatial = [SpatialProjection(year, *row[13:19]) for year, row in zip(years, rows)]
+        return demographics, economics, spatial
+    
+    def sweep(self, param_grid: List[Dict]) -> np.ndarray:
+        """Project many parameter sets at once, e.g. for sensitivity analysis.
+        
+        Each entry holds the projection knobs of a SCENARIO_PARAMS entry (narrative
+        keys are ignored), so perturbations can be written as
+        {**ScenarioModeler.SCENARIO_PARAMS[ScenarioType.BASELINE], 'pop_growth': 1.02}.
+        Returns an array of shape (len(param_grid), len(_PROJ_YEARS), len(PROJECTION_COLUMNS)).
+        """
+        return _sweep_kernel()(_PROJ_OFFSETS, np.vstack([_param_vector(p) for p in param_grid]))
+    
     def get_scenario(self, scenario_type: ScenarioType) -> Scenario:
         """Get a specific scenario."""
         return self.scenarios[scenario_type]
     
     def compare_scenarios(self, year: int = 2030) -> pd.DataFrame:
-        """Compare all scenarios at a specific year."""
-        comparisons = []
+        """Compare all scenarios at a specific year.
         
-        for scenario in self.scenarios.values():
-            # Find projections for the target year
-            demo = next((d for d in scenario.demographic_path if d.year == year), None)
-            econ = next((e for e in scenario.economic_path if e.year == year), None)
-            spatial = next((s for s in scenario.spatial_path if s.year == year), None)
-            
-            if demo and econ and spatial:
-                comparisons.append({
-                    'Scenario': scenario.name,
-                    'Population (M)': demo.total_population,
-                    'GDP ($B)': econ.gdp_billion_usd,
-                    'GDP/Capita ($)': econ.gdp_per_capita_usd,
-                    'Oil Share (%)': econ.oil_gdp_share_pct,
-                    'Tourism Share (%)': econ.tourism_gdp_share_pct,
-                    'Urban (%)': demo.urban_population_pct,
-                    'Renewable GW': spatial.renewable_capacity_gw,
-                    'Probability': scenario.probability
-                })
+        Comparisons are cached per year; callers get their own copy.
+        """
+        comparison = self._comparison_cache.get(year)
+        if comparison is None:
+            comparison = self._comparison_cache[year] = self._build_comparison(year)
+        return comparison.copy()
+    
+    def _build_comparison(self, year: int) -> pd.DataFrame:
+        """Build the scenario comparison table for a year."""
+        scenarios = list(self.scenarios.values())  # one per cube row, in order
+        index = _year_index(_PROJ_YEARS, year)
+        if index is None:
+            scenarios = []
         
-        return pd.DataFrame(comparisons)
+        # One column-major float64 block, so each column is contiguous
+        labels = [label for label, _ in _COMPARISON_FIELDS] + ['Probability']
+        values = np.empty((len(scenarios), len(labels)), order='F')
+        if scenarios:
+            values[:, :-1] = self._projection_cube[:, index, _COMPARISON_COLS]
+            values[:, -1] = [s.probability for s in scenarios]
+        comparison = pd.DataFrame(values, columns=labels)
+        if scenarios:
+            # A column is int, as in a table of scalar values, when every scenario's value is
+            int_columns = self._int_cube[:, index, _COMPARISON_COLS].all(axis=0)
+            comparison = comparison.astype({label: np.int64 for label, is_int in zip(labels, int_columns) if is_int})
+        comparison.insert(0, 'Scenario', [s.name for s in scenarios])
+        return comparison
     
     def project_region(self, region_name: str, scenario_type: ScenarioType) -> Dict:
         """Project development for a specific region under a scenario."""
-        scenario = self.scenarios[scenario_type]
-        
-        # Regional factors (would come from spatial analysis in production)
-        regional_factors = {
-            'Riyadh': {'growth_multiplier': 1.2, 'diversification_leader': True},
-            'Eastern Province': {'growth_multiplier': 0.9, 'oil_dependent': True},
-            'Makkah': {'growth_multiplier': 1.1, 'tourism_focus': True},
-            'Madinah': {'growth_multiplier': 1.0, 'tourism_focus': True},
-            'Tabuk': {'growth_multiplier': 1.5, 'neom_effect': True},
-            'Al-Qassim': {'growth_multiplier': 0.8, 'agricultural_focus': True},
-        }
+        scenario = self.get_scenario(scenario_type)
         
-        factor = regional_factors.get(region_name, {'growth_multiplier': 1.0})
+        factor = _REGIONAL_FACTORS.get(region_name, _DEFAULT_REGIONAL_FACTOR)
         
         projections = []
-        for year in [2025, 2030, 2040, 2050]:
-            demo = next((d for d in scenario.demographic_path if d.year == year), None)
-            econ = next((e for e in scenario.economic_path if e.year == year), None)
+        for year in PROJECTION_YEARS:
+            demo = scenario.demographic_by_year.get(year)
+            econ = scenario.economic_by_year.get(year)
             
             if demo and econ:
                 projections.append({
@@ -461,67 +650,103 @@ class ScenarioModeler:
             'region': region_name,
             'scenario': scenario.name,
             'projections': projections,
-            'characteristics': factor
+            'characteristics': dict(factor)
         }
+
+    def project_all_regions(self, scenario_type: ScenarioType) -> pd.DataFrame:
+        """Project every known region under a scenario in one broadcast.
+
+        Same rules as project_region, computed as a (regions, years) outer
+        product. Returns one row per region and projection year.
+        """
+        scenario = self.get_scenario(scenario_type)
+        demo, econ = scenario.demographic_columns, scenario.economic_columns
+
+        # Projection years present in both paths (columns are year-sorted)
+        years = np.intersect1d(np.intersect1d(demo['year'], econ['year']), _PROJ_YEARS)
+        population = demo['total_population'][np.searchsorted(demo['year'], years)] * 0.1
+        gdp = econ['gdp_billion_usd'][np.searchsorted(econ['year'], years)] * 0.1
+
+        regions = list(_REGIONAL_FACTORS)
+        growth = np.array([f['growth_multiplier'] for f in _REGIONAL_FACTORS.values()])
+
+        return pd.DataFrame({
+            'region': np.repeat(regions, len(years)),
+            'year': np.tile(years, len(regions)),
+            'population': np.multiply.outer(growth, population).ravel(),
+            'gdp_share': np.multiply.outer(growth, gdp).ravel()
+        })
+
+    def generate_scenario_report(self, orient: str = 'records') -> Dict:
+        """Generate comprehensive scenario analysis report.
+        
+        orient sets the layout of the comparison tables: 'records' (one dict per
+        scenario) or 'list' (one list per column, cheaper to build and serialize).
+        Each layout is built once per modeler; callers get their own copy.
+        """
+        if orient not in ('records', 'list'):
+            raise ValueError(f"Unsupported comparison orient: {orient}")
+        report = self._reports.get(orient)
+        if report is None:
+            report = self._reports[orient] = self._build_scenario_report(orient)
+        return copy.deepcopy(report)
     
-    def generate_scenario_report(self) -> Dict:
-        """Generate comprehensive scenario analysis report."""
+    def _build_scenario_report(self, orient: str) -> Dict:
+        """Build the scenario analysis report."""
         
         comparison_2030 = self.compare_scenarios(2030)
         comparison_2050 = self.compare_scenarios(2050)
         
-        report = {
-            "title": "WS5 - Scenario Analysis: Saudi Arabia 2030/2050",
-            "base_year": self.base_year,
-            "target_years": [2030, 2050],
-            "scenarios_analyzed": 4,
-            "scenario_summaries": {
-                s.type.value: {
-                    "name": s.name,
-                    "description": s.description,
-                    "probability": s.probability,
-                    "key_assumptions": s.key_assumptions[:3],
-                    "key_risks": s.key_risks[:3],
-                    "key_opportunities": s.key_opportunities[:3]
-                }
-                for s in self.scenarios.values()
-            },
-            "comparison_2030": comparison_2030.to_dict(orient='records'),
-            "comparison_2050": comparison_2050.to_dict(orient='records'),
-            "key_findings": {
-                "population_range_2030": f"{comparison_2030['Population (M)'].min():.1f}M - {comparison_2030['Population (M)'].max():.1f}M",
-                "gdp_range_2030": f"${comparison_2030['GDP ($B)'].min():.0f}B - ${comparison_2030['GDP ($B)'].max():.0f}B",
-                "population_range_2050": f"{comparison_2050['Population (M)'].min():.1f}M - {comparison_2050['Population (M)'].max():.1f}M",
-                "gdp_range_2050": f"${comparison_2050['GDP ($B)'].min():.0f}B - ${comparison_2050['GDP ($B)'].max():.0f}B",
-                "diversification_success": "Vision 2030 scenario achieves <20% oil dependence by 2030"
-            },
-            "recommendations": {
-                "planning": [
-                    "Adopt flexible spatial planning accommodating multiple scenarios",
-                    "Prioritize infrastructure investments robust across scenarios",
-                    "Develop adaptive management frameworks"
-                ],
-                "monitoring": [
-                    "Establish scenario tracking indicators",
-                    "Create early warning system for trajectory deviation",
-                    "Regular scenario updates (bi-annual)"
-                ],
-                "resilience": [
-                    "Build redundancy in critical systems",
-                    "Diversify economic corridors",
-                    "Protect natural capital as insurance"
-                ]
-            },
-            "data_sources": [
-                "GASTAT demographic projections",
-                "Vision 2030 official targets",
-                "IMF economic forecasts",
-                "SAMA annual reports",
-                "Academic research on KSA development"
-            ]
+        # Fill the per-modeler entries into a copy of the static skeleton
+        report = copy.deepcopy(_REPORT_SKELETON)
+        report["base_year"] = self.base_year
+        report["scenario_summaries"] = {
+            s.type.value: {
+                "name": s.name,
+                "description": s.description,
+                "probability": s.probability,
+                "key_assumptions": list(s.key_assumptions[:3]),
+                "key_risks": list(s.key_risks[:3]),
+                "key_opportunities": list(s.key_opportunities[:3])
+            }
+            for s in self.scenarios.values()
+        }
+        if orient == 'array':
+            report["comparison_2030"] = _comparison_arrays(comparison_2030)
+            report["comparison_2050"] = _comparison_arrays(comparison_2050)
+        else:
+            report["comparison_2030"] = comparison_2030.to_dict(orient=orient)
+            report["comparison_2050"] = comparison_2050.to_dict(orient=orient)
+        report["key_findings"] = {
+            "population_range_2030": f"{comparison_2030['Population (M)'].min():.1f}M - {comparison_2030['Population (M)'].max():.1f}M",
+            "gdp_range_2030": f"${comparison_2030['GDP ($B)'].min():.0f}B - ${comparison_2030['GDP ($B)'].max():.0f}B",
+            "population_range_2050": f"{comparison_2050['Population (M)'].min():.1f}M - {comparison_2050['Population (M)'].max():.1f}M",
+            "gdp_range_2050": f"${comparison_2050['GDP ($B)'].min():.0f}B - ${comparison_2050['GDP ($B)'].max():.0f}B",
+            "diversification_success": "Vision 2030 scenario achieves <20% oil dependence by 2030"
         }
         
         return report
+    
+    def generate_scenario_report_json(self) -> bytes:
+        """Generate the scenario report serialized as UTF-8 JSON.
+        
+        Comparison tables are column-oriented, as with orient='list', but their
+        numeric columns are handed to the encoder as arrays, skipping to_dict.
+        """
+        report = self._reports.get('array')
+        if report is None:
+            report = self._reports['array'] = self._build_scenario_report('array')
+        if orjson is not None:
+            return orjson.dumps(report, option=orjson.OPT_SERIALIZE_NUMPY)
+        return json.dumps(report, ensure_ascii=False, separators=(',', ':'),
+                          default=np.ndarray.tolist).encode('utf-8')
+
+
+def _comparison_arrays(comparison: pd.DataFrame) -> Dict[str, Any]:
+    """Column-oriented comparison table with the numeric columns as arrays."""
+    columns = {'Scenario': comparison['Scenario'].tolist()}
+    columns.update((label, comparison[label].to_numpy()) for label in comparison.columns[1:])
+    return columns
 
 
 # Convenience function
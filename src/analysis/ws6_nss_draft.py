@@ -11,14 +11,23 @@ Deliverables:
 
 import pandas as pd
 import numpy as np
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass, field, asdict
+from functools import cached_property, lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+from types import MappingProxyType
 from datetime import datetime
 from pathlib import Path
 import json
+import sys
 from enum import Enum
 from loguru import logger
 
+try:
+    from scipy.spatial import cKDTree
+except ImportError:  # Optional: node queries fall back to a vectorized scan
+    cKDTree = None
+
 
 # =============================================================================
 # COORDINATE LOOKUPS (Module-level for CSV generation)
@@ -68,23 +77,126 @@ CORRIDOR_COORDS = {
     "Central Logistics Spine": ((24.7136, 46.6753), (26.3260, 43.9750))
 }
 
+EARTH_RADIUS_KM = 6371.0
+
+
+def _haversine_km(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Great-circle distance in km between coordinate arrays given in degrees."""
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+def _initial_bearing_deg(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Initial compass bearing in degrees (0-360) from point 1 towards point 2."""
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    dlon = lon2 - lon1
+    y = np.sin(dlon) * np.cos(lat2)
+    x = np.cos(lat1) * np.sin(lat2) - np.sin(lat1) * np.cos(lat2) * np.cos(dlon)
+    return np.degrees(np.arctan2(y, x)) % 360
+
+
+def _unit_vectors(lat, lon) -> np.ndarray:
+    """Points given in degrees as (..., 3) unit vectors on the sphere."""
+    lat, lon = np.radians(lat), np.radians(lon)
+    return np.stack([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)], axis=-1)
+
+
+def _chord_length(distance_km: float) -> float:
+    """Straight-line distance between unit vectors distance_km apart on the surface."""
+    return 2 * np.sin(min(distance_km / EARTH_RADIUS_KM, np.pi) / 2)
+
+
+# Corridor end points as one (N, 4) array of start lat/lon, end lat/lon, in
+# CORRIDOR_COORDS order, so geometry is computed for all corridors at once
+_CORRIDOR_ARR = np.array(
+    [[start[0], start[1], end[0], end[1]] for start, end in CORRIDOR_COORDS.values()],
+    dtype=np.float64
+)
+
+# Straight-line (great-circle) corridor geometry, precomputed at import
+CORRIDOR_LENGTHS: Dict[str, float] = dict(zip(CORRIDOR_COORDS, _haversine_km(*_CORRIDOR_ARR.T).tolist()))
+CORRIDOR_BEARINGS: Dict[str, float] = dict(zip(CORRIDOR_COORDS, _initial_bearing_deg(*_CORRIDOR_ARR.T).tolist()))
+
+# City coordinates as parallel columns (names, (N, 2) lat/lon) in CITY_COORDS
+# order, so bulk queries run over every city in one vectorized pass
+CITY_NAMES = np.array(list(CITY_COORDS))
+CITY_LATLON = np.array(list(CITY_COORDS.values()), dtype=np.float64)
+
+
+def nearest_city(lat: float, lon: float) -> str:
+    """Name of the city in CITY_COORDS closest to a point."""
+    distances = _haversine_km(lat, lon, CITY_LATLON[:, 0], CITY_LATLON[:, 1])
+    return str(CITY_NAMES[np.argmin(distances)])
+
+
+def city_distance_matrix() -> pd.DataFrame:
+    """All-pairs great-circle distances (km) between the cities in CITY_COORDS."""
+    lat, lon = CITY_LATLON[:, 0], CITY_LATLON[:, 1]
+    distances = _haversine_km(lat[:, None], lon[:, None], lat[None, :], lon[None, :])
+    return pd.DataFrame(distances, index=CITY_NAMES, columns=CITY_NAMES)
+
 
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class GuidingPrinciple:
+    """NSS guiding principle, with its Arabic name."""
+    principle: str
+    principle_ar: str
+    description: str
+
+
+@dataclass(frozen=True, slots=True)
+class StrategicObjective:
+    """NSS strategic objective with its 2050 target and KPIs."""
+    id: str
+    objective: str
+    description: str
+    target_2050: str
+    kpis: Tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
 class NSSVision:
     """National Spatial Strategy Vision."""
     vision_statement: str
     vision_statement_ar: str
     time_horizon: int
-    guiding_principles: List[Dict[str, str]]
-    strategic_objectives: List[Dict[str, Any]]
-    alignment_with_vision2030: List[str]
+    guiding_principles: Tuple[GuidingPrinciple, ...]
+    strategic_objectives: Tuple[StrategicObjective, ...]
+    alignment_with_vision2030: Tuple[str, ...]
+
+
+# Allowed values of the coded spatial structure fields, highest first
+NODE_TIERS = (1, 2, 3)
+PRIORITY_LEVELS = ('critical', 'high', 'medium', 'low')
+INTENSITY_LEVELS = ('high', 'medium', 'low', 'minimal')
+SENSITIVITY_LEVELS = ('high', 'medium', 'low')
+INVESTMENT_CATEGORIES = ('infrastructure', 'economic', 'social', 'environmental')
+
+# regions_benefited of a nationwide investment priority
+ALL_REGIONS = ("All regions",)
 
 
-@dataclass
+def _check_code(record: Any, name: str, allowed: Tuple[Any, ...]) -> None:
+    """Reject a record whose coded field is outside its allowed values."""
+    value = getattr(record, name)
+    if value not in allowed:
+        raise ValueError(f"{type(record).__name__} {name} must be one of {allowed}, got {value!r}")
+
+
+def _freeze_labels(record: Any, *names: str) -> None:
+    """Store a frozen record's label lists as tuples of interned strings."""
+    for name in names:
+        labels = getattr(record, name)
+        if not isinstance(labels, tuple):  # shared tuple constants are kept as-is
+            object.__setattr__(record, name, tuple(map(sys.intern, labels)))
+
+
+@dataclass(frozen=True, slots=True)
 class StrategicNode:
     """Strategic node (anchor city) in the spatial structure."""
     name: str
@@ -94,15 +206,20 @@ class StrategicNode:
     node_type: str  # capital, economic, tourism, industrial, emerging
     population_2024: float
     population_2050_target: float
-    primary_functions: List[str]
-    key_investments: List[str]
-    connectivity_priority: str  # critical, high, medium
-    giga_projects: List[str]
+    primary_functions: Sequence[str]
+    key_investments: Sequence[str]
+    connectivity_priority: str  # critical, high, medium, low
+    giga_projects: Sequence[str]
     lat: float = 0.0  # Latitude
     lon: float = 0.0  # Longitude
+    
+    def __post_init__(self):
+        _check_code(self, 'tier', NODE_TIERS)
+        _check_code(self, 'connectivity_priority', PRIORITY_LEVELS)
+        _freeze_labels(self, 'primary_functions', 'key_investments', 'giga_projects')
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DevelopmentCorridor:
     """Development corridor connecting strategic nodes."""
     name: str
@@ -110,10 +227,10 @@ class DevelopmentCorridor:
     corridor_type: str  # economic, logistics, tourism, mixed
     origin_node: str
     destination_node: str
-    intermediate_nodes: List[str]
+    intermediate_nodes: Sequence[str]
     length_km: float
-    infrastructure_components: List[str]
-    economic_sectors: List[str]
+    infrastructure_components: Sequence[str]
+    economic_sectors: Sequence[str]
     investment_sar_billion: float
     priority: str  # critical, high, medium
     timeline: str  # 2025-2030, 2030-2040, 2040-2050
@@ -121,23 +238,42 @@ class DevelopmentCorridor:
     start_lon: float = 0.0
     end_lat: float = 0.0
     end_lon: float = 0.0
+    
+    def __post_init__(self):
+        """Fill end points and, if not given, length from the corridor lookups."""
+        _check_code(self, 'priority', PRIORITY_LEVELS)
+        _freeze_labels(self, 'intermediate_nodes', 'infrastructure_components', 'economic_sectors')
+        coords = CORRIDOR_COORDS.get(self.name)
+        if coords:
+            (start_lat, start_lon), (end_lat, end_lon) = coords
+            object.__setattr__(self, 'start_lat', start_lat)
+            object.__setattr__(self, 'start_lon', start_lon)
+            object.__setattr__(self, 'end_lat', end_lat)
+            object.__setattr__(self, 'end_lon', end_lon)
+            if not self.length_km:
+                object.__setattr__(self, 'length_km', CORRIDOR_LENGTHS[self.name])
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FunctionalZone:
     """Functional zone designation."""
     zone_name: str
     zone_type: str  # urban_growth, industrial, agricultural, protected, tourism, mixed
     description: str
     area_km2: float
-    regions_covered: List[str]
-    permitted_uses: List[str]
-    restricted_uses: List[str]
+    regions_covered: Sequence[str]
+    permitted_uses: Sequence[str]
+    restricted_uses: Sequence[str]
     development_intensity: str  # high, medium, low, minimal
     environmental_sensitivity: str  # high, medium, low
+    
+    def __post_init__(self):
+        _check_code(self, 'development_intensity', INTENSITY_LEVELS)
+        _check_code(self, 'environmental_sensitivity', SENSITIVITY_LEVELS)
+        _freeze_labels(self, 'regions_covered', 'permitted_uses', 'restricted_uses')
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RegionalObjective:
     """Strategic objective for a region."""
     region: str
@@ -146,15 +282,20 @@ class RegionalObjective:
     vision_statement: str
     population_target_2050: float
     gdp_share_target_2050: float
-    priority_sectors: List[str]
-    key_projects: List[str]
-    infrastructure_priorities: List[str]
-    environmental_targets: Dict[str, Any]
-    complementarities: List[str]
-    challenges: List[str]
+    priority_sectors: Sequence[str]
+    key_projects: Sequence[str]
+    infrastructure_priorities: Sequence[str]
+    environmental_targets: Mapping[str, Any]
+    complementarities: Sequence[str]
+    challenges: Sequence[str]
+    
+    def __post_init__(self):
+        _freeze_labels(self, 'priority_sectors', 'key_projects', 'infrastructure_priorities',
+                       'complementarities', 'challenges')
+        object.__setattr__(self, 'environmental_targets', MappingProxyType(dict(self.environmental_targets)))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class InvestmentPriority:
     """Investment priority item."""
     priority_id: str
@@ -163,921 +304,1243 @@ class InvestmentPriority:
     description: str
     estimated_cost_sar_billion: float
     timeline: str
-    regions_benefited: List[str]
-    expected_outcomes: List[str]
-    funding_sources: List[str]
+    regions_benefited: Sequence[str]
+    expected_outcomes: Sequence[str]
+    funding_sources: Sequence[str]
     implementation_agency: str
+    
+    def __post_init__(self):
+        _check_code(self, 'category', INVESTMENT_CATEGORIES)
+        _freeze_labels(self, 'regions_benefited', 'expected_outcomes', 'funding_sources')
 
 
 # =============================================================================
 # NSS VISION BUILDER
 # =============================================================================
 
+# Vision content is fixed, so it is built once at import as frozen
+# records shared by every vision. Statements are single-line strings, so no
+# source indentation leaks into the reports
+_VISION_STATEMENT = (
+    "By 2050, Saudi Arabia will be a thriving, sustainable, and connected "
+    "nation where all regions prosper, cities are livable, natural heritage is preserved, "
+    "and every citizen has access to economic opportunity and quality of life - a global "
+    "model of balanced territorial development in harmony with Vision 2030 aspirations."
+)
+
+_VISION_STATEMENT_AR = (
+    "بحلول عام 2050، ستكون المملكة العربية السعودية دولة مزدهرة ومستدامة "
+    "ومتصلة حيث تزدهر جميع المناطق، وتكون المدن صالحة للعيش، ويُحافظ على التراث الطبيعي، "
+    "ويتمتع كل مواطن بفرص اقتصادية وجودة حياة عالية - نموذج عالمي للتنمية الإقليمية المتوازنة "
+    "بانسجام مع تطلعات رؤية 2030."
+)
+
+_GUIDING_PRINCIPLES: Tuple[GuidingPrinciple, ...] = (
+    GuidingPrinciple(
+        principle="Balanced Regional Development",
+        principle_ar="التنمية الإقليمية المتوازنة",
+        description="Ensure all 13 regions have distinct economic roles and adequate investment to reduce spatial inequality and concentration in top 3 regions."
+    ),
+    GuidingPrinciple(
+        principle="Water Security as Foundation",
+        principle_ar="الأمن المائي كأساس",
+        description="Treat water as the binding constraint for all spatial development decisions. No development approval without sustainable water solution."
+    ),
+    GuidingPrinciple(
+        principle="Connected Corridors",
+        principle_ar="الممرات المتصلة",
+        description="Develop integrated transport and economic corridors linking regions to maximize economic spillovers and reduce isolation."
+    ),
+    GuidingPrinciple(
+        principle="Environmental Sustainability",
+        principle_ar="الاستدامة البيئية",
+        description="Protect 30% of land and sea by 2030, mainstream climate resilience, and achieve net-zero domestic emissions by 2060."
+    ),
+    GuidingPrinciple(
+        principle="Compact Urban Form",
+        principle_ar="الشكل الحضري المدمج",
+        description="Promote compact, mixed-use urban development around transit nodes to reduce sprawl, car dependency, and infrastructure costs."
+    ),
+    GuidingPrinciple(
+        principle="Heritage Integration",
+        principle_ar="التكامل مع التراث",
+        description="Preserve and celebrate Saudi cultural heritage as asset for tourism, identity, and community wellbeing."
+    ),
+    GuidingPrinciple(
+        principle="Adaptive Planning",
+        principle_ar="التخطيط التكيفي",
+        description="Design spatial strategies flexible enough to accommodate multiple future scenarios including climate stress and energy transition."
+    ),
+    GuidingPrinciple(
+        principle="Implementation Focus",
+        principle_ar="التركيز على التنفيذ",
+        description="Every spatial policy must have clear accountability, funding mechanism, timeline, and monitoring indicators."
+    )
+)
+
+_STRATEGIC_OBJECTIVES: Tuple[StrategicObjective, ...] = (
+    StrategicObjective(
+        id="SO1",
+        objective="Polycentric Urban Network",
+        description="Develop 5 national-tier cities (Riyadh, Jeddah, Dammam, NEOM, Makkah) and 15 regional-tier cities as balanced growth poles",
+        target_2050="Reduce top-3 regional population concentration from 64% to 55%",
+        kpis=("Regional population share", "Urban primacy ratio", "Inter-city connectivity index")
+    ),
+    StrategicObjective(
+        id="SO2",
+        objective="Integrated Economic Corridors",
+        description="Establish 5 major economic corridors connecting all regions with multimodal transport and economic activity",
+        target_2050="100% of regions within 4 hours of a national corridor",
+        kpis=("Corridor GDP contribution", "Freight volumes", "Journey times")
+    ),
+    StrategicObjective(
+        id="SO3",
+        objective="Sustainable Water Management",
+        description="Achieve water security through demand reduction, supply diversification, and 100% treated wastewater reuse",
+        target_2050="Reduce per capita water consumption by 40%, eliminate groundwater overextraction",
+        kpis=("Per capita consumption", "Groundwater balance", "Reuse rate", "Desalination share")
+    ),
+    StrategicObjective(
+        id="SO4",
+        objective="Climate-Resilient Territories",
+        description="Build climate adaptation into all spatial development and protect vulnerable areas",
+        target_2050="All development designed for +3°C scenario, 30% protected areas",
+        kpis=("Protected area coverage", "Heat vulnerability index", "Coastal protection coverage")
+    ),
+    StrategicObjective(
+        id="SO5",
+        objective="Economic Diversification Zones",
+        description="Create specialized economic zones aligned with regional competitive advantages",
+        target_2050="Each region has distinct economic specialization with <30% oil dependency",
+        kpis=("Regional diversification index", "Non-oil GDP share", "Private sector employment")
+    ),
+    StrategicObjective(
+        id="SO6",
+        objective="Quality of Life for All",
+        description="Ensure all Saudis have access to quality services, green spaces, and affordable housing",
+        target_2050="9 sqm green space per capita, 30-min access to services, 70% housing affordability",
+        kpis=("Green space per capita", "Service accessibility", "Housing affordability index")
+    ),
+    StrategicObjective(
+        id="SO7",
+        objective="Digital and Physical Connectivity",
+        description="Achieve universal high-speed connectivity and comprehensive transport network",
+        target_2050="100% fiber/5G coverage, all cities on rail network, 6 international hubs",
+        kpis=("Broadband coverage", "Rail network km", "Air connectivity index")
+    )
+)
+
+# Strategic objective id -> position in _STRATEGIC_OBJECTIVES
+_OBJECTIVE_INDEX: Dict[str, int] = {o.id: i for i, o in enumerate(_STRATEGIC_OBJECTIVES)}
+
+_VISION2030_ALIGNMENT: Tuple[str, ...] = (
+    "Vibrant Society: Quality of life, heritage preservation, social development",
+    "Thriving Economy: Economic diversification, private sector growth, tourism",
+    "Ambitious Nation: Effective governance, implementation excellence, global positioning"
+)
+
+
+@lru_cache(maxsize=1)
+def _build_vision() -> NSSVision:
+    """Build the complete NSS Vision (once per process; callers share it)."""
+    logger.debug("NSS Vision built")
+    
+    return NSSVision(
+        vision_statement=_VISION_STATEMENT,
+        
+        vision_statement_ar=_VISION_STATEMENT_AR,
+        
+        time_horizon=2050,
+        
+        guiding_principles=_GUIDING_PRINCIPLES,
+        
+        strategic_objectives=_STRATEGIC_OBJECTIVES,
+        
+        alignment_with_vision2030=_VISION2030_ALIGNMENT
+    )
+
+
+# Bilingual vision fields: (English key, Arabic key). Other text is English only
+_BILINGUAL_FIELDS = (
+    ("vision_statement", "vision_statement_ar"),
+    ("principle", "principle_ar")
+)
+VISION_LANGUAGES = ('both', 'en', 'ar')
+
+
+def _localize(record: Dict[str, Any], lang: str) -> Dict[str, Any]:
+    """Drop the other language's half of each bilingual field in record."""
+    if lang != 'both':
+        for en_key, ar_key in _BILINGUAL_FIELDS:
+            if en_key in record:
+                del record[ar_key if lang == 'en' else en_key]
+    return record
+
+
+@lru_cache(maxsize=len(VISION_LANGUAGES))
+def _vision_json(lang: str) -> bytes:
+    """The NSS Vision as compact UTF-8 JSON, encoded once per language and process."""
+    vision = _build_vision()
+    payload = _localize({
+        "vision_statement": vision.vision_statement,
+        "vision_statement_ar": vision.vision_statement_ar,
+        "time_horizon": vision.time_horizon,
+        "guiding_principles": [_localize(asdict(p), lang) for p in vision.guiding_principles],
+        "strategic_objectives": [asdict(o) for o in vision.strategic_objectives],
+        "alignment_with_vision2030": vision.alignment_with_vision2030
+    }, lang)
+    # Arabic is kept as UTF-8 rather than \uXXXX escapes
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
 class NSSVisionBuilder:
     """
     Builds the NSS Vision, Principles and Strategic Objectives.
+    
+    The vision is fixed and built once per process, so every builder shares it.
     """
     
     def __init__(self):
         """Initialize vision builder."""
-        self.vision = self._build_vision()
-        logger.info("NSS Vision Builder initialized")
-    
-    def _build_vision(self) -> NSSVision:
-        """Build the complete NSS Vision."""
-        
-        return NSSVision(
-            vision_statement="""By 2050, Saudi Arabia will be a thriving, sustainable, and connected 
-            nation where all regions prosper, cities are livable, natural heritage is preserved, 
-            and every citizen has access to economic opportunity and quality of life - a global 
-            model of balanced territorial development in harmony with Vision 2030 aspirations.""",
-            
-            vision_statement_ar="""بحلول عام 2050، ستكون المملكة العربية السعودية دولة مزدهرة ومستدامة 
-            ومتصلة حيث تزدهر جميع المناطق، وتكون المدن صالحة للعيش، ويُحافظ على التراث الطبيعي، 
-            ويتمتع كل مواطن بفرص اقتصادية وجودة حياة عالية - نموذج عالمي للتنمية الإقليمية المتوازنة 
-            بانسجام مع تطلعات رؤية 2030.""",
-            
-            time_horizon=2050,
-            
-            guiding_principles=[
-                {
-                    "principle": "Balanced Regional Development",
-                    "principle_ar": "التنمية الإقليمية المتوازنة",
-                    "description": "Ensure all 13 regions have distinct economic roles and adequate investment to reduce spatial inequality and concentration in top 3 regions."
-                },
-                {
-                    "principle": "Water Security as Foundation",
-                    "principle_ar": "الأمن المائي كأساس",
-                    "description": "Treat water as the binding constraint for all spatial development decisions. No development approval without sustainable water solution."
-                },
-                {
-                    "principle": "Connected Corridors",
-                    "principle_ar": "الممرات المتصلة",
-                    "description": "Develop integrated transport and economic corridors linking regions to maximize economic spillovers and reduce isolation."
-                },
-                {
-                    "principle": "Environmental Sustainability",
-                    "principle_ar": "الاستدامة البيئية",
-                    "description": "Protect 30% of land and sea by 2030, mainstream climate resilience, and achieve net-zero domestic emissions by 2060."
-                },
-                {
-                    "principle": "Compact Urban Form",
-                    "principle_ar": "الشكل الحضري المدمج",
-                    "description": "Promote compact, mixed-use urban development around transit nodes to reduce sprawl, car dependency, and infrastructure costs."
-                },
-                {
-                    "principle": "Heritage Integration",
-                    "principle_ar": "التكامل مع التراث",
-                    "description": "Preserve and celebrate Saudi cultural heritage as asset for tourism, identity, and community wellbeing."
-                },
-                {
-                    "principle": "Adaptive Planning",
-                    "principle_ar": "التخطيط التكيفي",
-                    "description": "Design spatial strategies flexible enough to accommodate multiple future scenarios including climate stress and energy transition."
-                },
-                {
-                    "principle": "Implementation Focus",
-                    "principle_ar": "التركيز على التنفيذ",
-                    "description": "Every spatial policy must have clear accountability, funding mechanism, timeline, and monitoring indicators."
-                }
-            ],
-            
-            strategic_objectives=[
-                {
-                    "id": "SO1",
-                    "objective": "Polycentric Urban Network",
-                    "description": "Develop 5 national-tier cities (Riyadh, Jeddah, Dammam, NEOM, Makkah) and 15 regional-tier cities as balanced growth poles",
-                    "target_2050": "Reduce top-3 regional population concentration from 64% to 55%",
-                    "kpis": ["Regional population share", "Urban primacy ratio", "Inter-city connectivity index"]
-                },
-                {
-                    "id": "SO2",
-                    "objective": "Integrated Economic Corridors",
-                    "description": "Establish 5 major economic corridors connecting all regions with multimodal transport and economic activity",
-                    "target_2050": "100% of regions within 4 hours of a national corridor",
-                    "kpis": ["Corridor GDP contribution", "Freight volumes", "Journey times"]
-                },
-                {
-                    "id": "SO3",
-                    "objective": "Sustainable Water Management",
-                    "description": "Achieve water security through demand reduction, supply diversification, and 100% treated wastewater reuse",
-                    "target_2050": "Reduce per capita water consumption by 40%, eliminate groundwater overextraction",
-                    "kpis": ["Per capita consumption", "Groundwater balance", "Reuse rate", "Desalination share"]
-                },
-                {
-                    "id": "SO4",
-                    "objective": "Climate-Resilient Territories",
-                    "description": "Build climate adaptation into all spatial development and protect vulnerable areas",
-                    "target_2050": "All development designed for +3°C scenario, 30% protected areas",
-                    "kpis": ["Protected area coverage", "Heat vulnerability index", "Coastal protection coverage"]
-                },
-                {
-                    "id": "SO5",
-                    "objective": "Economic Diversification Zones",
-                    "description": "Create specialized economic zones aligned with regional competitive advantages",
-                    "target_2050": "Each region has distinct economic specialization with <30% oil dependency",
-                    "kpis": ["Regional diversification index", "Non-oil GDP share", "Private sector employment"]
-                },
-                {
-                    "id": "SO6",
-                    "objective": "Quality of Life for All",
-                    "description": "Ensure all Saudis have access to quality services, green spaces, and affordable housing",
-                    "target_2050": "9 sqm green space per capita, 30-min access to services, 70% housing affordability",
-                    "kpis": ["Green space per capita", "Service accessibility", "Housing affordability index"]
-                },
-                {
-                    "id": "SO7",
-                    "objective": "Digital and Physical Connectivity",
-                    "description": "Achieve universal high-speed connectivity and comprehensive transport network",
-                    "target_2050": "100% fiber/5G coverage, all cities on rail network, 6 international hubs",
-                    "kpis": ["Broadband coverage", "Rail network km", "Air connectivity index"]
-                }
-            ],
-            
-            alignment_with_vision2030=[
-                "Vibrant Society: Quality of life, heritage preservation, social development",
-                "Thriving Economy: Economic diversification, private sector growth, tourism",
-                "Ambitious Nation: Effective governance, implementation excellence, global positioning"
-            ]
-        )
+        self.vision = _build_vision()
     
     def get_vision(self) -> NSSVision:
         """Return the NSS Vision."""
         return self.vision
+    
+    def get_vision_json(self, lang: str = 'both') -> bytes:
+        """Return the NSS Vision as UTF-8 JSON bytes, e.g. for an API response.
+        
+        lang='en' or 'ar' keeps one language of the bilingual fields (vision
+        statement, principle names); 'both' keeps both.
+        """
+        if lang not in VISION_LANGUAGES:
+            raise ValueError(f"Unsupported vision language: {lang}")
+        return _vision_json(lang)
+    
+    def get_objective(self, objective_id: str) -> Optional[StrategicObjective]:
+        """Return a strategic objective by id (e.g. "SO3"), or None if unknown."""
+        i = _OBJECTIVE_INDEX.get(objective_id)
+        return None if i is None else self.vision.strategic_objectives[i]
 
 
 # =============================================================================
 # SPATIAL STRUCTURE BUILDER
 # =============================================================================
 
-class SpatialStructureBuilder:
-    """
-    Builds the National Spatial Structure: nodes, corridors, and zones.
-    """
+def _group_by(items: Iterable[Any], key: Callable[[Any], Any]) -> Dict[Any, Tuple[Any, ...]]:
+    """Bucket items by key in one pass, keeping their order."""
+    groups: Dict[Any, List[Any]] = {}
+    for item in items:
+        groups.setdefault(key(item), []).append(item)
+    return {k: tuple(v) for k, v in groups.items()}
+
+
+def _column(items: Sequence[Any], name: str, dtype: Any = np.float64) -> np.ndarray:
+    """One attribute of every item as a NumPy array."""
+    return np.fromiter(map(attrgetter(name), items), dtype=dtype, count=len(items))
+
+
+def _codes(items: Sequence[Any], name: str, levels: Tuple[str, ...]) -> np.ndarray:
+    """A coded attribute of every item as int8 positions in its levels."""
+    code = {level: i for i, level in enumerate(levels)}
+    return np.fromiter((code[getattr(item, name)] for item in items), dtype=np.int8, count=len(items))
+
+
+# Short node names used by the corridor definitions
+NODE_ALIASES = {
+    "Dammam": "Dammam-Khobar-Dhahran"
+}
+
+
+# Nodes, corridors and zones are static, so each is built once per process
+# as an immutable tuple and shared by every SpatialStructureBuilder
+
+@lru_cache(maxsize=1)
+def _build_strategic_nodes() -> Tuple[StrategicNode, ...]:
+    """Build the hierarchy of strategic nodes."""
     
-    def __init__(self):
-        """Initialize spatial structure builder."""
-        self.nodes = self._build_strategic_nodes()
-        self.corridors = self._build_development_corridors()
-        self.zones = self._build_functional_zones()
-        logger.info(f"Spatial Structure: {len(self.nodes)} nodes, {len(self.corridors)} corridors, {len(self.zones)} zones")
-    
-    def _build_strategic_nodes(self) -> List[StrategicNode]:
-        """Build the hierarchy of strategic nodes."""
+    nodes = [
+        # TIER 1 - National Strategic Nodes (5)
+        StrategicNode(
+            name="Riyadh",
+            name_ar="الرياض",
+            region="Riyadh",
+            tier=1,
+            node_type="capital",
+            population_2024=8.9,
+            population_2050_target=15.0,
+            primary_functions=["National Capital", "Financial Hub", "Technology Center", "Entertainment Capital"],
+            key_investments=["Riyadh Metro", "King Salman Park", "Sports Boulevard", "Downtown redevelopment"],
+            connectivity_priority="critical",
+            giga_projects=["Diriyah Gate", "Qiddiya", "King Salman Park", "Riyadh Green"],
+            lat=24.7136, lon=46.6753
+        ),
+        StrategicNode(
+            name="Jeddah",
+            name_ar="جدة",
+            region="Makkah",
+            tier=1,
+            node_type="economic",
+            population_2024=4.8,
+            population_2050_target=7.5,
+            primary_functions=["Commercial Gateway", "Red Sea Hub", "Creative Industries", "Logistics"],
+            key_investments=["Jeddah Central", "Port expansion", "Waterfront development", "Metro system"],
+            connectivity_priority="critical",
+            giga_projects=["Jeddah Central", "Obhur Development"],
+            lat=21.4858, lon=39.1925
+        ),
+        StrategicNode(
+            name="Dammam-Khobar-Dhahran",
+            name_ar="الدمام-الخبر-الظهران",
+            region="Eastern Province",
+            tier=1,
+            node_type="industrial",
+            population_2024=5.3,
+            population_2050_target=8.0,
+            primary_functions=["Energy Hub", "Industrial Base", "Technology R&D", "Gulf Gateway"],
+            key_investments=["SPARK", "Industrial diversification", "Waterfront development", "Rail connectivity"],
+            connectivity_priority="critical",
+            giga_projects=["King Salman Energy Park"],
+            lat=26.4207, lon=50.0888
+        ),
+        StrategicNode(
+            name="NEOM",
+            name_ar="نيوم",
+            region="Tabuk",
+            tier=1,
+            node_type="emerging",
+            population_2024=0.05,
+            population_2050_target=2.0,
+            primary_functions=["Future City", "Innovation Hub", "Sustainable Living", "Tourism Destination"],
+            key_investments=["The Line", "Trojena", "Oxagon", "Sindalah"],
+            connectivity_priority="critical",
+            giga_projects=["NEOM - The Line", "Trojena", "Oxagon", "Sindalah"],
+            lat=28.0000, lon=35.0000
+        ),
+        StrategicNode(
+            name="Makkah",
+            name_ar="مكة المكرمة",
+            region="Makkah",
+            tier=1,
+            node_type="tourism",
+            population_2024=2.4,
+            population_2050_target=4.0,
+            primary_functions=["Holy City", "Religious Tourism", "Services Hub"],
+            key_investments=["Haram expansion", "Transport infrastructure", "Hospitality"],
+            connectivity_priority="critical",
+            giga_projects=[],
+            lat=21.3891, lon=39.8579
+        ),
         
-        nodes = [
-            # TIER 1 - National Strategic Nodes (5)
-            StrategicNode(
-                name="Riyadh",
-                name_ar="الرياض",
-                region="Riyadh",
-                tier=1,
-                node_type="capital",
-                population_2024=8.9,
-                population_2050_target=15.0,
-                primary_functions=["National Capital", "Financial Hub", "Technology Center", "Entertainment Capital"],
-                key_investments=["Riyadh Metro", "King Salman Park", "Sports Boulevard", "Downtown redevelopment"],
-                connectivity_priority="critical",
-                giga_projects=["Diriyah Gate", "Qiddiya", "King Salman Park", "Riyadh Green"],
-                lat=24.7136, lon=46.6753
-            ),
-            StrategicNode(
-                name="Jeddah",
-                name_ar="جدة",
-                region="Makkah",
-                tier=1,
-                node_type="economic",
-                population_2024=4.8,
-                population_2050_target=7.5,
-                primary_functions=["Commercial Gateway", "Red Sea Hub", "Creative Industries", "Logistics"],
-                key_investments=["Jeddah Central", "Port expansion", "Waterfront development", "Metro system"],
-                connectivity_priority="critical",
-                giga_projects=["Jeddah Central", "Obhur Development"]
-            ),
-            StrategicNode(
-                name="Dammam-Khobar-Dhahran",
-                name_ar="الدمام-الخبر-الظهران",
-                region="Eastern Province",
-                tier=1,
-                node_type="industrial",
-                population_2024=5.3,
-                population_2050_target=8.0,
-                primary_functions=["Energy Hub", "Industrial Base", "Technology R&D", "Gulf Gateway"],
-                key_investments=["SPARK", "Industrial diversification", "Waterfront development", "Rail connectivity"],
-                connectivity_priority="critical",
-                giga_projects=["King Salman Energy Park"]
-            ),
-            StrategicNode(
-                name="NEOM",
-                name_ar="نيوم",
-                region="Tabuk",
-                tier=1,
-                node_type="emerging",
-                population_2024=0.05,
-                population_2050_target=2.0,
-                primary_functions=["Future City", "Innovation Hub", "Sustainable Living", "Tourism Destination"],
-                key_investments=["The Line", "Trojena", "Oxagon", "Sindalah"],
-                connectivity_priority="critical",
-                giga_projects=["NEOM - The Line", "Trojena", "Oxagon", "Sindalah"]
-            ),
-            StrategicNode(
-                name="Makkah",
-                name_ar="مكة المكرمة",
-                region="Makkah",
-                tier=1,
-                node_type="tourism",
-                population_2024=2.4,
-                population_2050_target=4.0,
-                primary_functions=["Holy City", "Religious Tourism", "Services Hub"],
-                key_investments=["Haram expansion", "Transport infrastructure", "Hospitality"],
-                connectivity_priority="critical",
-                giga_projects=[]
-            ),
-            
-            # TIER 2 - Regional Strategic Nodes (10)
-            StrategicNode(
-                name="Madinah",
-                name_ar="المدينة المنورة",
-                region="Madinah",
-                tier=2,
-                node_type="tourism",
-                population_2024=1.5,
-                population_2050_target=2.8,
-                primary_functions=["Holy City", "Cultural Tourism", "Knowledge Hub"],
-                key_investments=["Prophet's Mosque surroundings", "AlUla connectivity", "University expansion"],
-                connectivity_priority="high",
-                giga_projects=["AlUla Development"]
-            ),
-            StrategicNode(
-                name="Tabuk City",
-                name_ar="تبوك",
-                region="Tabuk",
-                tier=2,
-                node_type="emerging",
-                population_2024=0.7,
-                population_2050_target=1.5,
-                primary_functions=["NEOM Gateway", "Agriculture", "Tourism Base"],
-                key_investments=["Airport expansion", "NEOM connectivity", "Agricultural modernization"],
-                connectivity_priority="high",
-                giga_projects=[]
-            ),
-            StrategicNode(
-                name="Abha",
-                name_ar="أبها",
-                region="Asir",
-                tier=2,
-                node_type="tourism",
-                population_2024=1.2,
-                population_2050_target=2.0,
-                primary_functions=["Mountain Tourism", "Regional Capital", "Agriculture"],
-                key_investments=["Tourism infrastructure", "Airport expansion", "Cable car network"],
-                connectivity_priority="medium",
-                giga_projects=["Asir Development"]
-            ),
-            StrategicNode(
-                name="Jubail",
-                name_ar="الجبيل",
-                region="Eastern Province",
-                tier=2,
-                node_type="industrial",
-                population_2024=0.5,
-                population_2050_target=1.2,
-                primary_functions=["Industrial City", "Petrochemicals", "Manufacturing"],
-                key_investments=["Industrial expansion", "Green hydrogen", "Desalination"],
-                connectivity_priority="high",
-                giga_projects=[]
-            ),
-            StrategicNode(
-                name="Yanbu",
-                name_ar="ينبع",
-                region="Madinah",
-                tier=2,
-                node_type="industrial",
-                population_2024=0.3,
-                population_2050_target=0.8,
-                primary_functions=["Industrial Port", "Petrochemicals", "Red Sea Access"],
-                key_investments=["Port expansion", "Industrial zones", "Renewable energy"],
-                connectivity_priority="high",
-                giga_projects=[]
-            ),
-            StrategicNode(
-                name="Buraydah",
-                name_ar="بريدة",
-                region="Al-Qassim",
-                tier=2,
-                node_type="economic",
-                population_2024=0.8,
-                population_2050_target=1.2,
-                primary_functions=["Agricultural Hub", "Food Processing", "Logistics"],
-                key_investments=["Water efficiency", "Agri-tech", "Solar energy", "Food processing"],
-                connectivity_priority="medium",
-                giga_projects=[]
-            ),
-            StrategicNode(
-                name="Hail",
-                name_ar="حائل",
-                region="Hail",
-                tier=2,
-                node_type="economic",
-                population_2024=0.5,
-                population_2050_target=0.8,
-                primary_functions=["Agricultural Center", "Mining Gateway", "Heritage Tourism"],
-                key_investments=["Mining development", "Agricultural modernization", "Tourism"],
-                connectivity_priority="medium",
-                giga_projects=[]
-            ),
-            StrategicNode(
-                name="Jazan City",
-                name_ar="جيزان",
-                region="Jazan",
-                tier=2,
-                node_type="industrial",
-                population_2024=0.5,
-                population_2050_target=0.9,
-                primary_functions=["Economic City", "Agriculture", "Fishing"],
-                key_investments=["Economic city completion", "Port development", "Agriculture"],
-                connectivity_priority="medium",
-                giga_projects=["Jazan Economic City"]
-            ),
-            StrategicNode(
-                name="Arar",
-                name_ar="عرعر",
-                region="Northern Borders",
-                tier=2,
-                node_type="industrial",
-                population_2024=0.3,
-                population_2050_target=0.6,
-                primary_functions=["Mining Hub", "Renewable Energy", "Border Trade"],
-                key_investments=["Phosphate processing", "Solar farms", "Cross-border infrastructure"],
-                connectivity_priority="medium",
-                giga_projects=["Waad Al-Shamal"]
-            ),
-            StrategicNode(
-                name="Sakaka",
-                name_ar="سكاكا",
-                region="Al-Jouf",
-                tier=2,
-                node_type="economic",
-                population_2024=0.35,
-                population_2050_target=0.6,
-                primary_functions=["Olive Capital", "Renewable Energy", "Heritage Tourism"],
-                key_investments=["Renewable energy", "Agricultural efficiency", "Heritage sites"],
-                connectivity_priority="medium",
-                giga_projects=[]
-            ),
-            
-            # TIER 3 - Sub-Regional Nodes (5 examples)
-            StrategicNode(
-                name="Al-Kharj",
-                name_ar="الخرج",
-                region="Riyadh",
-                tier=3,
-                node_type="economic",
-                population_2024=0.4,
-                population_2050_target=0.7,
-                primary_functions=["Agricultural Processing", "Industrial Zone", "Riyadh Satellite"],
-                key_investments=["Industrial development", "Riyadh connectivity"],
-                connectivity_priority="medium",
-                giga_projects=[]
-            ),
-            StrategicNode(
-                name="Taif",
-                name_ar="الطائف",
-                region="Makkah",
-                tier=3,
-                node_type="tourism",
-                population_2024=0.7,
-                population_2050_target=1.0,
-                primary_functions=["Summer Resort", "Agriculture", "Heritage"],
-                key_investments=["Tourism development", "Rose cultivation", "Heritage preservation"],
-                connectivity_priority="medium",
-                giga_projects=[]
-            ),
-            StrategicNode(
-                name="AlUla",
-                name_ar="العلا",
-                region="Madinah",
-                tier=3,
-                node_type="tourism",
-                population_2024=0.05,
-                population_2050_target=0.15,
-                primary_functions=["Heritage Tourism", "Cultural Destination", "Arts"],
-                key_investments=["Heritage development", "Airport", "Hospitality"],
-                connectivity_priority="high",
-                giga_projects=["AlUla Development"]
-            ),
-            StrategicNode(
-                name="Najran",
-                name_ar="نجران",
-                region="Najran",
-                tier=3,
-                node_type="economic",
-                population_2024=0.4,
-                population_2050_target=0.55,
-                primary_functions=["Heritage City", "Agriculture", "Border Trade"],
-                key_investments=["Heritage preservation", "Agricultural development"],
-                connectivity_priority="low",
-                giga_projects=[]
-            ),
-            StrategicNode(
-                name="Al-Baha",
-                name_ar="الباحة",
-                region="Al-Baha",
-                tier=3,
-                node_type="tourism",
-                population_2024=0.25,
-                population_2050_target=0.35,
-                primary_functions=["Mountain Tourism", "Heritage", "Agriculture"],
-                key_investments=["Tourism infrastructure", "Heritage preservation"],
-                connectivity_priority="low",
-                giga_projects=[]
-            )
-        ]
+        # TIER 2 - Regional Strategic Nodes (10)
+        StrategicNode(
+            name="Madinah",
+            name_ar="المدينة المنورة",
+            region="Madinah",
+            tier=2,
+            node_type="tourism",
+            population_2024=1.5,
+            population_2050_target=2.8,
+            primary_functions=["Holy City", "Cultural Tourism", "Knowledge Hub"],
+            key_investments=["Prophet's Mosque surroundings", "AlUla connectivity", "University expansion"],
+            connectivity_priority="high",
+            giga_projects=["AlUla Development"],
+            lat=24.5247, lon=39.5692
+        ),
+        StrategicNode(
+            name="Tabuk City",
+            name_ar="تبوك",
+            region="Tabuk",
+            tier=2,
+            node_type="emerging",
+            population_2024=0.7,
+            population_2050_target=1.5,
+            primary_functions=["NEOM Gateway", "Agriculture", "Tourism Base"],
+            key_investments=["Airport expansion", "NEOM connectivity", "Agricultural modernization"],
+            connectivity_priority="high",
+            giga_projects=[],
+            lat=28.3835, lon=36.5662
+        ),
+        StrategicNode(
+            name="Abha",
+            name_ar="أبها",
+            region="Asir",
+            tier=2,
+            node_type="tourism",
+            population_2024=1.2,
+            population_2050_target=2.0,
+            primary_functions=["Mountain Tourism", "Regional Capital", "Agriculture"],
+            key_investments=["Tourism infrastructure", "Airport expansion", "Cable car network"],
+            connectivity_priority="medium",
+            giga_projects=["Asir Development"],
+            lat=18.2164, lon=42.5053
+        ),
+        StrategicNode(
+            name="Jubail",
+            name_ar="الجبيل",
+            region="Eastern Province",
+            tier=2,
+            node_type="industrial",
+            population_2024=0.5,
+            population_2050_target=1.2,
+            primary_functions=["Industrial City", "Petrochemicals", "Manufacturing"],
+            key_investments=["Industrial expansion", "Green hydrogen", "Desalination"],
+            connectivity_priority="high",
+            giga_projects=[],
+            lat=27.0046, lon=49.6225
+        ),
+        StrategicNode(
+            name="Yanbu",
+            name_ar="ينبع",
+            region="Madinah",
+            tier=2,
+            node_type="industrial",
+            population_2024=0.3,
+            population_2050_target=0.8,
+            primary_functions=["Industrial Port", "Petrochemicals", "Red Sea Access"],
+            key_investments=["Port expansion", "Industrial zones", "Renewable energy"],
+            connectivity_priority="high",
+            giga_projects=[],
+            lat=24.0895, lon=38.0618
+        ),
+        StrategicNode(
+            name="Buraydah",
+            name_ar="بريدة",
+            region="Al-Qassim",
+            tier=2,
+            node_type="economic",
+            population_2024=0.8,
+            population_2050_target=1.2,
+            primary_functions=["Agricultural Hub", "Food Processing", "Logistics"],
+            key_investments=["Water efficiency", "Agri-tech", "Solar energy", "Food processing"],
+            connectivity_priority="medium",
+            giga_projects=[],
+            lat=26.3260, lon=43.9750
+        ),
+        StrategicNode(
+            name="Hail",
+            name_ar="حائل",
+            region="Hail",
+            tier=2,
+            node_type="economic",
+            population_2024=0.5,
+            population_2050_target=0.8,
+            primary_functions=["Agricultural Center", "Mining Gateway", "Heritage Tourism"],
+            key_investments=["Mining development", "Agricultural modernization", "Tourism"],
+            connectivity_priority="medium",
+            giga_projects=[],
+            lat=27.5114, lon=41.7208
+        ),
+        StrategicNode(
+            name="Jazan City",
+            name_ar="جيزان",
+            region="Jazan",
+            tier=2,
+            node_type="industrial",
+            population_2024=0.5,
+            population_2050_target=0.9,
+            primary_functions=["Economic City", "Agriculture", "Fishing"],
+            key_investments=["Economic city completion", "Port development", "Agriculture"],
+            connectivity_priority="medium",
+            giga_projects=["Jazan Economic City"],
+            lat=16.8894, lon=42.5511
+        ),
+        StrategicNode(
+            name="Arar",
+            name_ar="عرعر",
+            region="Northern Borders",
+            tier=2,
+            node_type="industrial",
+            population_2024=0.3,
+            population_2050_target=0.6,
+            primary_functions=["Mining Hub", "Renewable Energy", "Border Trade"],
+            key_investments=["Phosphate processing", "Solar farms", "Cross-border infrastructure"],
+            connectivity_priority="medium",
+            giga_projects=["Waad Al-Shamal"],
+            lat=30.9753, lon=41.0381
+        ),
+        StrategicNode(
+            name="Sakaka",
+            name_ar="سكاكا",
+            region="Al-Jouf",
+            tier=2,
+            node_type="economic",
+            population_2024=0.35,
+            population_2050_target=0.6,
+            primary_functions=["Olive Capital", "Renewable Energy", "Heritage Tourism"],
+            key_investments=["Renewable energy", "Agricultural efficiency", "Heritage sites"],
+            connectivity_priority="medium",
+            giga_projects=[],
+            lat=29.9697, lon=40.2064
+        ),
         
-        return nodes
+        # TIER 3 - Sub-Regional Nodes (5 examples)
+        StrategicNode(
+            name="Al-Kharj",
+            name_ar="الخرج",
+            region="Riyadh",
+            tier=3,
+            node_type="economic",
+            population_2024=0.4,
+            population_2050_target=0.7,
+            primary_functions=["Agricultural Processing", "Industrial Zone", "Riyadh Satellite"],
+            key_investments=["Industrial development", "Riyadh connectivity"],
+            connectivity_priority="medium",
+            giga_projects=[],
+            lat=24.1556, lon=47.3120
+        ),
+        StrategicNode(
+            name="Taif",
+            name_ar="الطائف",
+            region="Makkah",
+            tier=3,
+            node_type="tourism",
+            population_2024=0.7,
+            population_2050_target=1.0,
+            primary_functions=["Summer Resort", "Agriculture", "Heritage"],
+            key_investments=["Tourism development", "Rose cultivation", "Heritage preservation"],
+            connectivity_priority="medium",
+            giga_projects=[],
+            lat=21.2703, lon=40.4158
+        ),
+        StrategicNode(
+            name="AlUla",
+            name_ar="العلا",
+            region="Madinah",
+            tier=3,
+            node_type="tourism",
+            population_2024=0.05,
+            population_2050_target=0.15,
+            primary_functions=["Heritage Tourism", "Cultural Destination", "Arts"],
+            key_investments=["Heritage development", "Airport", "Hospitality"],
+            connectivity_priority="high",
+            giga_projects=["AlUla Development"],
+            lat=26.6084, lon=37.9232
+        ),
+        StrategicNode(
+            name="Najran",
+            name_ar="نجران",
+            region="Najran",
+            tier=3,
+            node_type="economic",
+            population_2024=0.4,
+            population_2050_target=0.55,
+            primary_functions=["Heritage City", "Agriculture", "Border Trade"],
+            key_investments=["Heritage preservation", "Agricultural development"],
+            connectivity_priority="low",
+            giga_projects=[],
+            lat=17.4917, lon=44.1322
+        ),
+        StrategicNode(
+            name="Al-Baha",
+            name_ar="الباحة",
+            region="Al-Baha",
+            tier=3,
+            node_type="tourism",
+            population_2024=0.25,
+            population_2050_target=0.35,
+            primary_functions=["Mountain Tourism", "Heritage", "Agriculture"],
+            key_investments=["Tourism infrastructure", "Heritage preservation"],
+            connectivity_priority="low",
+            giga_projects=[],
+            lat=20.0129, lon=41.4677
+        )
+    ]
+    
+    logger.info("Spatial Structure: {} strategic nodes", len(nodes))
+    return tuple(nodes)
+
+
+@lru_cache(maxsize=1)
+def _build_development_corridors() -> Tuple[DevelopmentCorridor, ...]:
+    """Build the development corridors."""
     
-    def _build_development_corridors(self) -> List[DevelopmentCorridor]:
-        """Build the development corridors."""
+    corridors = [
+        # CENTRAL CORRIDOR - Riyadh hub connectivity
+        DevelopmentCorridor(
+            name="Central Economic Corridor",
+            name_ar="الممر الاقتصادي الأوسط",
+            corridor_type="economic",
+            origin_node="Riyadh",
+            destination_node="Dammam",
+            intermediate_nodes=["Al-Kharj"],
+            length_km=450,
+            infrastructure_components=["High-speed rail", "Highway upgrade", "Fiber backbone", "Industrial zones"],
+            economic_sectors=["Finance", "Technology", "Logistics", "Manufacturing"],
+            investment_sar_billion=85,
+            priority="critical",
+            timeline="2025-2035"
+        ),
         
-        corridors = [
-            # CENTRAL CORRIDOR - Riyadh hub connectivity
-            DevelopmentCorridor(
-                name="Central Economic Corridor",
-                name_ar="الممر الاقتصادي الأوسط",
-                corridor_type="economic",
-                origin_node="Riyadh",
-                destination_node="Dammam",
-                intermediate_nodes=["Al-Kharj"],
-                length_km=450,
-                infrastructure_components=["High-speed rail", "Highway upgrade", "Fiber backbone", "Industrial zones"],
-                economic_sectors=["Finance", "Technology", "Logistics", "Manufacturing"],
-                investment_sar_billion=85,
-                priority="critical",
-                timeline="2025-2035"
-            ),
-            
-            # RED SEA CORRIDOR - Western coast development
-            DevelopmentCorridor(
-                name="Red Sea Tourism Corridor",
-                name_ar="ممر البحر الأحمر السياحي",
-                corridor_type="tourism",
-                origin_node="NEOM",
-                destination_node="Jeddah",
-                intermediate_nodes=["Tabuk City", "AlUla", "Yanbu"],
-                length_km=1200,
-                infrastructure_components=["Coastal highway", "Rail link", "Airports", "Marinas"],
-                economic_sectors=["Tourism", "Hospitality", "Entertainment", "Creative Industries"],
-                investment_sar_billion=150,
-                priority="critical",
-                timeline="2025-2040"
-            ),
-            
-            # HOLY CITIES CORRIDOR
-            DevelopmentCorridor(
-                name="Holy Cities Corridor",
-                name_ar="ممر المدن المقدسة",
-                corridor_type="mixed",
-                origin_node="Makkah",
-                destination_node="Madinah",
-                intermediate_nodes=["Jeddah"],
-                length_km=450,
-                infrastructure_components=["Haramain Rail (existing)", "Highway upgrade", "Pilgrim services"],
-                economic_sectors=["Religious Tourism", "Hospitality", "Services", "Real Estate"],
-                investment_sar_billion=40,
-                priority="critical",
-                timeline="2025-2030"
-            ),
-            
-            # NORTHERN MINING CORRIDOR
-            DevelopmentCorridor(
-                name="Northern Mining & Energy Corridor",
-                name_ar="ممر التعدين والطاقة الشمالي",
-                corridor_type="logistics",
-                origin_node="Arar",
-                destination_node="Jubail",
-                intermediate_nodes=["Sakaka", "Hail", "Buraydah"],
-                length_km=1100,
-                infrastructure_components=["Freight rail", "Mining roads", "Power grid", "Solar farms"],
-                economic_sectors=["Mining", "Renewable Energy", "Logistics", "Processing"],
-                investment_sar_billion=95,
-                priority="high",
-                timeline="2025-2040"
-            ),
-            
-            # SOUTHERN DEVELOPMENT CORRIDOR
-            DevelopmentCorridor(
-                name="Southern Tourism & Agriculture Corridor",
-                name_ar="ممر السياحة والزراعة الجنوبي",
-                corridor_type="mixed",
-                origin_node="Abha",
-                destination_node="Jazan City",
-                intermediate_nodes=["Al-Baha", "Najran"],
-                length_km=600,
-                infrastructure_components=["Mountain roads", "Regional airports", "Tourism infrastructure"],
-                economic_sectors=["Tourism", "Agriculture", "Coffee", "Handicrafts"],
-                investment_sar_billion=35,
-                priority="medium",
-                timeline="2030-2045"
-            ),
-            
-            # LAND BRIDGE - Red Sea to Gulf
-            DevelopmentCorridor(
-                name="Trans-Arabia Land Bridge",
-                name_ar="الجسر البري عبر الجزيرة",
-                corridor_type="logistics",
-                origin_node="Jeddah",
-                destination_node="Dammam",
-                intermediate_nodes=["Riyadh"],
-                length_km=1200,
-                infrastructure_components=["Freight rail", "Container terminals", "Dry ports", "Logistics hubs"],
-                economic_sectors=["Logistics", "Trade", "Manufacturing", "E-commerce"],
-                investment_sar_billion=120,
-                priority="critical",
-                timeline="2025-2035"
-            )
-        ]
+        # RED SEA CORRIDOR - Western coast development
+        DevelopmentCorridor(
+            name="Red Sea Tourism Corridor",
+            name_ar="ممر البحر الأحمر السياحي",
+            corridor_type="tourism",
+            origin_node="NEOM",
+            destination_node="Jeddah",
+            intermediate_nodes=["Tabuk City", "AlUla", "Yanbu"],
+            length_km=1200,
+            infrastructure_components=["Coastal highway", "Rail link", "Airports", "Marinas"],
+            economic_sectors=["Tourism", "Hospitality", "Entertainment", "Creative Industries"],
+            investment_sar_billion=150,
+            priority="critical",
+            timeline="2025-2040"
+        ),
+        
+        # HOLY CITIES CORRIDOR
+        DevelopmentCorridor(
+            name="Holy Cities Corridor",
+            name_ar="ممر المدن المقدسة",
+            corridor_type="mixed",
+            origin_node="Makkah",
+            destination_node="Madinah",
+            intermediate_nodes=["Jeddah"],
+            length_km=450,
+            infrastructure_components=["Haramain Rail (existing)", "Highway upgrade", "Pilgrim services"],
+            economic_sectors=["Religious Tourism", "Hospitality", "Services", "Real Estate"],
+            investment_sar_billion=40,
+            priority="critical",
+            timeline="2025-2030"
+        ),
+        
+        # NORTHERN MINING CORRIDOR
+        DevelopmentCorridor(
+            name="Northern Mining & Energy Corridor",
+            name_ar="ممر التعدين والطاقة الشمالي",
+            corridor_type="logistics",
+            origin_node="Arar",
+            destination_node="Jubail",
+            intermediate_nodes=["Sakaka", "Hail", "Buraydah"],
+            length_km=1100,
+            infrastructure_components=["Freight rail", "Mining roads", "Power grid", "Solar farms"],
+            economic_sectors=["Mining", "Renewable Energy", "Logistics", "Processing"],
+            investment_sar_billion=95,
+            priority="high",
+            timeline="2025-2040"
+        ),
         
-        return corridors
+        # SOUTHERN DEVELOPMENT CORRIDOR
+        DevelopmentCorridor(
+            name="Southern Tourism & Agriculture Corridor",
+            name_ar="ممر السياحة والزراعة الجنوبي",
+            corridor_type="mixed",
+            origin_node="Abha",
+            destination_node="Jazan City",
+            intermediate_nodes=["Al-Baha", "Najran"],
+            length_km=600,
+            infrastructure_components=["Mountain roads", "Regional airports", "Tourism infrastructure"],
+            economic_sectors=["Tourism", "Agriculture", "Coffee", "Handicrafts"],
+            investment_sar_billion=35,
+            priority="medium",
+            timeline="2030-2045"
+        ),
+        
+        # LAND BRIDGE - Red Sea to Gulf
+        DevelopmentCorridor(
+            name="Trans-Arabia Land Bridge",
+            name_ar="الجسر البري عبر الجزيرة",
+            corridor_type="logistics",
+            origin_node="Jeddah",
+            destination_node="Dammam",
+            intermediate_nodes=["Riyadh"],
+            length_km=1200,
+            infrastructure_components=["Freight rail", "Container terminals", "Dry ports", "Logistics hubs"],
+            economic_sectors=["Logistics", "Trade", "Manufacturing", "E-commerce"],
+            investment_sar_billion=120,
+            priority="critical",
+            timeline="2025-2035"
+        )
+    ]
+    
+    logger.info("Spatial Structure: {} development corridors", len(corridors))
+    return tuple(corridors)
+
+
+@lru_cache(maxsize=1)
+def _build_functional_zones() -> Tuple[FunctionalZone, ...]:
+    """Build functional zones."""
     
-    def _build_functional_zones(self) -> List[FunctionalZone]:
-        """Build functional zones."""
+    zones = [
+        # URBAN GROWTH ZONES
+        FunctionalZone(
+            zone_name="Riyadh Metropolitan Growth Zone",
+            zone_type="urban_growth",
+            description="Primary national growth pole with controlled expansion",
+            area_km2=6500,
+            regions_covered=["Riyadh"],
+            permitted_uses=["Residential", "Commercial", "Industrial", "Services", "Green spaces"],
+            restricted_uses=["Heavy industry", "Mining", "Large-scale agriculture"],
+            development_intensity="high",
+            environmental_sensitivity="medium"
+        ),
+        FunctionalZone(
+            zone_name="Jeddah-Makkah Urban Agglomeration",
+            zone_type="urban_growth",
+            description="Western urban corridor with tourism and commerce focus",
+            area_km2=4500,
+            regions_covered=["Makkah"],
+            permitted_uses=["Residential", "Commercial", "Tourism", "Services"],
+            restricted_uses=["Heavy industry", "Polluting activities"],
+            development_intensity="high",
+            environmental_sensitivity="high"
+        ),
+        FunctionalZone(
+            zone_name="Eastern Province Industrial-Urban Zone",
+            zone_type="urban_growth",
+            description="Polycentric industrial and residential development",
+            area_km2=5000,
+            regions_covered=["Eastern Province"],
+            permitted_uses=["Industrial", "Residential", "Commercial", "Port facilities"],
+            restricted_uses=["Large-scale agriculture"],
+            development_intensity="high",
+            environmental_sensitivity="high"
+        ),
         
-        zones = [
-            # URBAN GROWTH ZONES
-            FunctionalZone(
-                zone_name="Riyadh Metropolitan Growth Zone",
-                zone_type="urban_growth",
-                description="Primary national growth pole with controlled expansion",
-                area_km2=6500,
-                regions_covered=["Riyadh"],
-                permitted_uses=["Residential", "Commercial", "Industrial", "Services", "Green spaces"],
-                restricted_uses=["Heavy industry", "Mining", "Large-scale agriculture"],
-                development_intensity="high",
-                environmental_sensitivity="medium"
-            ),
-            FunctionalZone(
-                zone_name="Jeddah-Makkah Urban Agglomeration",
-                zone_type="urban_growth",
-                description="Western urban corridor with tourism and commerce focus",
-                area_km2=4500,
-                regions_covered=["Makkah"],
-                permitted_uses=["Residential", "Commercial", "Tourism", "Services"],
-                restricted_uses=["Heavy industry", "Polluting activities"],
-                development_intensity="high",
-                environmental_sensitivity="high"
-            ),
-            FunctionalZone(
-                zone_name="Eastern Province Industrial-Urban Zone",
-                zone_type="urban_growth",
-                description="Polycentric industrial and residential development",
-                area_km2=5000,
-                regions_covered=["Eastern Province"],
-                permitted_uses=["Industrial", "Residential", "Commercial", "Port facilities"],
-                restricted_uses=["Large-scale agriculture"],
-                development_intensity="high",
-                environmental_sensitivity="high"
-            ),
-            
-            # INDUSTRIAL ZONES
-            FunctionalZone(
-                zone_name="NEOM Innovation Zone",
-                zone_type="industrial",
-                description="Future technology and sustainable industry hub",
-                area_km2=26500,
-                regions_covered=["Tabuk"],
-                permitted_uses=["Clean technology", "Tourism", "Research", "Sustainable living"],
-                restricted_uses=["Polluting industry", "Traditional energy"],
-                development_intensity="medium",
-                environmental_sensitivity="high"
-            ),
-            FunctionalZone(
-                zone_name="Northern Mining Belt",
-                zone_type="industrial",
-                description="Mining and mineral processing zone",
-                area_km2=35000,
-                regions_covered=["Northern Borders", "Al-Jouf", "Hail"],
-                permitted_uses=["Mining", "Processing", "Renewable energy"],
-                restricted_uses=["Residential (outside designated areas)", "Tourism"],
-                development_intensity="low",
-                environmental_sensitivity="medium"
-            ),
-            
-            # AGRICULTURAL ZONES
-            FunctionalZone(
-                zone_name="Central Agricultural Zone",
-                zone_type="agricultural",
-                description="Modernized agriculture with water efficiency requirements",
-                area_km2=45000,
-                regions_covered=["Al-Qassim", "Riyadh (rural)"],
-                permitted_uses=["Smart agriculture", "Agri-tech", "Food processing"],
-                restricted_uses=["Water-intensive crops", "Urban expansion"],
-                development_intensity="low",
-                environmental_sensitivity="medium"
-            ),
-            FunctionalZone(
-                zone_name="Southern Agricultural Terraces",
-                zone_type="agricultural",
-                description="Mountain agriculture and specialty crops",
-                area_km2=15000,
-                regions_covered=["Asir", "Al-Baha", "Jazan"],
-                permitted_uses=["Traditional agriculture", "Coffee", "Fruit orchards", "Agri-tourism"],
-                restricted_uses=["Industrial agriculture", "Large-scale development"],
-                development_intensity="low",
-                environmental_sensitivity="high"
-            ),
-            
-            # PROTECTED ZONES
-            FunctionalZone(
-                zone_name="Red Sea Marine Protected Area",
-                zone_type="protected",
-                description="Marine conservation with controlled eco-tourism",
-                area_km2=28000,  # Sea area
-                regions_covered=["Tabuk", "Madinah", "Makkah"],
-                permitted_uses=["Conservation", "Research", "Eco-tourism", "Sustainable fishing"],
-                restricted_uses=["Industrial activity", "Large-scale development", "Dredging"],
-                development_intensity="minimal",
-                environmental_sensitivity="high"
-            ),
-            FunctionalZone(
-                zone_name="Asir-Sarawat Protected Highlands",
-                zone_type="protected",
-                description="Mountain ecosystem conservation",
-                area_km2=18000,
-                regions_covered=["Asir", "Al-Baha"],
-                permitted_uses=["Conservation", "Hiking", "Eco-tourism", "Research"],
-                restricted_uses=["Urban development", "Mining", "Industrial activity"],
-                development_intensity="minimal",
-                environmental_sensitivity="high"
-            ),
-            FunctionalZone(
-                zone_name="Empty Quarter Conservation Zone",
-                zone_type="protected",
-                description="Desert ecosystem and cultural landscape protection",
-                area_km2=250000,
-                regions_covered=["Riyadh", "Eastern Province", "Najran"],
-                permitted_uses=["Conservation", "Research", "Controlled tourism", "Renewable energy"],
-                restricted_uses=["Urban development", "Water extraction", "Industrial activity"],
-                development_intensity="minimal",
-                environmental_sensitivity="medium"
-            ),
-            
-            # TOURISM ZONES
-            FunctionalZone(
-                zone_name="AlUla Heritage Tourism Zone",
-                zone_type="tourism",
-                description="World-class heritage and cultural tourism destination",
-                area_km2=22000,
-                regions_covered=["Madinah"],
-                permitted_uses=["Heritage tourism", "Cultural facilities", "Eco-lodges", "Arts"],
-                restricted_uses=["Heavy industry", "Large-scale agriculture", "Mass housing"],
-                development_intensity="low",
-                environmental_sensitivity="high"
-            ),
-            FunctionalZone(
-                zone_name="Red Sea Tourism Development Zone",
-                zone_type="tourism",
-                description="Luxury coastal tourism and eco-resorts",
-                area_km2=34000,  # Including islands
-                regions_covered=["Tabuk", "Madinah"],
-                permitted_uses=["Resort development", "Marinas", "Eco-tourism", "Water sports"],
-                restricted_uses=["Industrial activity", "Mass housing", "Polluting uses"],
-                development_intensity="low",
-                environmental_sensitivity="high"
-            )
-        ]
+        # INDUSTRIAL ZONES
+        FunctionalZone(
+            zone_name="NEOM Innovation Zone",
+            zone_type="industrial",
+            description="Future technology and sustainable industry hub",
+            area_km2=26500,
+            regions_covered=["Tabuk"],
+            permitted_uses=["Clean technology", "Tourism", "Research", "Sustainable living"],
+            restricted_uses=["Polluting industry", "Traditional energy"],
+            development_intensity="medium",
+            environmental_sensitivity="high"
+        ),
+        FunctionalZone(
+            zone_name="Northern Mining Belt",
+            zone_type="industrial",
+            description="Mining and mineral processing zone",
+            area_km2=35000,
+            regions_covered=["Northern Borders", "Al-Jouf", "Hail"],
+            permitted_uses=["Mining", "Processing", "Renewable energy"],
+            restricted_uses=["Residential (outside designated areas)", "Tourism"],
+            development_intensity="low",
+            environmental_sensitivity="medium"
+        ),
+        
+        # AGRICULTURAL ZONES
+        FunctionalZone(
+            zone_name="Central Agricultural Zone",
+            zone_type="agricultural",
+            description="Modernized agriculture with water efficiency requirements",
+            area_km2=45000,
+            regions_covered=["Al-Qassim", "Riyadh (rural)"],
+            permitted_uses=["Smart agriculture", "Agri-tech", "Food processing"],
+            restricted_uses=["Water-intensive crops", "Urban expansion"],
+            development_intensity="low",
+            environmental_sensitivity="medium"
+        ),
+        FunctionalZone(
+            zone_name="Southern Agricultural Terraces",
+            zone_type="agricultural",
+            description="Mountain agriculture and specialty crops",
+            area_km2=15000,
+            regions_covered=["Asir", "Al-Baha", "Jazan"],
+            permitted_uses=["Traditional agriculture", "Coffee", "Fruit orchards", "Agri-tourism"],
+            restricted_uses=["Industrial agriculture", "Large-scale development"],
+            development_intensity="low",
+            environmental_sensitivity="high"
+        ),
         
-        return zones
+        # PROTECTED ZONES
+        FunctionalZone(
+            zone_name="Red Sea Marine Protected Area",
+            zone_type="protected",
+            description="Marine conservation with controlled eco-tourism",
+            area_km2=28000,  # Sea area
+            regions_covered=["Tabuk", "Madinah", "Makkah"],
+            permitted_uses=["Conservation", "Research", "Eco-tourism", "Sustainable fishing"],
+            restricted_uses=["Industrial activity", "Large-scale development", "Dredging"],
+            development_intensity="minimal",
+            environmental_sensitivity="high"
+        ),
+        FunctionalZone(
+            zone_name="Asir-Sarawat Protected Highlands",
+            zone_type="protected",
+            description="Mountain ecosystem conservation",
+            area_km2=18000,
+            regions_covered=["Asir", "Al-Baha"],
+            permitted_uses=["Conservation", "Hiking", "Eco-tourism", "Research"],
+            restricted_uses=["Urban development", "Mining", "Industrial activity"],
+            development_intensity="minimal",
+            environmental_sensitivity="high"
+        ),
+        FunctionalZone(
+            zone_name="Empty Quarter Conservation Zone",
+            zone_type="protected",
+            description="Desert ecosystem and cultural landscape protection",
+            area_km2=250000,
+            regions_covered=["Riyadh", "Eastern Province", "Najran"],
+            permitted_uses=["Conservation", "Research", "Controlled tourism", "Renewable energy"],
+            restricted_uses=["Urban development", "Water extraction", "Industrial activity"],
+            development_intensity="minimal",
+            environmental_sensitivity="medium"
+        ),
+        
+        # TOURISM ZONES
+        FunctionalZone(
+            zone_name="AlUla Heritage Tourism Zone",
+            zone_type="tourism",
+            description="World-class heritage and cultural tourism destination",
+            area_km2=22000,
+            regions_covered=["Madinah"],
+            permitted_uses=["Heritage tourism", "Cultural facilities", "Eco-lodges", "Arts"],
+            restricted_uses=["Heavy industry", "Large-scale agriculture", "Mass housing"],
+            development_intensity="low",
+            environmental_sensitivity="high"
+        ),
+        FunctionalZone(
+            zone_name="Red Sea Tourism Development Zone",
+            zone_type="tourism",
+            description="Luxury coastal tourism and eco-resorts",
+            area_km2=34000,  # Including islands
+            regions_covered=["Tabuk", "Madinah"],
+            permitted_uses=["Resort development", "Marinas", "Eco-tourism", "Water sports"],
+            restricted_uses=["Industrial activity", "Mass housing", "Polluting uses"],
+            development_intensity="low",
+            environmental_sensitivity="high"
+        )
+    ]
+    
+    logger.info("Spatial Structure: {} functional zones", len(zones))
+    return tuple(zones)
+
+
+class SpatialStructureBuilder:
+    """
+    Builds the National Spatial Structure: nodes, corridors, and zones.
+    
+    Each facet, and every index or column derived from it, is built on first
+    access, so callers only pay for what they use. The structure is fixed, so
+    the builder is a process-wide singleton and those caches are shared.
+    """
+    
+    _instance: Optional['SpatialStructureBuilder'] = None
+    
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+    
+    @cached_property
+    def nodes(self) -> Tuple[StrategicNode, ...]:
+        return _build_strategic_nodes()
+    
+    @cached_property
+    def corridors(self) -> Tuple[DevelopmentCorridor, ...]:
+        return _build_development_corridors()
+    
+    @cached_property
+    def zones(self) -> Tuple[FunctionalZone, ...]:
+        return _build_functional_zones()
+    
+    # Node lookups, indexed once instead of filtering on every query
+    
+    @cached_property
+    def _nodes_by_tier(self) -> Dict[int, Tuple[StrategicNode, ...]]:
+        return _group_by(self.nodes, attrgetter('tier'))
+    
+    @cached_property
+    def _nodes_by_region(self) -> Dict[str, Tuple[StrategicNode, ...]]:
+        return _group_by(self.nodes, attrgetter('region'))
+    
+    @cached_property
+    def _zones_by_region(self) -> Dict[str, Tuple[FunctionalZone, ...]]:
+        zones_by_region: Dict[str, List[FunctionalZone]] = {}
+        for zone in self.zones:
+            for region in zone.regions_covered:
+                zones_by_region.setdefault(region, []).append(zone)
+        return {region: tuple(zones) for region, zones in zones_by_region.items()}
+    
+    @cached_property
+    def _nodes_by_name(self) -> Dict[str, StrategicNode]:
+        by_name = {n.name: n for n in self.nodes}
+        by_name.update((alias, by_name[name]) for alias, name in NODE_ALIASES.items() if name in by_name)
+        return by_name
+    
+    @cached_property
+    def _corridor_routes(self) -> Dict[str, Tuple[StrategicNode, ...]]:
+        """Corridor name -> its known nodes from origin to destination, resolved once."""
+        return {
+            c.name: tuple(
+                self._nodes_by_name[name]
+                for name in (c.origin_node, *c.intermediate_nodes, c.destination_node)
+                if name in self._nodes_by_name
+            )
+            for c in self.corridors
+        }
+    
+    # Numeric fields as arrays in list order, for vectorized analysis
+    
+    @cached_property
+    def node_pop_2024(self) -> np.ndarray:
+        return _column(self.nodes, 'population_2024')
+    
+    @cached_property
+    def node_pop_2050(self) -> np.ndarray:
+        return _column(self.nodes, 'population_2050_target')
+    
+    @cached_property
+    def node_tier(self) -> np.ndarray:
+        return _column(self.nodes, 'tier', np.int8)
+    
+    @cached_property
+    def node_lat(self) -> np.ndarray:
+        return _column(self.nodes, 'lat')
+    
+    @cached_property
+    def node_lon(self) -> np.ndarray:
+        return _column(self.nodes, 'lon')
+    
+    # Coded fields as int8 positions in their *_LEVELS tuple (0 = highest)
+    
+    @cached_property
+    def node_priority(self) -> np.ndarray:
+        return _codes(self.nodes, 'connectivity_priority', PRIORITY_LEVELS)
+    
+    @cached_property
+    def corridor_priority(self) -> np.ndarray:
+        return _codes(self.corridors, 'priority', PRIORITY_LEVELS)
+    
+    @cached_property
+    def zone_intensity(self) -> np.ndarray:
+        return _codes(self.zones, 'development_intensity', INTENSITY_LEVELS)
+    
+    @cached_property
+    def zone_sensitivity(self) -> np.ndarray:
+        return _codes(self.zones, 'environmental_sensitivity', SENSITIVITY_LEVELS)
     
-    def get_nodes(self) -> List[StrategicNode]:
+    @cached_property
+    def corridor_length(self) -> np.ndarray:
+        return _column(self.corridors, 'length_km')
+    
+    @cached_property
+    def corridor_investment(self) -> np.ndarray:
+        return _column(self.corridors, 'investment_sar_billion')
+    
+    @cached_property
+    def zone_area(self) -> np.ndarray:
+        return _column(self.zones, 'area_km2')
+    
+    # Spatial index over the nodes, on unit vectors so tree distances
+    # (chords) order the same way as great-circle distances
+    
+    @cached_property
+    def _node_tree(self) -> Optional[Any]:
+        if cKDTree is None:
+            return None
+        return cKDTree(_unit_vectors(self.node_lat, self.node_lon))
+    
+    def get_nodes(self) -> Tuple[StrategicNode, ...]:
         return self.nodes
     
-    def get_corridors(self) -> List[DevelopmentCorridor]:
+    def get_corridors(self) -> Tuple[DevelopmentCorridor, ...]:
         return self.corridors
     
-    def get_zones(self) -> List[FunctionalZone]:
+    def get_zones(self) -> Tuple[FunctionalZone, ...]:
         return self.zones
     
-    def get_nodes_by_tier(self, tier: int) -> List[StrategicNode]:
-        return [n for n in self.nodes if n.tier == tier]
+    def get_nodes_by_tier(self, tier: int) -> Tuple[StrategicNode, ...]:
+        return self._nodes_by_tier.get(tier, ())
+    
+    def get_nodes_by_region(self, region: str) -> Tuple[StrategicNode, ...]:
+        return self._nodes_by_region.get(region, ())
+    
+    def get_zones_by_region(self, region: str) -> Tuple[FunctionalZone, ...]:
+        return self._zones_by_region.get(region, ())
+    
+    def get_node(self, name: str) -> Optional[StrategicNode]:
+        """Strategic node by name or NODE_ALIASES alias, or None if unknown."""
+        return self._nodes_by_name.get(name)
+    
+    def get_corridor_nodes(self, corridor_name: str) -> Tuple[StrategicNode, ...]:
+        """Strategic nodes along a corridor, origin first; empty if unknown."""
+        return self._corridor_routes.get(corridor_name, ())
+    
+    def nearest_nodes(self, lat: float, lon: float, k: int = 3) -> List[StrategicNode]:
+        """The k strategic nodes closest to a point, nearest first."""
+        k = min(k, len(self.nodes))
+        if self._node_tree is not None:
+            _, idx = self._node_tree.query(_unit_vectors(lat, lon), k=k)
+            idx = np.atleast_1d(idx)
+        else:
+            distances = _haversine_km(lat, lon, self.node_lat, self.node_lon)
+            idx = np.argsort(distances, kind='stable')[:k]
+        return [self.nodes[i] for i in idx]
+    
+    def nodes_within(self, lat: float, lon: float, radius_km: float) -> List[StrategicNode]:
+        """Strategic nodes within radius_km of a point, in node order."""
+        if self._node_tree is not None:
+            idx = sorted(self._node_tree.query_ball_point(_unit_vectors(lat, lon), _chord_length(radius_km)))
+        else:
+            idx = np.flatnonzero(_haversine_km(lat, lon, self.node_lat, self.node_lon) <= radius_km)
+        return [self.nodes[i] for i in idx]
+    
+    def get_corridors_by_priority(self, priority: str) -> Tuple[DevelopmentCorridor, ...]:
+        """Corridors at a PRIORITY_LEVELS priority, in corridor order."""
+        if priority not in PRIORITY_LEVELS:
+            raise ValueError(f"Unknown priority: {priority}")
+        idx = np.flatnonzero(self.corridor_priority == PRIORITY_LEVELS.index(priority))
+        return tuple(self.corridors[i] for i in idx)
+    
+    # Aggregates, reduced over the column arrays
+    
+    def total_population_2050(self) -> float:
+        """Combined 2050 population target of the strategic nodes."""
+        return float(self.node_pop_2050.sum())
+    
+    def total_corridor_investment(self) -> float:
+        """Combined corridor investment, SAR billion."""
+        return float(self.corridor_investment.sum())
+    
+    def zone_area_by_type(self) -> Dict[str, float]:
+        """Total functional zone area (km2) per zone type."""
+        types, codes = np.unique([z.zone_type for z in self.zones], return_inverse=True)
+        areas = np.bincount(codes, weights=self.zone_area, minlength=len(types))
+        return dict(zip(types.tolist(), areas.tolist()))
+    
+    def node_distance_matrix(self) -> pd.DataFrame:
+        """All-pairs great-circle distances (km) between the strategic nodes."""
+        lat, lon = self.node_lat, self.node_lon
+        distances = _haversine_km(lat[:, None], lon[:, None], lat[None, :], lon[None, :])
+        names = [n.name for n in self.nodes]
+        return pd.DataFrame(distances, index=names, columns=names)
 
 
 # =============================================================================
 # REGIONAL OBJECTIVES BUILDER
 # =============================================================================
 
+# The regional objectives are static, so they are built once per process, on
+# first use, and shared read-only by every RegionalObjectivesBuilder
+
+@lru_cache(maxsize=1)
+def _build_regional_objectives() -> Mapping[str, RegionalObjective]:
+    """Build objectives for all 13 regions."""
+    
+    objectives = {}
+    
+    objectives['Riyadh'] = RegionalObjective(
+        region="Riyadh",
+        region_ar="الرياض",
+        strategic_role="National Capital & Economic Powerhouse",
+        vision_statement="A world-class capital city that leads the nation's transformation while providing exceptional quality of life for all residents",
+        population_target_2050=15.0,
+        gdp_share_target_2050=45.0,
+        priority_sectors=["Financial Services", "Technology", "Entertainment", "Government", "Tourism"],
+        key_projects=["Riyadh Metro completion", "Diriyah Gate", "Qiddiya", "King Salman Park", "Sports Boulevard"],
+        infrastructure_priorities=["Metro expansion", "Water recycling 100%", "Green corridors", "Smart city systems"],
+        environmental_targets={"green_space_per_capita_sqm": 12, "water_recycling_pct": 100, "renewable_energy_pct": 50},
+        complementarities=["Financial center for all regions", "Entertainment destination", "Technology hub"],
+        challenges=["Water scarcity", "Urban heat island", "Traffic congestion", "Housing affordability"]
+    )
+    
+    objectives['Makkah'] = RegionalObjective(
+        region="Makkah",
+        region_ar="مكة المكرمة",
+        strategic_role="Spiritual Heart & Western Gateway",
+        vision_statement="The spiritual center of the Muslim world with a thriving commercial economy and preserved heritage",
+        population_target_2050=12.0,
+        gdp_share_target_2050=18.0,
+        priority_sectors=["Religious Tourism", "Hospitality", "Trade", "Logistics", "Healthcare"],
+        key_projects=["Haram expansion", "Jeddah Central", "Port modernization", "Metro systems"],
+        infrastructure_priorities=["Pilgrim transport", "Flood protection", "Port expansion", "Water security"],
+        environmental_targets={"green_space_per_capita_sqm": 6, "water_recycling_pct": 80, "coastal_protection_km": 200},
+        complementarities=["Religious tourism for all", "Commercial gateway", "Red Sea access"],
+        challenges=["Peak season management", "Flood risk", "Heritage preservation", "Housing density"]
+    )
+    
+    objectives['Eastern Province'] = RegionalObjective(
+        region="Eastern Province",
+        region_ar="المنطقة الشرقية",
+        strategic_role="Industrial Powerhouse & Energy Transition Leader",
+        vision_statement="Transform from oil capital to diversified industrial leader, pioneering the energy transition",
+        population_target_2050=8.0,
+        gdp_share_target_2050=22.0,
+        priority_sectors=["Petrochemicals", "Manufacturing", "Green Hydrogen", "Technology", "Tourism"],
+        key_projects=["SPARK", "Industrial diversification", "Waterfront development", "Green hydrogen"],
+        infrastructure_priorities=["Industrial infrastructure", "Port expansion", "Rail connectivity", "Renewable energy"],
+        environmental_targets={"green_space_per_capita_sqm": 10, "water_recycling_pct": 90, "renewable_energy_pct": 60},
+        complementarities=["Industrial services for nation", "Energy expertise", "Gulf connectivity"],
+        challenges=["Economic diversification", "Environmental cleanup", "Workforce transition"]
+    )
+    
+    objectives['Madinah'] = RegionalObjective(
+        region="Madinah",
+        region_ar="المدينة المنورة",
+        strategic_role="Holy City & Cultural Heritage Capital",
+        vision_statement="A sacred city that welcomes pilgrims while becoming the premier cultural tourism destination",
+        population_target_2050=3.5,
+        gdp_share_target_2050=6.0,
+        priority_sectors=["Religious Tourism", "Cultural Tourism", "Agriculture", "Industry"],
+        key_projects=["AlUla Development", "Prophet's Mosque surroundings", "Yanbu expansion"],
+        infrastructure_priorities=["Tourism infrastructure", "Water security", "Connectivity to AlUla"],
+        environmental_targets={"green_space_per_capita_sqm": 8, "heritage_sites_protected": 100, "water_recycling_pct": 75},
+        complementarities=["Religious tourism synergy with Makkah", "Cultural tourism leader", "Industrial port at Yanbu"],
+        challenges=["Water scarcity", "Heritage preservation", "Seasonal demand fluctuation"]
+    )
+    
+    objectives['Tabuk'] = RegionalObjective(
+        region="Tabuk",
+        region_ar="تبوك",
+        strategic_role="Future City & Tourism Frontier",
+        vision_statement="Home to NEOM, the world's most ambitious sustainable development, and gateway to Red Sea wonders",
+        population_target_2050=3.5,
+        gdp_share_target_2050=8.0,
+        priority_sectors=["NEOM Industries", "Tourism", "Technology", "Renewable Energy", "Sustainable Agriculture"],
+        key_projects=["NEOM (The Line, Trojena, Oxagon)", "Red Sea Project", "AMAALA"],
+        infrastructure_priorities=["NEOM infrastructure", "Airports", "Desalination", "Renewable energy"],
+        environmental_targets={"protected_area_pct": 50, "renewable_energy_pct": 100, "zero_carbon_target": 2040},
+        complementarities=["Innovation laboratory for nation", "Tourism anchor", "Sustainability model"],
+        challenges=["Execution risk", "Labor availability", "Environmental sensitivity", "Remote location"]
+    )
+    
+    objectives['Asir'] = RegionalObjective(
+        region="Asir",
+        region_ar="عسير",
+        strategic_role="Mountain Tourism & Agricultural Heritage",
+        vision_statement="Saudi Arabia's premier domestic tourism destination celebrating mountain culture and natural beauty",
+        population_target_2050=3.0,
+        gdp_share_target_2050=3.5,
+        priority_sectors=["Tourism", "Agriculture", "Handicrafts", "Healthcare"],
+        key_projects=["Asir Development", "Tourism infrastructure", "Heritage preservation"],
+        infrastructure_priorities=["Mountain roads", "Cable cars", "Airports", "Tourism facilities"],
+        environmental_targets={"protected_area_pct": 30, "forest_conservation_pct": 90, "water_harvesting_capacity_mcm": 50},
+        complementarities=["Domestic tourism escape", "Agricultural diversity", "Cultural heritage"],
+        challenges=["Accessibility", "Seasonal demand", "Infrastructure in terrain", "Brain drain"]
+    )
+    
+    objectives['Al-Qassim'] = RegionalObjective(
+        region="Al-Qassim",
+        region_ar="القصيم",
+        strategic_role="Agricultural Innovation Hub",
+        vision_statement="Transform from water-depleting agriculture to model of sustainable, high-tech food production",
+        population_target_2050=2.0,
+        gdp_share_target_2050=2.5,
+        priority_sectors=["Smart Agriculture", "Food Processing", "Logistics", "Solar Energy"],
+        key_projects=["Agricultural transformation", "Solar farms", "Food processing cluster"],
+        infrastructure_priorities=["Water efficiency", "Solar energy", "Logistics connectivity", "Agri-tech facilities"],
+        environmental_targets={"water_consumption_reduction_pct": 50, "solar_capacity_gw": 10, "groundwater_balance": "neutral"},
+        complementarities=["Food security for nation", "Agricultural expertise", "Central location"],
+        challenges=["CRITICAL water depletion", "Crop transition", "Economic diversification"]
+    )
+    
+    objectives['Hail'] = RegionalObjective(
+        region="Hail",
+        region_ar="حائل",
+        strategic_role="Agricultural & Mining Development Hub",
+        vision_statement="Leverage mining potential and agricultural heritage for sustainable regional growth",
+        population_target_2050=1.0,
+        gdp_share_target_2050=1.5,
+        priority_sectors=["Mining", "Agriculture", "Renewable Energy", "Tourism"],
+        key_projects=["Mining development", "Agricultural modernization", "Heritage tourism"],
+        infrastructure_priorities=["Mining roads", "Water efficiency", "Rail connectivity"],
+        environmental_targets={"water_efficiency_improvement_pct": 40, "mining_rehabilitation_pct": 100},
+        complementarities=["Mining corridor link", "Agricultural production", "Heritage sites"],
+        challenges=["Water scarcity", "Remote location", "Small market size"]
+    )
+    
+    objectives['Northern Borders'] = RegionalObjective(
+        region="Northern Borders",
+        region_ar="الحدود الشمالية",
+        strategic_role="Mining & Renewable Energy Frontier",
+        vision_statement="The nation's mining and clean energy powerhouse, transforming resources into sustainable prosperity",
+        population_target_2050=0.8,
+        gdp_share_target_2050=2.0,
+        priority_sectors=["Mining", "Renewable Energy", "Industrial Processing", "Border Trade"],
+        key_projects=["Waad Al-Shamal expansion", "Solar mega-farms", "Phosphate processing"],
+        infrastructure_priorities=["Mining rail", "Power grid", "Processing facilities", "Cross-border links"],
+        environmental_targets={"renewable_energy_capacity_gw": 15, "mining_rehabilitation_pct": 100},
+        complementarities=["Mineral supply for nation", "Renewable energy export", "Northern gateway"],
+        challenges=["Remote location", "Harsh climate", "Labor availability", "Infrastructure gaps"]
+    )
+    
+    objectives['Jazan'] = RegionalObjective(
+        region="Jazan",
+        region_ar="جازان",
+        strategic_role="Tropical Agriculture & Economic Diversification",
+        vision_statement="Leverage unique climate for agricultural excellence and become Red Sea industrial hub",
+        population_target_2050=2.2,
+        gdp_share_target_2050=1.8,
+        priority_sectors=["Agriculture", "Industry", "Tourism", "Fishing"],
+        key_projects=["Jazan Economic City", "Agricultural development", "Farasan tourism"],
+        infrastructure_priorities=["Economic city completion", "Port development", "Agricultural infrastructure"],
+        environmental_targets={"marine_protected_area_pct": 30, "agricultural_diversity_index": "high"},
+        complementarities=["Tropical agriculture", "Red Sea industry", "Island tourism"],
+        challenges=["Economic city completion", "Flood risk", "Border proximity"]
+    )
+    
+    objectives['Najran'] = RegionalObjective(
+        region="Najran",
+        region_ar="نجران",
+        strategic_role="Heritage Preservation & Agricultural Oasis",
+        vision_statement="Preserve unique cultural heritage while developing sustainable agriculture and tourism",
+        population_target_2050=0.75,
+        gdp_share_target_2050=0.8,
+        priority_sectors=["Heritage Tourism", "Agriculture", "Trade"],
+        key_projects=["Ukhdood site development", "Agricultural modernization", "Heritage preservation"],
+        infrastructure_priorities=["Heritage facilities", "Water management", "Connectivity"],
+        environmental_targets={"heritage_sites_preserved": 100, "water_efficiency_pct": 60},
+        complementarities=["Archaeological tourism", "Agricultural tradition", "Border trade"],
+        challenges=["Border security", "Remote location", "Small economy"]
+    )
+    
+    objectives['Al-Baha'] = RegionalObjective(
+        region="Al-Baha",
+        region_ar="الباحة",
+        strategic_role="Mountain Retreat & Heritage Village",
+        vision_statement="A preserved mountain heritage region offering unique domestic tourism experiences",
+        population_target_2050=0.6,
+        gdp_share_target_2050=0.6,
+        priority_sectors=["Tourism", "Agriculture", "Handicrafts", "Honey Production"],
+        key_projects=["Tourism development", "Heritage village preservation", "Road improvements"],
+        infrastructure_priorities=["Tourism infrastructure", "Road access", "Heritage preservation"],
+        environmental_targets={"forest_preservation_pct": 90, "heritage_villages_preserved": 50},
+        complementarities=["Asir tourism synergy", "Unique heritage", "Agricultural products"],
+        challenges=["Small size", "Terrain challenges", "Infrastructure cost"]
+    )
+    
+    objectives['Al-Jouf'] = RegionalObjective(
+        region="Al-Jouf",
+        region_ar="الجوف",
+        strategic_role="Renewable Energy Hub & Agricultural Innovation",
+        vision_statement="Become Saudi Arabia's renewable energy capital while modernizing olive and agricultural production",
+        population_target_2050=0.85,
+        gdp_share_target_2050=1.3,
+        priority_sectors=["Renewable Energy", "Agriculture", "Tourism", "Mining"],
+        key_projects=["Solar mega-farms", "Olive processing", "Heritage tourism", "Wind farms"],
+        infrastructure_priorities=["Renewable energy grid", "Water efficiency", "Tourism access"],
+        environmental_targets={"renewable_capacity_gw": 20, "water_efficiency_improvement_pct": 45},
+        complementarities=["Renewable energy for grid", "Agricultural exports", "Heritage sites"],
+        challenges=["Water scarcity", "Remote location", "Infrastructure needs"]
+    )
+    
+    logger.info("Regional Objectives: {} regions", len(objectives))
+    return MappingProxyType(objectives)
+
+
 class RegionalObjectivesBuilder:
     """
     Builds strategic objectives for each of the 13 regions.
     """
     
-    def __init__(self):
-        """Initialize regional objectives builder."""
-        self.objectives = self._build_regional_objectives()
-        logger.info(f"Regional Objectives: {len(self.objectives)} regions")
+    @cached_property
+    def objectives(self) -> Mapping[str, RegionalObjective]:
+        return _build_regional_objectives()
     
-    def _build_regional_objectives(self) -> Dict[str, RegionalObjective]:
-        """Build objectives for all 13 regions."""
-        
-        objectives = {}
-        
-        objectives['Riyadh'] = RegionalObjective(
-            region="Riyadh",
-            region_ar="الرياض",
-            strategic_role="National Capital & Economic Powerhouse",
-            vision_statement="A world-class capital city that leads the nation's transformation while providing exceptional quality of life for all residents",
-            population_target_2050=15.0,
-            gdp_share_target_2050=45.0,
-            priority_sectors=["Financial Services", "Technology", "Entertainment", "Government", "Tourism"],
-            key_projects=["Riyadh Metro completion", "Diriyah Gate", "Qiddiya", "King Salman Park", "Sports Boulevard"],
-            infrastructure_priorities=["Metro expansion", "Water recycling 100%", "Green corridors", "Smart city systems"],
-            environmental_targets={"green_space_per_capita_sqm": 12, "water_recycling_pct": 100, "renewable_energy_pct": 50},
-            complementarities=["Financial center for all regions", "Entertainment destination", "Technology hub"],
-            challenges=["Water scarcity", "Urban heat island", "Traffic congestion", "Housing affordability"]
-        )
-        
-        objectives['Makkah'] = RegionalObjective(
-            region="Makkah",
-            region_ar="مكة المكرمة",
-            strategic_role="Spiritual Heart & Western Gateway",
-            vision_statement="The spiritual center of the Muslim world with a thriving commercial economy and preserved heritage",
-            population_target_2050=12.0,
-            gdp_share_target_2050=18.0,
-            priority_sectors=["Religious Tourism", "Hospitality", "Trade", "Logistics", "Healthcare"],
-            key_projects=["Haram expansion", "Jeddah Central", "Port modernization", "Metro systems"],
-            infrastructure_priorities=["Pilgrim transport", "Flood protection", "Port expansion", "Water security"],
-            environmental_targets={"green_space_per_capita_sqm": 6, "water_recycling_pct": 80, "coastal_protection_km": 200},
-            complementarities=["Religious tourism for all", "Commercial gateway", "Red Sea access"],
-            challenges=["Peak season management", "Flood risk", "Heritage preservation", "Housing density"]
+    @cached_property
+    def environmental_targets(self) -> pd.DataFrame:
+        """Region x metric table of environmental targets; NaN where a region sets none."""
+        return pd.DataFrame.from_dict(
+            {region: dict(obj.environmental_targets) for region, obj in self.objectives.items()},
+            orient='index'
         )
-        
-        objectives['Eastern Province'] = RegionalObjective(
-            region="Eastern Province",
-            region_ar="المنطقة الشرقية",
-            strategic_role="Industrial Powerhouse & Energy Transition Leader",
-            vision_statement="Transform from oil capital to diversified industrial leader, pioneering the energy transition",
-            population_target_2050=8.0,
-            gdp_share_target_2050=22.0,
-            priority_sectors=["Petrochemicals", "Manufacturing", "Green Hydrogen", "Technology", "Tourism"],
-            key_projects=["SPARK", "Industrial diversification", "Waterfront development", "Green hydrogen"],
-            infrastructure_priorities=["Industrial infrastructure", "Port expansion", "Rail connectivity", "Renewable energy"],
-            environmental_targets={"green_space_per_capita_sqm": 10, "water_recycling_pct": 90, "renewable_energy_pct": 60},
-            complementarities=["Industrial services for nation", "Energy expertise", "Gulf connectivity"],
-            challenges=["Economic diversification", "Environmental cleanup", "Workforce transition"]
-        )
-        
-        objectives['Madinah'] = RegionalObjective(
-            region="Madinah",
-            region_ar="المدينة المنورة",
-            strategic_role="Holy City & Cultural Heritage Capital",
-            vision_statement="A sacred city that welcomes pilgrims while becoming the premier cultural tourism destination",
-            population_target_2050=3.5,
-            gdp_share_target_2050=6.0,
-            priority_sectors=["Religious Tourism", "Cultural Tourism", "Agriculture", "Industry"],
-            key_projects=["AlUla Development", "Prophet's Mosque surroundings", "Yanbu expansion"],
-            infrastructure_priorities=["Tourism infrastructure", "Water security", "Connectivity to AlUla"],
-            environmental_targets={"green_space_per_capita_sqm": 8, "heritage_sites_protected": 100, "water_recycling_pct": 75},
-            complementarities=["Religious tourism synergy with Makkah", "Cultural tourism leader", "Industrial port at Yanbu"],
-            challenges=["Water scarcity", "Heritage preservation", "Seasonal demand fluctuation"]
-        )
-        
-        objectives['Tabuk'] = RegionalObjective(
-            region="Tabuk",
-            region_ar="تبوك",
-            strategic_role="Future City & Tourism Frontier",
-            vision_statement="Home to NEOM, the world's most ambitious sustainable development, and gateway to Red Sea wonders",
-            population_target_2050=3.5,
-            gdp_share_target_2050=8.0,
-            priority_sectors=["NEOM Industries", "Tourism", "Technology", "Renewable Energy", "Sustainable Agriculture"],
-            key_projects=["NEOM (The Line, Trojena, Oxagon)", "Red Sea Project", "AMAALA"],
-            infrastructure_priorities=["NEOM infrastructure", "Airports", "Desalination", "Renewable energy"],
-            environmental_targets={"protected_area_pct": 50, "renewable_energy_pct": 100, "zero_carbon_target": 2040},
-            complementarities=["Innovation laboratory for nation", "Tourism anchor", "Sustainability model"],
-            challenges=["Execution risk", "Labor availability", "Environmental sensitivity", "Remote location"]
-        )
-        
-        objectives['Asir'] = RegionalObjective(
-            region="Asir",
-            region_ar="عسير",
-            strategic_role="Mountain Tourism & Agricultural Heritage",
-            vision_statement="Saudi Arabia's premier domestic tourism destination celebrating mountain culture and natural beauty",
-            population_target_2050=3.0,
-            gdp_share_target_2050=3.5,
-            priority_sectors=["Tourism", "Agriculture", "Handicrafts", "Healthcare"],
-            key_projects=["Asir Development", "Tourism infrastructure", "Heritage preservation"],
-            infrastructure_priorities=["Mountain roads", "Cable cars", "Airports", "Tourism facilities"],
-            environmental_targets={"protected_area_pct": 30, "forest_conservation_pct": 90, "water_harvesting_capacity_mcm": 50},
-            complementarities=["Domestic tourism escape", "Agricultural diversity", "Cultural heritage"],
-            challenges=["Accessibility", "Seasonal demand", "Infrastructure in terrain", "Brain drain"]
-        )
-        
-        objectives['Al-Qassim'] = RegionalObjective(
-            region="Al-Qassim",
-            region_ar="القصيم",
-            strategic_role="Agricultural Innovation Hub",
-            vision_statement="Transform from water-depleting agriculture to model of sustainable, high-tech food production",
-            population_target_2050=2.0,
-            gdp_share_target_2050=2.5,
-            priority_sectors=["Smart Agriculture", "Food Processing", "Logistics", "Solar Energy"],
-            key_projects=["Agricultural transformation", "Solar farms", "Food processing cluster"],
-            infrastructure_priorities=["Water efficiency", "Solar energy", "Logistics connectivity", "Agri-tech facilities"],
-            environmental_targets={"water_consumption_reduction_pct": 50, "solar_capacity_gw": 10, "groundwater_balance": "neutral"},
-            complementarities=["Food security for nation", "Agricultural expertise", "Central location"],
-            challenges=["CRITICAL water depletion", "Crop transition", "Economic diversification"]
-        )
-        
-        objectives['Hail'] = RegionalObjective(
-            region="Hail",
-            region_ar="حائل",
-            strategic_role="Agricultural & Mining Development Hub",
-            vision_statement="Leverage mining potential and agricultural heritage for sustainable regional growth",
-            population_target_2050=1.0,
-            gdp_share_target_2050=1.5,
-            priority_sectors=["Mining", "Agriculture", "Renewable Energy", "Tourism"],
-            key_projects=["Mining development", "Agricultural modernization", "Heritage tourism"],
-            infrastructure_priorities=["Mining roads", "Water efficiency", "Rail connectivity"],
-            environmental_targets={"water_efficiency_improvement_pct": 40, "mining_rehabilitation_pct": 100},
-            complementarities=["Mining corridor link", "Agricultural production", "Heritage sites"],
-            challenges=["Water scarcity", "Remote location", "Small market size"]
-        )
-        
-        objectives['Northern Borders'] = RegionalObjective(
-            region="Northern Borders",
-            region_ar="الحدود الشمالية",
-            strategic_role="Mining & Renewable Energy Frontier",
-            vision_statement="The nation's mining and clean energy powerhouse, transforming resources into sustainable prosperity",
-            population_target_2050=0.8,
-            gdp_share_target_2050=2.0,
-            priority_sectors=["Mining", "Renewable Energy", "Industrial Processing", "Border Trade"],
-            key_projects=["Waad Al-Shamal expansion", "Solar mega-farms", "Phosphate processing"],
-            infrastructure_priorities=["Mining rail", "Power grid", "Processing facilities", "Cross-border links"],
-            environmental_targets={"renewable_energy_capacity_gw": 15, "mining_rehabilitation_pct": 100},
-            complementarities=["Mineral supply for nation", "Renewable energy export", "Northern gateway"],
-            challenges=["Remote location", "Harsh climate", "Labor availability", "Infrastructure gaps"]
-        )
-        
-        objectives['Jazan'] = RegionalObjective(
-            region="Jazan",
-            region_ar="جازان",
-            strategic_role="Tropical Agriculture & Economic Diversification",
-            vision_statement="Leverage unique climate for agricultural excellence and become Red Sea industrial hub",
-            population_target_2050=2.2,
-            gdp_share_target_2050=1.8,
-            priority_sectors=["Agriculture", "Industry", "Tourism", "Fishing"],
-            key_projects=["Jazan Economic City", "Agricultural development", "Farasan tourism"],
-            infrastructure_priorities=["Economic city completion", "Port development", "Agricultural infrastructure"],
-            environmental_targets={"marine_protected_area_pct": 30, "agricultural_diversity_index": "high"},
-            complementarities=["Tropical agriculture", "Red Sea industry", "Island tourism"],
-            challenges=["Economic city completion", "Flood risk", "Border proximity"]
-        )
-        
-        objectives['Najran'] = RegionalObjective(
-            region="Najran",
-            region_ar="نجران",
-            strategic_role="Heritage Preservation & Agricultural Oasis",
-            vision_statement="Preserve unique cultural heritage while developing sustainable agriculture and tourism",
-            population_target_2050=0.75,
-            gdp_share_target_2050=0.8,
-            priority_sectors=["Heritage Tourism", "Agriculture", "Trade"],
-            key_projects=["Ukhdood site development", "Agricultural modernization", "Heritage preservation"],
-            infrastructure_priorities=["Heritage facilities", "Water management", "Connectivity"],
-            environmental_targets={"heritage_sites_preserved": 100, "water_efficiency_pct": 60},
-            complementarities=["Archaeological tourism", "Agricultural tradition", "Border trade"],
-            challenges=["Border security", "Remote location", "Small economy"]
-        )
-        
-        objectives['Al-Baha'] = RegionalObjective(
-            region="Al-Baha",
-            region_ar="الباحة",
-            strategic_role="Mountain Retreat & Heritage Village",
-            vision_statement="A preserved mountain heritage region offering unique domestic tourism experiences",
-            population_target_2050=0.6,
-            gdp_share_target_2050=0.6,
-            priority_sectors=["Tourism", "Agriculture", "Handicrafts", "Honey Production"],
-            key_projects=["Tourism development", "Heritage village preservation", "Road improvements"],
-            infrastructure_priorities=["Tourism infrastructure", "Road access", "Heritage preservation"],
-            environmental_targets={"forest_preservation_pct": 90, "heritage_villages_preserved": 50},
-            complementarities=["Asir tourism synergy", "Unique heritage", "Agricultural products"],
-            challenges=["Small size", "Terrain challenges", "Infrastructure cost"]
-        )
-        
-        objectives['Al-Jouf'] = RegionalObjective(
-            region="Al-Jouf",
-            region_ar="الجوف",
-            strategic_role="Renewable Energy Hub & Agricultural Innovation",
-            vision_statement="Become Saudi Arabia's renewable energy capital while modernizing olive and agricultural production",
-            population_target_2050=0.85,
-            gdp_share_target_2050=1.3,
-            priority_sectors=["Renewable Energy", "Agriculture", "Tourism", "Mining"],
-            key_projects=["Solar mega-farms", "Olive processing", "Heritage tourism", "Wind farms"],
-            infrastructure_priorities=["Renewable energy grid", "Water efficiency", "Tourism access"],
-            environmental_targets={"renewable_capacity_gw": 20, "water_efficiency_improvement_pct": 45},
-            complementarities=["Renewable energy for grid", "Agricultural exports", "Heritage sites"],
-            challenges=["Water scarcity", "Remote location", "Infrastructure needs"]
-        )
-        
-        return objectives
     
-    def get_objectives(self) -> Dict[str, RegionalObjective]:
+    def get_objectives(self) -> Mapping[str, RegionalObjective]:
         return self.objectives
     
     def get_region(self, region: str) -> Optional[RegionalObjective]:
@@ -1088,191 +1551,224 @@ class RegionalObjectivesBuilder:
 # INVESTMENT PRIORITIES BUILDER
 # =============================================================================
 
+# Likewise built once per process and shared, as a tuple, by every
+# InvestmentPrioritiesBuilder
+
+@lru_cache(maxsize=1)
+def _build_investment_priorities() -> Tuple[InvestmentPriority, ...]:
+    """Build prioritized investment list."""
+    
+    priorities = [
+        # CRITICAL INFRASTRUCTURE
+        InvestmentPriority(
+            priority_id="IP-001",
+            title="National Water Security Program",
+            category="infrastructure",
+            description="Massive expansion of desalination, 100% wastewater reuse, agricultural water efficiency",
+            estimated_cost_sar_billion=150,
+            timeline="2025-2035",
+            regions_benefited=ALL_REGIONS,
+            expected_outcomes=["40% reduction in water consumption", "Eliminate groundwater overdraft", "100% reuse"],
+            funding_sources=["Government budget", "PIF", "PPP for desalination"],
+            implementation_agency="Ministry of Environment, Water and Agriculture"
+        ),
+        InvestmentPriority(
+            priority_id="IP-002",
+            title="National Rail Network Completion",
+            category="infrastructure",
+            description="Complete freight and passenger rail connecting all major cities",
+            estimated_cost_sar_billion=200,
+            timeline="2025-2040",
+            regions_benefited=ALL_REGIONS,
+            expected_outcomes=["5,500 km rail network", "All tier-1 cities connected", "50% freight shift to rail"],
+            funding_sources=["Government budget", "PIF", "PPP"],
+            implementation_agency="Saudi Railway Company"
+        ),
+        InvestmentPriority(
+            priority_id="IP-003",
+            title="Renewable Energy Mega-Program",
+            category="infrastructure",
+            description="Achieve 100GW renewable capacity with grid integration",
+            estimated_cost_sar_billion=180,
+            timeline="2025-2040",
+            regions_benefited=["Tabuk", "Northern Borders", "Al-Jouf", "Hail"],
+            expected_outcomes=["100GW capacity", "50% domestic energy from renewables", "Green hydrogen export"],
+            funding_sources=["PIF", "Private sector", "International investment"],
+            implementation_agency="Ministry of Energy"
+        ),
+        
+        # TRANSFORMATIONAL PROJECTS
+        InvestmentPriority(
+            priority_id="IP-004",
+            title="NEOM Phase 1 Completion",
+            category="economic",
+            description="Complete The Line, Trojena, Oxagon, and Sindalah by 2035",
+            estimated_cost_sar_billion=500,
+            timeline="2025-2035",
+            regions_benefited=["Tabuk"],
+            expected_outcomes=["1M residents in The Line", "Trojena ski resort operational", "Oxagon port operational"],
+            funding_sources=["PIF"],
+            implementation_agency="NEOM Company"
+        ),
+        InvestmentPriority(
+            priority_id="IP-005",
+            title="Red Sea & AMAALA Tourism",
+            category="economic",
+            description="Complete luxury tourism destinations on Red Sea coast",
+            estimated_cost_sar_billion=75,
+            timeline="2025-2035",
+            regions_benefited=["Tabuk", "Madinah"],
+            expected_outcomes=["50 resorts", "30,000 hotel rooms", "8,000 jobs"],
+            funding_sources=["PIF", "Private investors"],
+            implementation_agency="Red Sea Global"
+        ),
+        InvestmentPriority(
+            priority_id="IP-006",
+            title="AlUla Heritage Development",
+            category="economic",
+            description="World-class heritage tourism destination development",
+            estimated_cost_sar_billion=35,
+            timeline="2025-2035",
+            regions_benefited=["Madinah"],
+            expected_outcomes=["UNESCO site protection", "2M annual visitors", "Sustainable tourism model"],
+            funding_sources=["PIF", "Royal Commission for AlUla"],
+            implementation_agency="Royal Commission for AlUla"
+        ),
+        
+        # REGIONAL DEVELOPMENT
+        InvestmentPriority(
+            priority_id="IP-007",
+            title="Agricultural Transformation Program",
+            category="economic",
+            description="Transform water-intensive agriculture to sustainable, high-tech production",
+            estimated_cost_sar_billion=45,
+            timeline="2025-2035",
+            regions_benefited=["Al-Qassim", "Hail", "Al-Jouf", "Riyadh"],
+            expected_outcomes=["50% water reduction", "Crop transition complete", "Agri-tech leadership"],
+            funding_sources=["Government subsidies", "Environment Fund", "Private sector"],
+            implementation_agency="Ministry of Environment, Water and Agriculture"
+        ),
+        InvestmentPriority(
+            priority_id="IP-008",
+            title="Mining Sector Development",
+            category="economic",
+            description="Develop mining sector to SAR 240B contribution",
+            estimated_cost_sar_billion=60,
+            timeline="2025-2040",
+            regions_benefited=["Northern Borders", "Madinah", "Hail", "Tabuk"],
+            expected_outcomes=["3% GDP contribution", "90,000 jobs", "Downstream processing"],
+            funding_sources=["Private investment", "Ma'aden", "PIF"],
+            implementation_agency="Ministry of Industry and Mineral Resources"
+        ),
+        InvestmentPriority(
+            priority_id="IP-009",
+            title="Asir Tourism Development",
+            category="economic",
+            description="Develop Asir as premier domestic tourism destination",
+            estimated_cost_sar_billion=25,
+            timeline="2025-2035",
+            regions_benefited=["Asir", "Al-Baha"],
+            expected_outcomes=["5M annual visitors", "Heritage preservation", "Mountain resorts"],
+            funding_sources=["Government budget", "Private sector"],
+            implementation_agency="Ministry of Tourism"
+        ),
+        
+        # SOCIAL INFRASTRUCTURE
+        InvestmentPriority(
+            priority_id="IP-010",
+            title="National Housing Program",
+            category="social",
+            description="Achieve 70% Saudi home ownership through affordable housing",
+            estimated_cost_sar_billion=100,
+            timeline="2025-2035",
+            regions_benefited=ALL_REGIONS,
+            expected_outcomes=["70% ownership", "500,000 affordable units", "TOD communities"],
+            funding_sources=["Real Estate Development Fund", "PIF", "Private sector"],
+            implementation_agency="Ministry of Housing"
+        ),
+        InvestmentPriority(
+            priority_id="IP-011",
+            title="Urban Green Infrastructure",
+            category="environmental",
+            description="Achieve 9 sqm green space per capita in all cities",
+            estimated_cost_sar_billion=40,
+            timeline="2025-2040",
+            regions_benefited=ALL_REGIONS,
+            expected_outcomes=["9 sqm per capita", "Urban forests", "Heat island reduction"],
+            funding_sources=["Municipal budgets", "Green Fund"],
+            implementation_agency="Ministry of Municipal and Rural Affairs"
+        ),
+        InvestmentPriority(
+            priority_id="IP-012",
+            title="Protected Areas Expansion",
+            category="environmental",
+            description="Expand protected areas to 30% of land and sea by 2030",
+            estimated_cost_sar_billion=15,
+            timeline="2025-2030",
+            regions_benefited=ALL_REGIONS,
+            expected_outcomes=["30% land protected", "30% sea protected", "Wildlife corridors"],
+            funding_sources=["Government budget", "International funds"],
+            implementation_agency="National Center for Wildlife"
+        )
+    ]
+    
+    logger.info("Investment Priorities: {} items", len(priorities))
+    return tuple(priorities)
+
+
 class InvestmentPrioritiesBuilder:
     """
     Builds investment priorities and sequencing.
     """
     
-    def __init__(self):
-        """Initialize investment priorities builder."""
-        self.priorities = self._build_investment_priorities()
-        logger.info(f"Investment Priorities: {len(self.priorities)} items")
+    @cached_property
+    def priorities(self) -> Tuple[InvestmentPriority, ...]:
+        return _build_investment_priorities()
     
-    def _build_investment_priorities(self) -> List[InvestmentPriority]:
-        """Build prioritized investment list."""
-        
-        priorities = [
-            # CRITICAL INFRASTRUCTURE
-            InvestmentPriority(
-                priority_id="IP-001",
-                title="National Water Security Program",
-                category="infrastructure",
-                description="Massive expansion of desalination, 100% wastewater reuse, agricultural water efficiency",
-                estimated_cost_sar_billion=150,
-                timeline="2025-2035",
-                regions_benefited=["All regions"],
-                expected_outcomes=["40% reduction in water consumption", "Eliminate groundwater overdraft", "100% reuse"],
-                funding_sources=["Government budget", "PIF", "PPP for desalination"],
-                implementation_agency="Ministry of Environment, Water and Agriculture"
-            ),
-            InvestmentPriority(
-                priority_id="IP-002",
-                title="National Rail Network Completion",
-                category="infrastructure",
-                description="Complete freight and passenger rail connecting all major cities",
-                estimated_cost_sar_billion=200,
-                timeline="2025-2040",
-                regions_benefited=["All regions"],
-                expected_outcomes=["5,500 km rail network", "All tier-1 cities connected", "50% freight shift to rail"],
-                funding_sources=["Government budget", "PIF", "PPP"],
-                implementation_agency="Saudi Railway Company"
-            ),
-            InvestmentPriority(
-                priority_id="IP-003",
-                title="Renewable Energy Mega-Program",
-                category="infrastructure",
-                description="Achieve 100GW renewable capacity with grid integration",
-                estimated_cost_sar_billion=180,
-                timeline="2025-2040",
-                regions_benefited=["Tabuk", "Northern Borders", "Al-Jouf", "Hail"],
-                expected_outcomes=["100GW capacity", "50% domestic energy from renewables", "Green hydrogen export"],
-                funding_sources=["PIF", "Private sector", "International investment"],
-                implementation_agency="Ministry of Energy"
-            ),
-            
-            # TRANSFORMATIONAL PROJECTS
-            InvestmentPriority(
-                priority_id="IP-004",
-                title="NEOM Phase 1 Completion",
-                category="economic",
-                description="Complete The Line, Trojena, Oxagon, and Sindalah by 2035",
-                estimated_cost_sar_billion=500,
-                timeline="2025-2035",
-                regions_benefited=["Tabuk"],
-                expected_outcomes=["1M residents in The Line", "Trojena ski resort operational", "Oxagon port operational"],
-                funding_sources=["PIF"],
-                implementation_agency="NEOM Company"
-            ),
-            InvestmentPriority(
-                priority_id="IP-005",
-                title="Red Sea & AMAALA Tourism",
-                category="economic",
-                description="Complete luxury tourism destinations on Red Sea coast",
-                estimated_cost_sar_billion=75,
-                timeline="2025-2035",
-                regions_benefited=["Tabuk", "Madinah"],
-                expected_outcomes=["50 resorts", "30,000 hotel rooms", "8,000 jobs"],
-                funding_sources=["PIF", "Private investors"],
-                implementation_agency="Red Sea Global"
-            ),
-            InvestmentPriority(
-                priority_id="IP-006",
-                title="AlUla Heritage Development",
-                category="economic",
-                description="World-class heritage tourism destination development",
-                estimated_cost_sar_billion=35,
-                timeline="2025-2035",
-                regions_benefited=["Madinah"],
-                expected_outcomes=["UNESCO site protection", "2M annual visitors", "Sustainable tourism model"],
-                funding_sources=["PIF", "Royal Commission for AlUla"],
-                implementation_agency="Royal Commission for AlUla"
-            ),
-            
-            # REGIONAL DEVELOPMENT
-            InvestmentPriority(
-                priority_id="IP-007",
-                title="Agricultural Transformation Program",
-                category="economic",
-                description="Transform water-intensive agriculture to sustainable, high-tech production",
-                estimated_cost_sar_billion=45,
-                timeline="2025-2035",
-                regions_benefited=["Al-Qassim", "Hail", "Al-Jouf", "Riyadh"],
-                expected_outcomes=["50% water reduction", "Crop transition complete", "Agri-tech leadership"],
-                funding_sources=["Government subsidies", "Environment Fund", "Private sector"],
-                implementation_agency="Ministry of Environment, Water and Agriculture"
-            ),
-            InvestmentPriority(
-                priority_id="IP-008",
-                title="Mining Sector Development",
-                category="economic",
-                description="Develop mining sector to SAR 240B contribution",
-                estimated_cost_sar_billion=60,
-                timeline="2025-2040",
-                regions_benefited=["Northern Borders", "Madinah", "Hail", "Tabuk"],
-                expected_outcomes=["3% GDP contribution", "90,000 jobs", "Downstream processing"],
-                funding_sources=["Private investment", "Ma'aden", "PIF"],
-                implementation_agency="Ministry of Industry and Mineral Resources"
-            ),
-            InvestmentPriority(
-                priority_id="IP-009",
-                title="Asir Tourism Development",
-                category="economic",
-                description="Develop Asir as premier domestic tourism destination",
-                estimated_cost_sar_billion=25,
-                timeline="2025-2035",
-                regions_benefited=["Asir", "Al-Baha"],
-                expected_outcomes=["5M annual visitors", "Heritage preservation", "Mountain resorts"],
-                funding_sources=["Government budget", "Private sector"],
-                implementation_agency="Ministry of Tourism"
-            ),
-            
-            # SOCIAL INFRASTRUCTURE
-            InvestmentPriority(
-                priority_id="IP-010",
-                title="National Housing Program",
-                category="social",
-                description="Achieve 70% Saudi home ownership through affordable housing",
-                estimated_cost_sar_billion=100,
-                timeline="2025-2035",
-                regions_benefited=["All regions"],
-                expected_outcomes=["70% ownership", "500,000 affordable units", "TOD communities"],
-                funding_sources=["Real Estate Development Fund", "PIF", "Private sector"],
-                implementation_agency="Ministry of Housing"
-            ),
-            InvestmentPriority(
-                priority_id="IP-011",
-                title="Urban Green Infrastructure",
-                category="environmental",
-                description="Achieve 9 sqm green space per capita in all cities",
-                estimated_cost_sar_billion=40,
-                timeline="2025-2040",
-                regions_benefited=["All regions"],
-                expected_outcomes=["9 sqm per capita", "Urban forests", "Heat island reduction"],
-                funding_sources=["Municipal budgets", "Green Fund"],
-                implementation_agency="Ministry of Municipal and Rural Affairs"
-            ),
-            InvestmentPriority(
-                priority_id="IP-012",
-                title="Protected Areas Expansion",
-                category="environmental",
-                description="Expand protected areas to 30% of land and sea by 2030",
-                estimated_cost_sar_billion=15,
-                timeline="2025-2030",
-                regions_benefited=["All regions"],
-                expected_outcomes=["30% land protected", "30% sea protected", "Wildlife corridors"],
-                funding_sources=["Government budget", "International funds"],
-                implementation_agency="National Center for Wildlife"
-            )
-        ]
-        
-        return priorities
+    @cached_property
+    def _by_category(self) -> Dict[str, Tuple[InvestmentPriority, ...]]:
+        return _group_by(self.priorities, attrgetter('category'))
+    
+    @cached_property
+    def _by_region(self) -> Dict[str, Tuple[InvestmentPriority, ...]]:
+        """Region -> priorities benefiting it, with nationwide ones listed under every region."""
+        all_regions = tuple(_build_regional_objectives())
+        by_region: Dict[str, List[InvestmentPriority]] = {}
+        for p in self.priorities:
+            regions = all_regions if p.regions_benefited == ALL_REGIONS else p.regions_benefited
+            for region in regions:
+                by_region.setdefault(region, []).append(p)
+        return {region: tuple(priorities) for region, priorities in by_region.items()}
+    
+    # Cost and category as arrays in list order, for vectorized totals
     
-    def get_priorities(self) -> List[InvestmentPriority]:
+    @cached_property
+    def cost(self) -> np.ndarray:
+        # dtype follows the data, so whole-billion costs total to whole numbers
+        return np.array([p.estimated_cost_sar_billion for p in self.priorities])
+    
+    @cached_property
+    def category_code(self) -> np.ndarray:
+        return _codes(self.priorities, 'category', INVESTMENT_CATEGORIES)
+    
+    def get_priorities(self) -> Tuple[InvestmentPriority, ...]:
         return self.priorities
     
-    def get_by_category(self, category: str) -> List[InvestmentPriority]:
-        return [p for p in self.priorities if p.category == category]
+    def get_by_category(self, category: str) -> Tuple[InvestmentPriority, ...]:
+        return self._by_category.get(category, ())
+    
+    def get_by_region(self, region: str) -> Tuple[InvestmentPriority, ...]:
+        """Priorities benefiting a region, nationwide ones included, in priority order."""
+        return self._by_region.get(region, ())
     
     def calculate_total_investment(self) -> Dict[str, Any]:
         """Calculate total investment by category."""
-        total = sum(p.estimated_cost_sar_billion for p in self.priorities)
-        by_category = {}
-        for p in self.priorities:
-            by_category[p.category] = by_category.get(p.category, 0) + p.estimated_cost_sar_billion
+        by_category = np.zeros(len(INVESTMENT_CATEGORIES), dtype=self.cost.dtype)
+        np.add.at(by_category, self.category_code, self.cost)
         
         return {
-            "total_sar_billion": total,
-            "by_category": by_category,
+            "total_sar_billion": self.cost.sum().item(),
+            "by_category": dict(zip(INVESTMENT_CATEGORIES, by_category.tolist())),
             "priority_count": len(self.priorities)
         }
 
@@ -1309,7 +1805,7 @@ class StakeholderMaterialsGenerator:
                 },
                 {
                     "title": "Strategic Objectives",
-                    "content": [obj["objective"] for obj in self.vision.strategic_objectives]
+                    "content": [obj.objective for obj in self.vision.strategic_objectives]
                 },
                 {
                     "title": "Spatial Structure",
@@ -1487,8 +1983,8 @@ class WS6ReportGenerator:
             'Pop_2050_M': n.population_2050_target,
             'Functions': ', '.join(n.primary_functions[:3]),
             'Priority': n.connectivity_priority,
-            'Lat': CITY_COORDS.get(n.name, (24.5, 45.0))[0],
-            'Lon': CITY_COORDS.get(n.name, (24.5, 45.0))[1]
+            'Lat': n.lat,
+            'Lon': n.lon
         } for n in nodes])
         nodes_df.to_csv(self.output_dir / "strategic_nodes.csv", index=False)
         
@@ -1501,10 +1997,10 @@ class WS6ReportGenerator:
             'Investment_SAR_B': c.investment_sar_billion,
             'Priority': c.priority,
             'Timeline': c.timeline,
-            'Start_Lat': CORRIDOR_COORDS.get(c.name, ((24.5, 45.0), (25.0, 46.0)))[0][0],
-            'Start_Lon': CORRIDOR_COORDS.get(c.name, ((24.5, 45.0), (25.0, 46.0)))[0][1],
-            'End_Lat': CORRIDOR_COORDS.get(c.name, ((24.5, 45.0), (25.0, 46.0)))[1][0],
-            'End_Lon': CORRIDOR_COORDS.get(c.name, ((24.5, 45.0), (25.0, 46.0)))[1][1]
+            'Start_Lat': c.start_lat,
+            'Start_Lon': c.start_lon,
+            'End_Lat': c.end_lat,
+            'End_Lon': c.end_lon
         } for c in corridors])
         corridors_df.to_csv(self.output_dir / "development_corridors.csv", index=False)
         
@@ -1557,8 +2053,8 @@ class WS6ReportGenerator:
                 "vision_statement": vision.vision_statement,
                 "vision_statement_ar": vision.vision_statement_ar,
                 "time_horizon": vision.time_horizon,
-                "guiding_principles": vision.guiding_principles,
-                "strategic_objectives": vision.strategic_objectives,
+                "guiding_principles": [asdict(p) for p in vision.guiding_principles],
+                "strategic_objectives": [asdict(o) for o in vision.strategic_objectives],
                 "vision2030_alignment": vision.alignment_with_vision2030
             },
             "section_2_spatial_structure": {
@@ -1613,10 +2109,6 @@ class WS6ReportGenerator:
         return report
     
     def _node_to_dict(self, node: StrategicNode) -> Dict:
-        # Get coordinates from lookup or use node's own coords
-        coords = CITY_COORDS.get(node.name, (node.lat, node.lon))
-        lat, lon = coords if coords != (0.0, 0.0) else (24.0, 45.0)  # Default to center of KSA
-        
         return {
             "name": node.name,
             "name_ar": node.name_ar,
@@ -1629,20 +2121,11 @@ class WS6ReportGenerator:
             "investments": node.key_investments,
             "connectivity": node.connectivity_priority,
             "giga_projects": node.giga_projects,
-            "lat": lat,
-            "lon": lon
+            "lat": node.lat,
+            "lon": node.lon
         }
     
     def _corridor_to_dict(self, corridor: DevelopmentCorridor) -> Dict:
-        # Get coordinates from lookup or use corridor's own coords
-        coords = CORRIDOR_COORDS.get(corridor.name, None)
-        if coords:
-            start_lat, start_lon = coords[0]
-            end_lat, end_lon = coords[1]
-        else:
-            start_lat, start_lon = corridor.start_lat, corridor.start_lon
-            end_lat, end_lon = corridor.end_lat, corridor.end_lon
-        
         return {
             "name": corridor.name,
             "name_ar": corridor.name_ar,
@@ -1656,10 +2139,10 @@ class WS6ReportGenerator:
             "investment_sar_b": corridor.investment_sar_billion,
             "priority": corridor.priority,
             "timeline": corridor.timeline,
-            "start_lat": start_lat,
-            "start_lon": start_lon,
-            "end_lat": end_lat,
-            "end_lon": end_lon
+            "start_lat": corridor.start_lat,
+            "start_lon": corridor.start_lon,
+            "end_lat": corridor.end_lat,
+            "end_lon": corridor.end_lon
         }
     
     def _zone_to_dict(self, zone: FunctionalZone) -> Dict:
@@ -1686,7 +2169,7 @@ class WS6ReportGenerator:
             "priority_sectors": obj.priority_sectors,
             "key_projects": obj.key_projects,
             "infrastructure": obj.infrastructure_priorities,
-            "environmental_targets": obj.environmental_targets,
+            "environmental_targets": dict(obj.environmental_targets),
             "complementarities": obj.complementarities,
             "challenges": obj.challenges
         }
@@ -0,0 +1,12 @@
+"""
+NSS X - Test configuration
+Makes the src package importable when pytest runs from any directory.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger
+
+logger.remove()
@@ -0,0 +1,79 @@
+"""
+NSS X - WS5 Scenario Modeling tests
+Projections must reproduce the values of the original scalar implementation.
+"""
+
+import json
+from dataclasses import asdict
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.analysis.ws5_scenarios import PROJECTION_COLUMNS, ScenarioModeler, ScenarioType
+
+# Paths and comparison tables produced by the per-scenario loops before the
+# projections were vectorized
+DATA_DIR = Path(__file__).parent / "data"
+BASELINE_PATHS = json.loads((DATA_DIR / "ws5_baseline_paths.json").read_text())
+PATHS = ('demographic_path', 'economic_path', 'spatial_path')
+
+
+@pytest.fixture(scope="module")
+def modeler() -> ScenarioModeler:
+    return ScenarioModeler()
+
+
+def _baseline_cube() -> np.ndarray:
+    """Baseline paths as a (scenarios, years, PROJECTION_COLUMNS) array."""
+    return np.array([
+        [
+            [{**demo, **econ, **spatial}[name] for name in PROJECTION_COLUMNS]
+            for demo, econ, spatial in zip(*(paths[p] for p in PATHS))
+        ]
+        for paths in BASELINE_PATHS.values()
+    ])
+
+
+@pytest.mark.parametrize("scenario_type", list(ScenarioType))
+def test_scenario_paths_match_baseline(modeler, scenario_type):
+    scenario = modeler.get_scenario(scenario_type)
+    for path in PATHS:
+        # Compared as JSON so ints and floats must match too (92 vs 92.0)
+        assert (json.dumps([asdict(p) for p in getattr(scenario, path)])
+                == json.dumps(BASELINE_PATHS[scenario_type.value][path]))
+
+
+@pytest.mark.parametrize("year", [2030, 2050])
+def test_comparison_matches_baseline_csv(modeler, year):
+    expected = (DATA_DIR / f"scenario_comparison_{year}.csv").read_text()
+    assert modeler.compare_scenarios(year).to_csv(index=False, lineterminator='\n') == expected
+
+
+def test_sweep_matches_baseline(modeler):
+    cube = modeler.sweep(list(ScenarioModeler.SCENARIO_PARAMS.values()))
+    np.testing.assert_array_equal(cube, _baseline_cube())
+
+
+def test_scenarios_cannot_be_replaced(modeler):
+    with pytest.raises(TypeError):
+        modeler.scenarios[ScenarioType.BASELINE] = modeler.get_scenario(ScenarioType.VISION2030)
+    assert list(modeler.scenarios) == list(ScenarioModeler.SCENARIO_PARAMS)
+
+
+def test_scenario_report_is_a_copy(modeler):
+    report = modeler.generate_scenario_report()
+    expected = json.dumps(report, sort_keys=True)
+    report["scenario_summaries"].clear()
+    report["comparison_2030"][0]["Scenario"] = "changed"
+    report["title"] = "changed"
+    assert json.dumps(modeler.generate_scenario_report(), sort_keys=True) == expected
+
+
+def test_scenario_reports_do_not_share_the_skeleton():
+    report = ScenarioModeler()._build_scenario_report('records')
+    report["recommendations"]["planning"].append("changed")
+    report["data_sources"].clear()
+    fresh = ScenarioModeler().generate_scenario_report()
+    assert "changed" not in fresh["recommendations"]["planning"]
+    assert fresh["data_sources"]
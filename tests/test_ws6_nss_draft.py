@@ -0,0 +1,36 @@
+"""
+NSS X - WS6 NSS Draft tests
+Builders share their static records, so callers must not be able to change them.
+"""
+
+import pytest
+
+from src.analysis.ws6_nss_draft import InvestmentPrioritiesBuilder, NSSVisionBuilder, RegionalObjectivesBuilder
+
+
+def test_priorities_cannot_be_mutated():
+    priorities = InvestmentPrioritiesBuilder().get_priorities()
+    with pytest.raises(AttributeError):
+        priorities.pop()
+
+    builder = InvestmentPrioritiesBuilder()
+    assert len(builder.get_priorities()) == 12
+    assert builder.calculate_total_investment()['priority_count'] == 12
+
+
+def test_objectives_cannot_be_mutated():
+    objectives = RegionalObjectivesBuilder().get_objectives()
+    with pytest.raises(AttributeError):
+        objectives.pop('Riyadh')
+    with pytest.raises(TypeError):
+        objectives['Riyadh'] = None
+    with pytest.raises(TypeError):
+        objectives['Riyadh'].environmental_targets['water_recycling_pct'] = 0
+
+    builder = RegionalObjectivesBuilder()
+    assert len(builder.get_objectives()) == 13
+    assert builder.get_region('Riyadh').region == 'Riyadh'
+
+
+def test_vision_builders_share_the_vision():
+    assert NSSVisionBuilder().get_vision() is NSSVisionBuilder().get_vision()